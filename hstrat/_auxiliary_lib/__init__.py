@@ -12,6 +12,7 @@ from ._is_nondecreasing import is_nondecreasing
 from ._is_nonincreasing import is_nonincreasing
 from ._launder_impl_modules import launder_impl_modules
 from ._memoize_generator import memoize_generator
+from ._min_uint_dtype_for_bit_width import min_uint_dtype_for_bit_width
 from ._pairwise import pairwise
 from ._scale_luminosity import scale_luminosity
 
@@ -29,6 +30,7 @@ __all__ = [
     "is_nonincreasing",
     "launder_impl_modules",
     "memoize_generator",
+    "min_uint_dtype_for_bit_width",
     "pairwise",
     "RecursionLimit",
     "scale_luminosity",
@@ -0,0 +1,12 @@
+import numpy as np
+
+
+def min_uint_dtype_for_bit_width(bit_width: int) -> np.dtype:
+    """Pick the narrowest unsigned integer dtype that can hold bit_width bits.
+
+    Falls back to object dtype for values wider than 64 bits.
+    """
+    for dtype in np.uint8, np.uint16, np.uint32, np.uint64:
+        if bit_width <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    return np.dtype(object)
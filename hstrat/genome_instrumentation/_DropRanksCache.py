@@ -0,0 +1,109 @@
+import typing
+
+import lru
+
+from ..stratum_retention_strategy.stratum_retention_algorithms import (
+    stochastic_algo,
+)
+from ..stratum_retention_strategy.stratum_retention_algorithms._detail import (
+    PolicyCouplerBase,
+)
+
+
+class DropRanksCache:
+    """Memoizes stratum retention policies' drop ranks across columns.
+
+    For deterministic stratum retention policies, the set of ranks dropped
+    when a stratum is deposited depends only on the policy specification and
+    the number of strata deposited so far. Columns following the same policy
+    at the same depth therefore drop exactly the same ranks, so the result
+    can be computed once and reused. Results are held in a bounded
+    least-recently-used cache.
+
+    HereditaryStratigraphicColumn consults a single instance shared by all
+    columns, accessible via HereditaryStratigraphicColumn.GetDropRanksCache.
+    Policies that are not deterministic (i.e., stochastic_algo) bypass the
+    cache.
+    """
+
+    # maps (policy spec, num stratum depositions completed) to drop ranks
+    _cache: lru.LRU
+    _num_hits: int
+    _num_misses: int
+
+    def __init__(self: "DropRanksCache", max_size: int = 4096):
+        """Initialize an empty cache.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximum number of drop rank sets to hold before evicting the
+            least recently used. Default 4096.
+        """
+        self._cache = lru.LRU(max_size)
+        self._num_hits = 0
+        self._num_misses = 0
+
+    @staticmethod
+    def _IsCacheable(policy: typing.Any) -> bool:
+        """Are the policy's drop ranks fully determined by its spec and the
+        number of strata deposited?"""
+        return isinstance(policy, PolicyCouplerBase) and not isinstance(
+            policy.GetSpec(),
+            stochastic_algo.PolicySpec,
+        )
+
+    def GenDropRanks(
+        self: "DropRanksCache",
+        policy: typing.Any,
+        num_stratum_depositions_completed: int,
+        retained_ranks: typing.Iterable[int],
+    ) -> typing.Iterable[int]:
+        """Get the ranks policy would drop, consulting the cache if possible.
+
+        Parameters mirror those of policies' GenDropRanks. On a cache hit,
+        retained_ranks is not consumed.
+        """
+        if not self._IsCacheable(policy):
+            return policy.GenDropRanks(
+                num_stratum_depositions_completed=num_stratum_depositions_completed,
+                retained_ranks=retained_ranks,
+            )
+
+        key = (policy.GetSpec(), num_stratum_depositions_completed)
+        res = self._cache.get(key)
+        if res is None:
+            self._num_misses += 1
+            res = tuple(
+                policy.GenDropRanks(
+                    num_stratum_depositions_completed=num_stratum_depositions_completed,
+                    retained_ranks=retained_ranks,
+                )
+            )
+            self._cache[key] = res
+        else:
+            self._num_hits += 1
+
+        return res
+
+    def Clear(self: "DropRanksCache") -> None:
+        """Discard all cached drop ranks and reset hit and miss counters."""
+        self._cache.clear()
+        self._num_hits = 0
+        self._num_misses = 0
+
+    def GetMaxSize(self: "DropRanksCache") -> int:
+        """How many drop rank sets can be held at most?"""
+        return self._cache.get_size()
+
+    def SetMaxSize(self: "DropRanksCache", max_size: int) -> None:
+        """Change how many drop rank sets can be held at most."""
+        self._cache.set_size(max_size)
+
+    def GetNumHits(self: "DropRanksCache") -> int:
+        """How many lookups were served from the cache?"""
+        return self._num_hits
+
+    def GetNumMisses(self: "DropRanksCache") -> int:
+        """How many cacheable lookups required computing drop ranks?"""
+        return self._num_misses
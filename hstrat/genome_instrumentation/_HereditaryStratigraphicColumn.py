@@ -1,15 +1,38 @@
+import bisect
 from copy import copy
-import math
+import struct
 import typing
 
 from interval_search import binary_search
+import numpy as np
 
 from ..stratum_retention_strategy.stratum_retention_algorithms import (
     perfect_resolution_algo,
 )
+from ._DropRanksCache import DropRanksCache
 from ._HereditaryStratum import HereditaryStratum
+from ._RetainedRanksCache import RetainedRanksCache
+from ._impl import (
+    calc_min_implausible_spurious_consecutive_differentia_collisions,
+    calc_packed_differentia_num_bytes,
+    pack_differentia,
+    parse_retention_policy,
+    stringify_retention_policy,
+    unpack_differentia,
+)
 from .stratum_ordered_stores import HereditaryStratumOrderedStoreList
 
+# binary record format used by ToBytes and FromBytes
+# header fields: magic, format version, flags, differentia bit width,
+# num strata deposited, num strata retained, and policy spec byte length
+_RECORD_HEADER = struct.Struct("<4sBBIQQI")
+_RECORD_MAGIC = b"hstc"
+_RECORD_VERSION = 1
+# flag bit set if deposition ranks are included in record
+_RECORD_FLAG_RANKS = 0b01
+# flag bit set if column's always_store_rank_in_stratum is set
+_RECORD_FLAG_ALWAYS_STORE_RANK = 0b10
+
 
 class HereditaryStratigraphicColumn:
     """Genetic annotation to enable phylogenetic inference.
@@ -47,11 +70,24 @@ class HereditaryStratigraphicColumn:
     # counter tracking the number of strata deposited
     # incremented *after* a deposition and its coinciding purge are complete
     _num_strata_deposited: int
+    # callable used to construct deposited strata
+    _stratum_factory: typing.Callable
+    # callable used to draw differentia for deposited strata, if provided
+    _stratum_differentia_source: typing.Optional[typing.Callable]
     # data structure storing retained strata
     _stratum_ordered_store: typing.Any
     # functor specifying stratum retention policy
     _stratum_retention_policy: typing.Any
 
+    # memoizes drop ranks of deterministic stratum retention policies,
+    # shared between all columns
+    _drop_ranks_cache: typing.ClassVar[DropRanksCache] = DropRanksCache()
+    # memoizes ranks calculated from column indices when deposition ranks
+    # are not stored in strata, shared between all columns
+    _retained_ranks_cache: typing.ClassVar[
+        RetainedRanksCache
+    ] = RetainedRanksCache()
+
     def __init__(
         self: "HereditaryStratigraphicColumn",
         stratum_retention_policy: typing.Any = perfect_resolution_algo.Policy(),
@@ -60,6 +96,8 @@ class HereditaryStratigraphicColumn:
         stratum_differentia_bit_width: int = 64,
         initial_stratum_annotation: typing.Optional[typing.Any] = None,
         stratum_ordered_store_factory: typing.Callable = HereditaryStratumOrderedStoreList,
+        stratum_factory: typing.Callable = HereditaryStratum,
+        stratum_differentia_source: typing.Optional[typing.Callable] = None,
     ):
         """Initialize column to track a new line of descent.
 
@@ -87,6 +125,19 @@ class HereditaryStratigraphicColumn:
             interface to store strata within the column. Can be configured for
             performance reasons, but has no semantic effect. A type that can be
             default-constructed will suffice.
+        stratum_factory : callable, optional
+            Callable to construct deposited strata, called with keyword
+            arguments annotation, deposition_rank, differentia_bit_width, and
+            differentia.
+            Can be configured for performance reasons (e.g.,
+            HereditaryStratumSlotted to reduce memory footprint), but has no
+            semantic effect. Default HereditaryStratum.
+        stratum_differentia_source : callable, optional
+            Callable that takes a differentia bit width and returns a randomly
+            drawn differentia value of that width. Can be configured for
+            performance reasons (e.g., BufferedDifferentiaSource to generate
+            differentia in batches) or to make differentia reproducible. If
+            not provided, each stratum generates its own differentia.
 
         Notes
         -----
@@ -94,14 +145,61 @@ class HereditaryStratigraphicColumn:
         policy is provided, the perfect resolution policy where all strata are
         retained is used.
         """
+        self._InitializeEmpty(
+            stratum_retention_policy=stratum_retention_policy,
+            always_store_rank_in_stratum=always_store_rank_in_stratum,
+            stratum_differentia_bit_width=stratum_differentia_bit_width,
+            stratum_ordered_store_factory=stratum_ordered_store_factory,
+            stratum_factory=stratum_factory,
+            stratum_differentia_source=stratum_differentia_source,
+        )
+
+        self.DepositStratum(annotation=initial_stratum_annotation)
+
+    def _InitializeEmpty(
+        self: "HereditaryStratigraphicColumn",
+        *,
+        stratum_retention_policy: typing.Any,
+        always_store_rank_in_stratum: bool,
+        stratum_differentia_bit_width: int,
+        stratum_ordered_store_factory: typing.Callable,
+        stratum_factory: typing.Callable,
+        stratum_differentia_source: typing.Optional[typing.Callable],
+    ) -> None:
+        """Initialize instance variables without depositing any strata.
+
+        Implementation detail. Allows columns to be reconstituted from stored
+        data (e.g., FromBytes) without generating and purging a throwaway
+        initial stratum.
+        """
         self._always_store_rank_in_stratum = always_store_rank_in_stratum
         self._stratum_differentia_bit_width = stratum_differentia_bit_width
         self._num_strata_deposited = 0
-        self._stratum_ordered_store = stratum_ordered_store_factory()
+        self._stratum_factory = stratum_factory
+        self._stratum_differentia_source = stratum_differentia_source
+        self._stratum_ordered_store = self._MakeStratumOrderedStore(
+            stratum_ordered_store_factory
+        )
 
         self._stratum_retention_policy = stratum_retention_policy
 
-        self.DepositStratum(annotation=initial_stratum_annotation)
+    def _MakeStratumOrderedStore(
+        self: "HereditaryStratigraphicColumn",
+        stratum_ordered_store_factory: typing.Callable,
+    ) -> typing.Any:
+        """Create an empty stratum ordered store for the column.
+
+        Implementation detail. Stores that size their buffers by differentia
+        bit width (i.e., HereditaryStratumOrderedStoreArray) are configured
+        with the column's bit width.
+        """
+        store = stratum_ordered_store_factory()
+        set_differentia_bit_width = getattr(
+            store, "SetDifferentiaBitWidth", None
+        )
+        if set_differentia_bit_width is not None:
+            set_differentia_bit_width(self._stratum_differentia_bit_width)
+        return store
 
     def __eq__(
         self: "HereditaryStratigraphicColumn",
@@ -152,30 +250,109 @@ class HereditaryStratigraphicColumn:
             provided to be associated with this stratum deposition in the
             line of descent.
         """
-        new_stratum = HereditaryStratum(
+        new_stratum = self._CreateStratum(
+            deposition_rank=self._num_strata_deposited,
+            annotation=annotation,
+        )
+        self._stratum_ordered_store.DepositStratum(
+            rank=self._num_strata_deposited,
+            stratum=new_stratum,
+        )
+        self._PurgeColumn()
+        self._num_strata_deposited += 1
+
+    def DepositStrata(
+        self: "HereditaryStratigraphicColumn",
+        num_strata: int,
+    ) -> None:
+        """Elapse n generations.
+
+        Equivalent to calling DepositStratum() n times without annotations.
+        If the stratum retention policy can enumerate its retained ranks
+        directly (i.e., provides IterRetainedRanks), strata that would be
+        purged before the last deposition are never created.
+
+        Parameters
+        ----------
+        num_strata: int
+            Number of generations to elapse.
+        """
+        assert num_strata >= 0
+        policy = self._stratum_retention_policy
+        if policy.IterRetainedRanks is None:
+            for __ in range(num_strata):
+                self.DepositStratum()
+            return
+        elif num_strata == 0:
+            return
+
+        num_strata_deposited = self._num_strata_deposited + num_strata
+        retained_ranks = [*policy.IterRetainedRanks(num_strata_deposited)]
+
+        # previously deposited strata can be dropped but never resurrected,
+        # so the retained ranks are those already present not yet dropped
+        # plus all ranks yet to be deposited that survive
+        first_new_idx = next(
+            (
+                idx
+                for idx, rank in enumerate(retained_ranks)
+                if rank >= self._num_strata_deposited
+            ),
+            len(retained_ranks),
+        )
+        kept_ranks = set(retained_ranks[:first_new_idx])
+        self._stratum_ordered_store.DelRanks(
+            ranks=[
+                rank
+                for rank in self.IterRetainedRanks()
+                if rank not in kept_ranks
+            ],
+            get_column_index_of_rank=self.GetColumnIndexOfRank,
+        )
+        assert self.GetNumStrataRetained() == first_new_idx
+
+        for rank in retained_ranks[first_new_idx:]:
+            self._stratum_ordered_store.DepositStratum(
+                rank=rank,
+                stratum=self._CreateStratum(deposition_rank=rank),
+            )
+        self._num_strata_deposited = num_strata_deposited
+
+    def _CreateStratum(
+        self: "HereditaryStratigraphicColumn",
+        deposition_rank: int,
+        annotation: typing.Optional[typing.Any] = None,
+    ) -> typing.Any:
+        """Construct a stratum to be deposited at rank r.
+
+        Implementation detail for DepositStratum and DepositStrata.
+        """
+        return self._stratum_factory(
             annotation=annotation,
             deposition_rank=(
                 # don't store deposition rank if we know how to calcualte it
                 # from stratum's position in column
                 None
                 if self._ShouldOmitStratumDepositionRank()
-                else self._num_strata_deposited
+                else deposition_rank
             ),
             differentia_bit_width=self._stratum_differentia_bit_width,
+            differentia=(
+                None
+                if self._stratum_differentia_source is None
+                else self._stratum_differentia_source(
+                    self._stratum_differentia_bit_width,
+                )
+            ),
         )
-        self._stratum_ordered_store.DepositStratum(
-            rank=self._num_strata_deposited,
-            stratum=new_stratum,
-        )
-        self._PurgeColumn()
-        self._num_strata_deposited += 1
 
     def _PurgeColumn(self: "HereditaryStratigraphicColumn") -> None:
         """Discard stored strata according to the configured retention policy.
 
         Implementation detail. Called after a new stratum has been appended to the column's store but before it is considered fully deposited (i.e., it is reflected in the column's internal deposition counter).
         """
-        condemned_ranks = self._stratum_retention_policy.GenDropRanks(
+        condemned_ranks = self._drop_ranks_cache.GenDropRanks(
+            self._stratum_retention_policy,
             num_stratum_depositions_completed=self.GetNumStrataDeposited(),
             retained_ranks=self.IterRetainedRanks(),
         )
@@ -184,6 +361,42 @@ class HereditaryStratigraphicColumn:
             get_column_index_of_rank=self.GetColumnIndexOfRank,
         )
 
+    @staticmethod
+    def GetDropRanksCache() -> DropRanksCache:
+        """Access the drop ranks cache shared between all columns.
+
+        Exposes hit and miss counts and allows the cache to be resized or
+        cleared.
+        """
+        return HereditaryStratigraphicColumn._drop_ranks_cache
+
+    @staticmethod
+    def GetRetainedRanksCache() -> RetainedRanksCache:
+        """Access the retained ranks cache shared between all columns.
+
+        Exposes hit and miss counts and allows the cache to be resized or
+        cleared.
+        """
+        return HereditaryStratigraphicColumn._retained_ranks_cache
+
+    def _GetCalculatedRanks(
+        self: "HereditaryStratigraphicColumn",
+    ) -> typing.Optional[typing.Sequence[int]]:
+        """Get ranks at each column index, as calculated from the retention
+        policy.
+
+        Implementation detail for columns that do not store deposition ranks
+        within strata. Returns None if the retention policy cannot enumerate
+        retained ranks.
+        """
+        if self._stratum_retention_policy.IterRetainedRanks is None:
+            return None
+        else:
+            return self._retained_ranks_cache.GetRanksAtColumnIndices(
+                self._stratum_retention_policy,
+                self.GetNumStrataDeposited(),
+            )
+
     def IterRetainedRanks(
         self: "HereditaryStratigraphicColumn",
     ) -> typing.Iterator[int]:
@@ -194,11 +407,35 @@ class HereditaryStratigraphicColumn:
         subsequent updates will not be reflected in the iterator.
         """
         if self._ShouldOmitStratumDepositionRank():
-            for idx in range(self.GetNumStrataRetained()):
-                yield self.GetRankAtColumnIndex(idx)
+            calculated_ranks = self._GetCalculatedRanks()
+            if calculated_ranks is not None:
+                yield from calculated_ranks[: self.GetNumStrataRetained()]
+            else:
+                for idx in range(self.GetNumStrataRetained()):
+                    yield self.GetRankAtColumnIndex(idx)
         else:
             yield from self._stratum_ordered_store.IterRetainedRanks()
 
+    def IterRankDifferentia(
+        self: "HereditaryStratigraphicColumn",
+        start_column_index: int = 0,
+    ) -> typing.Iterator[typing.Tuple[int, int]]:
+        """Iterate over deposition ranks and differentia of retained strata.
+
+        Values yielded as tuples. Guaranteed ordered from most ancient to most
+        recent.
+
+        Parameters
+        ----------
+        start_column_index : int, optional
+            Number of strata to skip over before yielding first result from the
+            iterator. Default 0, meaning no strata are skipped over.
+        """
+        return self._stratum_ordered_store.IterRankDifferentia(
+            get_rank_at_column_index=self.GetRankAtColumnIndex,
+            start_column_index=start_column_index,
+        )
+
     def GetNumStrataRetained(self: "HereditaryStratigraphicColumn") -> int:
         """How many strata are currently stored within the column?
 
@@ -243,6 +480,10 @@ class HereditaryStratigraphicColumn:
         most recent.
         """
         if self._ShouldOmitStratumDepositionRank():
+            calculated_ranks = self._GetCalculatedRanks()
+            if calculated_ranks is not None:
+                assert 0 <= index < len(calculated_ranks)
+                return calculated_ranks[index]
             return self._stratum_retention_policy.CalcRankAtColumnIndex(
                 index=index,
                 num_strata_deposited=self.GetNumStrataDeposited(),
@@ -263,6 +504,20 @@ class HereditaryStratigraphicColumn:
         """
         if self._ShouldOmitStratumDepositionRank():
             assert self.GetNumStrataRetained()
+            calculated_ranks = self._GetCalculatedRanks()
+            if calculated_ranks is not None:
+                num_retained = self.GetNumStrataRetained()
+                res_idx = bisect.bisect_left(
+                    calculated_ranks, rank, 0, num_retained
+                )
+                if (
+                    res_idx < num_retained
+                    and calculated_ranks[res_idx] == rank
+                ):
+                    return res_idx
+                else:
+                    return None
+
             res_idx = binary_search(
                 lambda idx: self.GetRankAtColumnIndex(idx) >= rank,
                 0,
@@ -318,12 +573,168 @@ class HereditaryStratigraphicColumn:
 
         Calculates how many differentia collisions are required to reject the
         null hypothesis that columns do not share common ancestry at those
-        ranks at significance level significance_level.
+        ranks at significance level significance_level. Results are memoized
+        across all columns.
         """
-        assert 0.0 <= significance_level <= 1.0
+        return (
+            calc_min_implausible_spurious_consecutive_differentia_collisions(
+                self._stratum_differentia_bit_width,
+                significance_level,
+            )
+        )
+
+    def ToBytes(self: "HereditaryStratigraphicColumn") -> bytes:
+        """Serialize the column into a compact binary record.
 
-        log_base = self.CalcProbabilityDifferentiaCollision()
-        return int(math.ceil(math.log(significance_level, log_base)))
+        The record consists of a fixed-size header, the stratum retention
+        policy specification, deposition ranks of retained strata, and
+        differentia of retained strata. Deposition ranks are omitted if the
+        stratum retention policy provides CalcRankAtColumnIndex. Differentia
+        narrower than a byte are bit-packed.
+
+        Stratum annotations, the stratum ordered store type, and the stratum
+        factory are not recorded.
+        """
+        policy = self._stratum_retention_policy
+        include_ranks = policy.CalcRankAtColumnIndex is None
+        policy_bytes = stringify_retention_policy(policy).encode()
+
+        ranks, differentia = zip(
+            *self._stratum_ordered_store.IterRankDifferentia(
+                get_rank_at_column_index=self.GetRankAtColumnIndex,
+            )
+        )
+        header = _RECORD_HEADER.pack(
+            _RECORD_MAGIC,
+            _RECORD_VERSION,
+            include_ranks * _RECORD_FLAG_RANKS
+            | self._always_store_rank_in_stratum
+            * _RECORD_FLAG_ALWAYS_STORE_RANK,
+            self._stratum_differentia_bit_width,
+            self.GetNumStrataDeposited(),
+            self.GetNumStrataRetained(),
+            len(policy_bytes),
+        )
+        return b"".join(
+            (
+                header,
+                policy_bytes,
+                np.asarray(ranks, dtype="<u8").tobytes()
+                if include_ranks
+                else b"",
+                pack_differentia(
+                    differentia, self._stratum_differentia_bit_width
+                ),
+            )
+        )
+
+    @classmethod
+    def FromBytes(
+        cls: typing.Type["HereditaryStratigraphicColumn"],
+        record: bytes,
+        *,
+        stratum_ordered_store_factory: typing.Callable = HereditaryStratumOrderedStoreList,
+        stratum_factory: typing.Callable = HereditaryStratum,
+    ) -> "HereditaryStratigraphicColumn":
+        """Deserialize a column from a binary record created by ToBytes.
+
+        Parameters
+        ----------
+        record : bytes-like
+            Binary record created by ToBytes.
+        stratum_ordered_store_factory : callable, optional
+            Callable to generate a container to store strata within the
+            deserialized column.
+        stratum_factory : callable, optional
+            Callable to construct deserialized strata.
+
+        Raises
+        ------
+        ValueError
+            If record is not a well-formed column record.
+        """
+        if len(record) < _RECORD_HEADER.size:
+            raise ValueError("truncated column record header")
+        (
+            magic,
+            version,
+            flags,
+            differentia_bit_width,
+            num_strata_deposited,
+            num_strata_retained,
+            policy_num_bytes,
+        ) = _RECORD_HEADER.unpack_from(record)
+        if magic != _RECORD_MAGIC or version != _RECORD_VERSION:
+            raise ValueError("unrecognized column record format")
+
+        offset = _RECORD_HEADER.size
+        policy = parse_retention_policy(
+            bytes(record[offset : offset + policy_num_bytes]).decode(),
+        )
+        offset += policy_num_bytes
+
+        expected_num_bytes = offset + calc_packed_differentia_num_bytes(
+            differentia_bit_width, num_strata_retained
+        )
+        if flags & _RECORD_FLAG_RANKS:
+            expected_num_bytes += 8 * num_strata_retained
+        if len(record) < expected_num_bytes:
+            raise ValueError("truncated column record")
+
+        if flags & _RECORD_FLAG_RANKS:
+            ranks = np.frombuffer(
+                record,
+                dtype="<u8",
+                count=num_strata_retained,
+                offset=offset,
+            ).tolist()
+            offset += 8 * num_strata_retained
+        elif policy.IterRetainedRanks is not None:
+            ranks = cls._retained_ranks_cache.GetRanksAtColumnIndices(
+                policy,
+                num_strata_deposited,
+            )[:num_strata_retained]
+        else:
+            ranks = [
+                policy.CalcRankAtColumnIndex(
+                    index=index,
+                    num_strata_deposited=num_strata_deposited,
+                )
+                for index in range(num_strata_retained)
+            ]
+
+        differentia = unpack_differentia(
+            record[offset:],
+            differentia_bit_width,
+            num_strata_retained,
+        )
+
+        # bypass __init__, which would deposit an initial stratum
+        column = cls.__new__(cls)
+        column._InitializeEmpty(
+            stratum_retention_policy=policy,
+            always_store_rank_in_stratum=bool(
+                flags & _RECORD_FLAG_ALWAYS_STORE_RANK
+            ),
+            stratum_differentia_bit_width=differentia_bit_width,
+            stratum_ordered_store_factory=stratum_ordered_store_factory,
+            stratum_factory=stratum_factory,
+            stratum_differentia_source=None,
+        )
+        store = column._stratum_ordered_store
+        omit_rank = column._ShouldOmitStratumDepositionRank()
+        for rank, differentia_ in zip(ranks, differentia):
+            store.DepositStratum(
+                rank=rank,
+                stratum=stratum_factory(
+                    annotation=None,
+                    deposition_rank=None if omit_rank else rank,
+                    differentia_bit_width=differentia_bit_width,
+                    differentia=differentia_,
+                ),
+            )
+        column._num_strata_deposited = num_strata_deposited
+        return column
 
     def Clone(
         self: "HereditaryStratigraphicColumn",
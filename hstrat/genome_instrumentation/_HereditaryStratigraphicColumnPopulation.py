@@ -0,0 +1,670 @@
+from collections import defaultdict
+import itertools as it
+import json
+import struct
+import typing
+
+import numpy as np
+
+from .._auxiliary_lib import min_uint_dtype_for_bit_width
+from ..stratum_retention_strategy.stratum_retention_algorithms import (
+    perfect_resolution_algo,
+    stochastic_algo,
+)
+from ._HereditaryStratigraphicColumn import HereditaryStratigraphicColumn
+from ._HereditaryStratigraphicColumnStripped import (
+    HereditaryStratigraphicColumnStripped,
+)
+from ._HereditaryStratum import HereditaryStratum
+from ._impl import parse_retention_policy, stringify_retention_policy
+from .stratum_ordered_stores import HereditaryStratumOrderedStoreArray
+
+# columnar file format used by ToFile and FromFile
+# preamble fields: magic, metadata byte offset, and metadata byte length
+# metadata is utf-8 encoded json, stored after all array data
+_FILE_PREAMBLE = struct.Struct("<8sQQ")
+_FILE_MAGIC = b"hstrpop\x00"
+_FILE_VERSION = 1
+# byte alignment of array data within file
+_FILE_ALIGNMENT = 64
+
+
+class _ColumnGroup:
+    """Columns sharing a stratum retention policy and deposition count.
+
+    Implementation detail for HereditaryStratigraphicColumnPopulation.
+    Because the retention policy is deterministic, all columns in the group
+    retain exactly the same ranks, so ranks are stored once and differentia
+    are stored as a matrix with one row per column.
+    """
+
+    stratum_retention_policy: typing.Any
+    num_strata_deposited: int
+    # retained deposition ranks, ascending, shared by all rows
+    ranks: np.ndarray
+    # shape (num columns, num retained strata)
+    differentia: np.ndarray
+    # ascending; row i holds differentia of column with id column_ids[i]
+    column_ids: np.ndarray
+
+    def __init__(
+        self: "_ColumnGroup",
+        stratum_retention_policy: typing.Any,
+        num_strata_deposited: int,
+        ranks: np.ndarray,
+        differentia: np.ndarray,
+        column_ids: np.ndarray,
+    ) -> None:
+        assert differentia.shape == (len(column_ids), len(ranks))
+        self.stratum_retention_policy = stratum_retention_policy
+        self.num_strata_deposited = num_strata_deposited
+        self.ranks = ranks
+        self.differentia = differentia
+        self.column_ids = column_ids
+
+    def GetRowsOf(
+        self: "_ColumnGroup",
+        column_ids: typing.Sequence[int],
+    ) -> np.ndarray:
+        """Map column ids to row indices within the group."""
+        rows = np.searchsorted(self.column_ids, column_ids)
+        assert np.array_equal(self.column_ids[rows], column_ids)
+        return rows
+
+    def AppendRows(
+        self: "_ColumnGroup",
+        differentia: np.ndarray,
+        column_ids: np.ndarray,
+    ) -> None:
+        """Add columns to the group.
+
+        Column ids must all be greater than any id already in the group.
+        """
+        assert not len(self.column_ids) or (
+            column_ids.min() > self.column_ids[-1]
+        )
+        self.differentia = np.concatenate([self.differentia, differentia])
+        self.column_ids = np.concatenate([self.column_ids, column_ids])
+
+    def DeleteRows(self: "_ColumnGroup", rows: np.ndarray) -> None:
+        """Remove columns from the group."""
+        self.differentia = np.delete(self.differentia, rows, axis=0)
+        self.column_ids = np.delete(self.column_ids, rows)
+
+    def DepositStrata(
+        self: "_ColumnGroup",
+        new_differentia: np.ndarray,
+    ) -> None:
+        """Deposit a stratum onto every column in the group.
+
+        The stratum retention policy's drop set is computed once and applied
+        to every row.
+        """
+        new_rank = self.num_strata_deposited
+        extended_ranks = np.append(self.ranks, new_rank)
+        drop_ranks = [
+            *self.stratum_retention_policy.GenDropRanks(
+                num_stratum_depositions_completed=self.num_strata_deposited,
+                retained_ranks=extended_ranks.tolist(),
+            )
+        ]
+        keep = np.ones(len(extended_ranks), dtype=bool)
+        keep[np.searchsorted(extended_ranks, drop_ranks)] = False
+
+        # assemble result directly, avoiding materializing extended matrix
+        kept_old = keep[:-1]
+        result = np.empty(
+            (len(self.column_ids), np.count_nonzero(keep)),
+            dtype=self.differentia.dtype,
+        )
+        num_kept_old = np.count_nonzero(kept_old)
+        result[:, :num_kept_old] = self.differentia[:, kept_old]
+        if keep[-1]:
+            result[:, -1] = new_differentia
+
+        self.differentia = result
+        self.ranks = extended_ranks[keep]
+        self.num_strata_deposited += 1
+
+
+class HereditaryStratigraphicColumnPopulation:
+    """Container that advances many columns in lockstep.
+
+    Holds hereditary stratigraphic columns in compact form, grouping columns
+    that share a stratum retention policy and number of strata deposited.
+    Within each group, retained ranks are identical, so the group's
+    differentia are kept as a single matrix and stratum deposition (including
+    purging of strata according to the retention policy) is performed for
+    the whole group as one batched operation. The retention policy's drop
+    set is computed only once per group per deposition.
+
+    Columns are referred to by integer ids, issued as columns are created,
+    added, or cloned. Stratum annotations are not supported. Columns may be
+    extracted as independent HereditaryStratigraphicColumn objects using
+    GetColumn.
+
+    Populations can be saved in a columnar binary format using ToFile and
+    loaded using FromFile, which memory maps group data so that columns'
+    differentia can be inspected and compared without reading the entire
+    file into memory.
+
+    All columns held must share a differentia bit width of at most 64 bits.
+    Stratum retention policies must be deterministic (i.e., not the
+    stochastic_algo policy), as every column in a group must drop the same
+    ranks.
+    """
+
+    # used to issue column ids
+    _id_counter: typing.Iterator[int]
+    # maps (policy spec, num strata deposited) to the group holding columns
+    # with that policy and deposition count
+    _groups: typing.Dict[typing.Tuple[typing.Any, int], _ColumnGroup]
+    # maps column id to the group holding it
+    _group_of: typing.Dict[int, _ColumnGroup]
+    _rng: np.random.Generator
+    _stratum_differentia_bit_width: int
+
+    def __init__(
+        self: "HereditaryStratigraphicColumnPopulation",
+        *,
+        stratum_differentia_bit_width: int = 64,
+        seed: typing.Optional[int] = None,
+    ):
+        """Construct an empty population.
+
+        Parameters
+        ----------
+        stratum_differentia_bit_width : int, optional
+            The bit width of generated differentia. Default 64, allowing for
+            2^64 distinct values. At most 64.
+        seed : int, optional
+            Seed for the random number generator used to draw differentia.
+            If not provided, the generator is seeded from fresh operating
+            system entropy.
+        """
+        assert 0 < stratum_differentia_bit_width <= 64
+        self._id_counter = it.count()
+        self._groups = {}
+        self._group_of = {}
+        self._rng = np.random.default_rng(seed)
+        self._stratum_differentia_bit_width = stratum_differentia_bit_width
+
+    def __len__(self: "HereditaryStratigraphicColumnPopulation") -> int:
+        """How many columns are held?"""
+        return len(self._group_of)
+
+    def _DrawDifferentia(
+        self: "HereditaryStratigraphicColumnPopulation",
+        num_differentia: int,
+    ) -> np.ndarray:
+        """Generate a vector of random differentia."""
+        return self._rng.integers(
+            2**self._stratum_differentia_bit_width,
+            size=num_differentia,
+            dtype=np.uint64,
+        ).astype(
+            min_uint_dtype_for_bit_width(self._stratum_differentia_bit_width)
+        )
+
+    def _GetOrMakeGroup(
+        self: "HereditaryStratigraphicColumnPopulation",
+        stratum_retention_policy: typing.Any,
+        num_strata_deposited: int,
+        ranks: np.ndarray,
+    ) -> _ColumnGroup:
+        """Find group matching policy and deposition count, or create one."""
+        key = (stratum_retention_policy.GetSpec(), num_strata_deposited)
+        if key in self._groups:
+            group = self._groups[key]
+            assert np.array_equal(group.ranks, ranks)
+            return group
+
+        assert not isinstance(
+            stratum_retention_policy.GetSpec(),
+            stochastic_algo.PolicySpec,
+        ), "Stratum retention policy must be deterministic."
+        group = _ColumnGroup(
+            stratum_retention_policy=stratum_retention_policy,
+            num_strata_deposited=num_strata_deposited,
+            ranks=ranks,
+            differentia=np.empty(
+                (0, len(ranks)),
+                dtype=min_uint_dtype_for_bit_width(
+                    self._stratum_differentia_bit_width,
+                ),
+            ),
+            column_ids=np.empty(0, dtype=np.int64),
+        )
+        self._groups[key] = group
+        return group
+
+    def _AppendToGroup(
+        self: "HereditaryStratigraphicColumnPopulation",
+        group: _ColumnGroup,
+        differentia: np.ndarray,
+    ) -> typing.List[int]:
+        """Issue ids for and store new columns within group."""
+        column_ids = np.fromiter(
+            it.islice(self._id_counter, len(differentia)),
+            dtype=np.int64,
+            count=len(differentia),
+        )
+        group.AppendRows(differentia, column_ids)
+        res = column_ids.tolist()
+        self._group_of.update(zip(res, it.repeat(group)))
+        return res
+
+    def _PruneEmptyGroups(
+        self: "HereditaryStratigraphicColumnPopulation",
+    ) -> None:
+        self._groups = {
+            key: group
+            for key, group in self._groups.items()
+            if len(group.column_ids)
+        }
+
+    def NewColumns(
+        self: "HereditaryStratigraphicColumnPopulation",
+        num_columns: int,
+        stratum_retention_policy: typing.Any = perfect_resolution_algo.Policy(),
+    ) -> typing.List[int]:
+        """Create columns to track new, independent lines of descent.
+
+        As with HereditaryStratigraphicColumn initialization, a first stratum
+        is deposited on each new column.
+
+        Returns
+        -------
+        list of int
+            Ids of the newly created columns.
+        """
+        if not num_columns:
+            return []
+
+        staging_group = _ColumnGroup(
+            stratum_retention_policy=stratum_retention_policy,
+            num_strata_deposited=0,
+            ranks=np.empty(0, dtype=np.int64),
+            differentia=np.empty(
+                (num_columns, 0),
+                dtype=min_uint_dtype_for_bit_width(
+                    self._stratum_differentia_bit_width,
+                ),
+            ),
+            column_ids=np.empty(num_columns, dtype=np.int64),
+        )
+        staging_group.DepositStrata(self._DrawDifferentia(num_columns))
+
+        group = self._GetOrMakeGroup(
+            stratum_retention_policy,
+            staging_group.num_strata_deposited,
+            staging_group.ranks,
+        )
+        return self._AppendToGroup(group, staging_group.differentia)
+
+    def AddColumn(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column: HereditaryStratigraphicColumn,
+    ) -> int:
+        """Copy an existing column into the population.
+
+        The column's retention policy and differentia bit width are adopted.
+        Any stratum annotations are discarded.
+
+        Returns
+        -------
+        int
+            Id of the added column.
+        """
+        assert (
+            column.GetStratumDifferentiaBitWidth()
+            == self._stratum_differentia_bit_width
+        )
+        ranks, differentia = zip(
+            *column._stratum_ordered_store.IterRankDifferentia(
+                get_rank_at_column_index=column.GetRankAtColumnIndex,
+            )
+        )
+        group = self._GetOrMakeGroup(
+            column._stratum_retention_policy,
+            column.GetNumStrataDeposited(),
+            np.array(ranks, dtype=np.int64),
+        )
+        (res,) = self._AppendToGroup(
+            group,
+            np.array([differentia], dtype=group.differentia.dtype),
+        )
+        return res
+
+    def CloneColumns(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_ids: typing.Iterable[int],
+    ) -> typing.List[int]:
+        """Create copies of existing columns.
+
+        The same column id may be requested repeatedly to make several
+        copies.
+
+        Returns
+        -------
+        list of int
+            Ids of the copies, in order corresponding to column_ids.
+        """
+        column_ids = [*column_ids]
+        positions_by_group = defaultdict(list)
+        for pos, column_id in enumerate(column_ids):
+            positions_by_group[self._group_of[column_id]].append(pos)
+
+        res = [None] * len(column_ids)
+        for group, positions in positions_by_group.items():
+            rows = group.GetRowsOf([column_ids[pos] for pos in positions])
+            clone_ids = self._AppendToGroup(group, group.differentia[rows])
+            for pos, clone_id in zip(positions, clone_ids):
+                res[pos] = clone_id
+
+        return res
+
+    def RemoveColumns(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_ids: typing.Iterable[int],
+    ) -> None:
+        """Discard columns from the population."""
+        targets_by_group = defaultdict(list)
+        for column_id in sorted(set(column_ids)):
+            targets_by_group[self._group_of.pop(column_id)].append(column_id)
+
+        for group, targets in targets_by_group.items():
+            group.DeleteRows(group.GetRowsOf(targets))
+
+        self._PruneEmptyGroups()
+
+    def DepositStrata(
+        self: "HereditaryStratigraphicColumnPopulation",
+    ) -> None:
+        """Elapse a generation on every column in the population."""
+        for group in self._groups.values():
+            group.DepositStrata(self._DrawDifferentia(len(group.column_ids)))
+        # groups' deposition counts advanced, so update keys to match
+        self._groups = {
+            (policy_spec, group.num_strata_deposited): group
+            for (policy_spec, __), group in self._groups.items()
+        }
+
+    def GetColumnIds(
+        self: "HereditaryStratigraphicColumnPopulation",
+    ) -> typing.List[int]:
+        """Get ids of all columns held, in ascending order."""
+        return sorted(self._group_of)
+
+    def GetColumn(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_id: int,
+    ) -> HereditaryStratigraphicColumn:
+        """Extract an independent copy of a column.
+
+        The returned column is backed by a HereditaryStratumOrderedStoreArray
+        and stores deposition ranks in strata.
+        """
+        group = self._group_of[column_id]
+        (row,) = group.GetRowsOf([column_id])
+
+        # bypass __init__, which would deposit an initial stratum
+        res = HereditaryStratigraphicColumn.__new__(
+            HereditaryStratigraphicColumn
+        )
+        res._InitializeEmpty(
+            stratum_retention_policy=group.stratum_retention_policy,
+            always_store_rank_in_stratum=True,
+            stratum_differentia_bit_width=self._stratum_differentia_bit_width,
+            stratum_ordered_store_factory=HereditaryStratumOrderedStoreArray,
+            stratum_factory=HereditaryStratum,
+            stratum_differentia_source=None,
+        )
+        store = res._stratum_ordered_store
+        for rank, differentia in zip(
+            group.ranks.tolist(),
+            group.differentia[row].tolist(),
+        ):
+            store.DepositStratum(
+                rank=rank,
+                stratum=HereditaryStratum(
+                    deposition_rank=rank,
+                    differentia=differentia,
+                ),
+            )
+
+        res._num_strata_deposited = group.num_strata_deposited
+        return res
+
+    def GetColumnStripped(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_id: int,
+    ) -> HereditaryStratigraphicColumnStripped:
+        """Get a stripped view of a column, without copying its data.
+
+        The returned view wraps population data (which may be memory mapped
+        from file) and can be passed directly to juxtaposition and
+        phylogenetic_inference functions. It reflects the column's state at
+        the time of the call; operations that alter the population, like
+        DepositStrata, are not reflected in previously returned views.
+        """
+        group = self._group_of[column_id]
+        (row,) = group.GetRowsOf([column_id])
+        return HereditaryStratigraphicColumnStripped.FromArrays(
+            group.ranks,
+            group.differentia[row],
+            num_strata_deposited=group.num_strata_deposited,
+            stratum_differentia_bit_width=self._stratum_differentia_bit_width,
+        )
+
+    def GetColumnRanks(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_id: int,
+    ) -> np.ndarray:
+        """Get deposition ranks of strata retained by a column.
+
+        Ordered from most ancient to most recent. The returned array is
+        shared with all columns with the same retention policy and number of
+        strata deposited, and must not be modified.
+        """
+        return self._group_of[column_id].ranks
+
+    def GetColumnDifferentia(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_id: int,
+    ) -> np.ndarray:
+        """Get differentia of strata retained by a column.
+
+        Ordered from most ancient to most recent, corresponding to
+        GetColumnRanks. The returned array is a view into population data
+        (which may be memory mapped from file) and must not be modified.
+        """
+        group = self._group_of[column_id]
+        (row,) = group.GetRowsOf([column_id])
+        return group.differentia[row]
+
+    def GetNumStrataDeposited(
+        self: "HereditaryStratigraphicColumnPopulation",
+        column_id: int,
+    ) -> int:
+        """How many strata have been deposited on a column?"""
+        return self._group_of[column_id].num_strata_deposited
+
+    def GetStratumDifferentiaBitWidth(
+        self: "HereditaryStratigraphicColumnPopulation",
+    ) -> int:
+        """How many bits wide are the differentia of strata?"""
+        return self._stratum_differentia_bit_width
+
+    def ToFile(
+        self: "HereditaryStratigraphicColumnPopulation",
+        path: str,
+    ) -> None:
+        """Write population to a columnar binary file.
+
+        For each group of columns sharing a retention policy and deposition
+        count, the file holds the group's retained ranks, column ids, and a
+        differentia matrix with one row per column, each as a contiguous
+        little-endian array aligned to 64 bytes. A json metadata footer
+        records array offsets. Files can be loaded with FromFile, or arrays
+        can be accessed directly using numpy.memmap and the metadata.
+
+        Random number generator state is not saved.
+        """
+        differentia_dtype = min_uint_dtype_for_bit_width(
+            self._stratum_differentia_bit_width,
+        ).newbyteorder("<")
+
+        groups_metadata = []
+        with open(path, "wb") as file:
+            file.write(b"\x00" * _FILE_PREAMBLE.size)
+
+            def write_aligned(array: np.ndarray, dtype: np.dtype) -> int:
+                file.write(b"\x00" * (-file.tell() % _FILE_ALIGNMENT))
+                offset = file.tell()
+                np.ascontiguousarray(array, dtype=dtype).tofile(file)
+                return offset
+
+            for group in self._groups.values():
+                groups_metadata.append(
+                    {
+                        "stratum_retention_policy": stringify_retention_policy(
+                            group.stratum_retention_policy,
+                        ),
+                        "num_strata_deposited": group.num_strata_deposited,
+                        "num_columns": len(group.column_ids),
+                        "num_strata_retained": len(group.ranks),
+                        "ranks_offset": write_aligned(group.ranks, "<i8"),
+                        "column_ids_offset": write_aligned(
+                            group.column_ids, "<i8"
+                        ),
+                        "differentia_offset": write_aligned(
+                            group.differentia, differentia_dtype
+                        ),
+                    }
+                )
+
+            metadata = json.dumps(
+                {
+                    "format_version": _FILE_VERSION,
+                    "stratum_differentia_bit_width": (
+                        self._stratum_differentia_bit_width
+                    ),
+                    "differentia_dtype": differentia_dtype.str,
+                    "groups": groups_metadata,
+                }
+            ).encode()
+            metadata_offset = file.tell()
+            file.write(metadata)
+
+            file.seek(0)
+            file.write(
+                _FILE_PREAMBLE.pack(
+                    _FILE_MAGIC, metadata_offset, len(metadata)
+                )
+            )
+
+    @classmethod
+    def FromFile(
+        cls: typing.Type["HereditaryStratigraphicColumnPopulation"],
+        path: str,
+        *,
+        mmap_mode: typing.Optional[str] = "r",
+        seed: typing.Optional[int] = None,
+    ) -> "HereditaryStratigraphicColumnPopulation":
+        """Load a population written by ToFile.
+
+        Parameters
+        ----------
+        path : str
+            File to load.
+        mmap_mode : {"r", "c", None}, optional
+            Mode to memory map array data with, as for numpy.memmap. Default
+            "r" maps data read-only, so columns can be inspected and compared
+            without reading the entire file into memory. Operations that
+            alter the population, like DepositStrata, produce new in-memory
+            arrays without modifying the file. If None, array data is read
+            into memory.
+        seed : int, optional
+            Seed for the random number generator used to draw differentia.
+
+        Raises
+        ------
+        ValueError
+            If path is not a population file.
+        """
+        with open(path, "rb") as file:
+            preamble = file.read(_FILE_PREAMBLE.size)
+            if len(preamble) < _FILE_PREAMBLE.size:
+                raise ValueError("truncated population file")
+            magic, metadata_offset, metadata_num_bytes = _FILE_PREAMBLE.unpack(
+                preamble,
+            )
+            if magic != _FILE_MAGIC:
+                raise ValueError("unrecognized population file format")
+            file.seek(metadata_offset)
+            metadata = json.loads(file.read(metadata_num_bytes).decode())
+
+        if metadata["format_version"] != _FILE_VERSION:
+            raise ValueError("unsupported population file format version")
+
+        def load(offset: int, dtype: str, shape: typing.Tuple) -> np.ndarray:
+            if mmap_mode is None or 0 in shape:
+                return np.fromfile(
+                    path,
+                    dtype=dtype,
+                    count=int(np.prod(shape)),
+                    offset=offset,
+                ).reshape(shape)
+            else:
+                return np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode=mmap_mode,
+                    offset=offset,
+                    shape=shape,
+                )
+
+        res = cls(
+            stratum_differentia_bit_width=metadata[
+                "stratum_differentia_bit_width"
+            ],
+            seed=seed,
+        )
+        max_column_id = -1
+        for group_metadata in metadata["groups"]:
+            num_columns = group_metadata["num_columns"]
+            num_strata_retained = group_metadata["num_strata_retained"]
+            group = _ColumnGroup(
+                stratum_retention_policy=parse_retention_policy(
+                    group_metadata["stratum_retention_policy"],
+                ),
+                num_strata_deposited=group_metadata["num_strata_deposited"],
+                ranks=load(
+                    group_metadata["ranks_offset"],
+                    "<i8",
+                    (num_strata_retained,),
+                ),
+                differentia=load(
+                    group_metadata["differentia_offset"],
+                    metadata["differentia_dtype"],
+                    (num_columns, num_strata_retained),
+                ),
+                column_ids=load(
+                    group_metadata["column_ids_offset"],
+                    "<i8",
+                    (num_columns,),
+                ),
+            )
+            res._groups[
+                (
+                    group.stratum_retention_policy.GetSpec(),
+                    group.num_strata_deposited,
+                )
+            ] = group
+            column_ids = group.column_ids.tolist()
+            res._group_of.update(zip(column_ids, it.repeat(group)))
+            max_column_id = max([max_column_id, *column_ids])
+
+        res._id_counter = it.count(max_column_id + 1)
+        return res
@@ -0,0 +1,268 @@
+import typing
+
+import numpy as np
+
+from .._auxiliary_lib import min_uint_dtype_for_bit_width
+from ._HereditaryStratum import HereditaryStratum
+from ._impl import (
+    calc_min_implausible_spurious_consecutive_differentia_collisions,
+)
+
+
+class HereditaryStratigraphicColumnStripped:
+    """Immutable, annotation-free view of a HereditaryStratigraphicColumn.
+
+    Holds only what is needed for phylogenetic inference: the number of
+    strata deposited, the differentia bit width, and the deposition ranks
+    and differentia of retained strata, stored as two read-only numpy arrays
+    of the narrowest sufficient unsigned integer type. Stratum annotations,
+    the stratum retention policy, and stratum objects are not kept.
+
+    Supports the read-only interface of HereditaryStratigraphicColumn used by
+    juxtaposition and phylogenetic_inference.pairwise functions, so stripped
+    columns can be compared to each other or to full columns. Potentially
+    useful to reduce the memory footprint of large populations of columns
+    held for analysis.
+    """
+
+    __slots__ = (
+        "_num_strata_deposited",
+        "_stratum_differentia_bit_width",
+        "_ranks",
+        "_differentia",
+    )
+
+    _num_strata_deposited: int
+    _stratum_differentia_bit_width: int
+    # deposition ranks of retained strata, ascending
+    _ranks: np.ndarray
+    # differentia of retained strata, corresponding to _ranks
+    _differentia: np.ndarray
+
+    def __init__(
+        self: "HereditaryStratigraphicColumnStripped",
+        column: typing.Any,
+    ) -> None:
+        """Construct a stripped copy of column's retained data.
+
+        Parameters
+        ----------
+        column : HereditaryStratigraphicColumn
+            Column to strip. Later alteration of column does not affect the
+            stripped view.
+        """
+        self._num_strata_deposited = column.GetNumStrataDeposited()
+        self._stratum_differentia_bit_width = (
+            column.GetStratumDifferentiaBitWidth()
+        )
+        ranks, differentia = zip(*column.IterRankDifferentia())
+        self._ranks = np.array(
+            ranks,
+            dtype=min_uint_dtype_for_bit_width(
+                max(self._num_strata_deposited.bit_length(), 1)
+            ),
+        )
+        self._differentia = np.array(
+            differentia,
+            dtype=min_uint_dtype_for_bit_width(
+                self._stratum_differentia_bit_width
+            ),
+        )
+        self._ranks.flags.writeable = False
+        self._differentia.flags.writeable = False
+
+    @classmethod
+    def FromArrays(
+        cls: typing.Type["HereditaryStratigraphicColumnStripped"],
+        ranks: np.ndarray,
+        differentia: np.ndarray,
+        *,
+        num_strata_deposited: int,
+        stratum_differentia_bit_width: int,
+    ) -> "HereditaryStratigraphicColumnStripped":
+        """Wrap existing arrays of retained ranks and differentia.
+
+        Arrays are not copied, so a stripped column can be constructed over
+        data held elsewhere (e.g., memory mapped from file) at constant cost.
+        Read-only views of the arrays are held, so the stripped column cannot
+        be used to alter them. However, later alteration of the underlying
+        data through other references is reflected in the stripped column.
+
+        Parameters
+        ----------
+        ranks : numpy.ndarray
+            Deposition ranks of retained strata, ascending.
+        differentia : numpy.ndarray
+            Differentia of retained strata, corresponding to ranks.
+        num_strata_deposited : int
+            How many strata had been deposited on the column.
+        stratum_differentia_bit_width : int
+            The bit width of differentia.
+        """
+        assert ranks.shape == differentia.shape
+        assert len(ranks) and ranks[-1] < num_strata_deposited
+        res = cls.__new__(cls)
+        res._num_strata_deposited = num_strata_deposited
+        res._stratum_differentia_bit_width = stratum_differentia_bit_width
+        res._ranks = ranks.view()
+        res._differentia = differentia.view()
+        res._ranks.flags.writeable = False
+        res._differentia.flags.writeable = False
+        return res
+
+    def __eq__(
+        self: "HereditaryStratigraphicColumnStripped",
+        other: "HereditaryStratigraphicColumnStripped",
+    ) -> bool:
+        """Compare for value-wise equality."""
+        return (
+            isinstance(other, self.__class__)
+            and self._num_strata_deposited == other._num_strata_deposited
+            and self._stratum_differentia_bit_width
+            == other._stratum_differentia_bit_width
+            and np.array_equal(self._ranks, other._ranks)
+            and np.array_equal(self._differentia, other._differentia)
+        )
+
+    def GetRetainedRanksArray(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> np.ndarray:
+        """Get read-only array of retained deposition ranks, ascending."""
+        return self._ranks
+
+    def GetRetainedDifferentiaArray(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> np.ndarray:
+        """Get read-only array of retained differentia.
+
+        Ordered from most ancient to most recent, corresponding to
+        GetRetainedRanksArray.
+        """
+        return self._differentia
+
+    def IterRetainedRanks(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> typing.Iterator[int]:
+        """Iterate over deposition ranks of retained strata, ascending."""
+        yield from self._ranks.tolist()
+
+    def IterRankDifferentia(
+        self: "HereditaryStratigraphicColumnStripped",
+        start_column_index: int = 0,
+    ) -> typing.Iterator[typing.Tuple[int, int]]:
+        """Iterate over deposition ranks and differentia of retained strata.
+
+        Values yielded as tuples. Guaranteed ordered from most ancient to most
+        recent.
+
+        Parameters
+        ----------
+        start_column_index : int, optional
+            Number of strata to skip over before yielding first result from the
+            iterator. Default 0, meaning no strata are skipped over.
+        """
+        return zip(
+            self._ranks[start_column_index:].tolist(),
+            self._differentia[start_column_index:].tolist(),
+        )
+
+    def GetNumStrataRetained(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> int:
+        """How many strata are retained?"""
+        return len(self._ranks)
+
+    def GetNumStrataDeposited(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> int:
+        """How many strata had been deposited on the stripped column?"""
+        return self._num_strata_deposited
+
+    def GetStratumAtColumnIndex(
+        self: "HereditaryStratigraphicColumnStripped",
+        index: int,
+    ) -> HereditaryStratum:
+        """Reconstitute the stratum positioned at index i among retained
+        strata.
+
+        Index order is from most ancient (index 0) to most recent. The
+        returned stratum has no annotation.
+        """
+        return HereditaryStratum(
+            deposition_rank=int(self._ranks[index]),
+            differentia=int(self._differentia[index]),
+        )
+
+    def GetRankAtColumnIndex(
+        self: "HereditaryStratigraphicColumnStripped",
+        index: int,
+    ) -> int:
+        """Map column position to generation of deposition.
+
+        What is the deposition rank of the stratum positioned at index i
+        among retained strata? Index order is from most ancient (index 0) to
+        most recent.
+        """
+        return int(self._ranks[index])
+
+    def GetColumnIndexOfRank(
+        self: "HereditaryStratigraphicColumnStripped",
+        rank: int,
+    ) -> typing.Optional[int]:
+        """Map generation of deposition to column position.
+
+        What is the index position within retained strata of the stratum
+        deposited at rank r? Returns None if no stratum with rank r is
+        retained.
+        """
+        res_idx = int(np.searchsorted(self._ranks, rank))
+        if res_idx < len(self._ranks) and self._ranks[res_idx] == rank:
+            return res_idx
+        else:
+            return None
+
+    def GetNumDiscardedStrata(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> int:
+        """How many deposited strata have been discarded?"""
+        return self.GetNumStrataDeposited() - self.GetNumStrataRetained()
+
+    def GetStratumDifferentiaBitWidth(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> int:
+        """How many bits wide are the differentia of strata?"""
+        return self._stratum_differentia_bit_width
+
+    def HasDiscardedStrata(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> bool:
+        """Have any deposited strata been discarded?"""
+        return self.GetNumDiscardedStrata() > 0
+
+    def CalcProbabilityDifferentiaCollision(
+        self: "HereditaryStratigraphicColumnStripped",
+    ) -> float:
+        """How likely are differentia collisions?
+
+        Calculates the probability of two randomly-differentiated differentia
+        being identical by coincidence.
+        """
+        return 1.0 / 2**self._stratum_differentia_bit_width
+
+    def CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+        self: "HereditaryStratigraphicColumnStripped",
+        significance_level: float,
+    ) -> float:
+        """Determine amount of evidence required to indicate shared ancestry.
+
+        Calculates how many differentia collisions are required to reject the
+        null hypothesis that columns do not share common ancestry at those
+        ranks at significance level significance_level. Results are memoized
+        across all columns.
+        """
+        return (
+            calc_min_implausible_spurious_consecutive_differentia_collisions(
+                self._stratum_differentia_bit_width,
+                significance_level,
+            )
+        )
@@ -22,6 +22,7 @@ class HereditaryStratum:
         annotation: typing.Optional[typing.Any] = None,
         differentia_bit_width: int = 64,
         deposition_rank: typing.Optional[int] = None,
+        differentia: typing.Optional[int] = None,
     ):
         """Construct the stratum.
 
@@ -39,10 +40,17 @@ class HereditaryStratum:
             for 2^64 distinct values.
         deposition_rank : int, optional
             The position of the stratum being deposited within the sequence of strata deposited into the column. Precisely, the number of strata that have been deposited before stratum.
+        differentia : int, optional
+            Differentia value to store instead of generating one randomly.
+            Used to reconstitute strata from stores that do not hold
+            HereditaryStratum objects directly.
         """
         if deposition_rank is not None:
             self._deposition_rank = deposition_rank
-        self._differentia = random.randrange(2**differentia_bit_width)
+        if differentia is not None:
+            self._differentia = differentia
+        else:
+            self._differentia = random.randrange(2**differentia_bit_width)
         if annotation is not None:
             self._annotation = annotation
 
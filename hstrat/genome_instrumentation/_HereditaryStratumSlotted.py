@@ -0,0 +1,103 @@
+import random
+import typing
+
+
+class HereditaryStratumSlotted:
+    """Memory-compact drop-in alternative to HereditaryStratum.
+
+    Packages the same stratigraph data as HereditaryStratum, but declares
+    __slots__ so instances carry no per-instance __dict__. Optional fields
+    that are not provided are stored as None rather than left unset, so
+    accessors don't need attribute existence checks.
+
+    Potentially useful in scenarios where many strata are retained across
+    large populations of columns. Configure a HereditaryStratigraphicColumn to
+    deposit this stratum type via its stratum_factory argument.
+    """
+
+    __slots__ = ("_deposition_rank", "_differentia", "_annotation")
+
+    # None if not stored
+    _deposition_rank: typing.Optional[int]
+    # random "fingerprint" generated at initialization
+    _differentia: int
+    # optional arbitrary user-provided data, None if not provided
+    _annotation: typing.Optional[typing.Any]
+
+    def __init__(
+        self: "HereditaryStratumSlotted",
+        *,
+        annotation: typing.Optional[typing.Any] = None,
+        differentia_bit_width: int = 64,
+        deposition_rank: typing.Optional[int] = None,
+        differentia: typing.Optional[int] = None,
+    ):
+        """Construct the stratum.
+
+        Randomly generates and stores a differentia "fingerprint" alongside
+        other metadata, if provided.
+
+        Parameters
+        ----------
+        annotation: any, optional
+            Optional object to store as an annotation. Allows arbitrary user-
+            provided to be associated with this stratum's generation in its
+            line of descent.
+        differentia_bit_width: int, optional
+            The bit width of the generated differentia. Default 64, allowing
+            for 2^64 distinct values.
+        deposition_rank : int, optional
+            The position of the stratum being deposited within the sequence
+            of strata deposited into the column. Precisely, the number of
+            strata that have been deposited before stratum.
+        differentia : int, optional
+            Differentia value to store instead of generating one randomly.
+        """
+        self._deposition_rank = deposition_rank
+        self._differentia = (
+            random.randrange(2**differentia_bit_width)
+            if differentia is None
+            else differentia
+        )
+        self._annotation = annotation
+
+    def __eq__(
+        self: "HereditaryStratumSlotted",
+        other: "HereditaryStratumSlotted",
+    ) -> bool:
+        """Compare for value-wise equality."""
+        return isinstance(other, self.__class__) and (
+            # compare differentia first, the most likely to mismatch
+            self._differentia,
+            self._deposition_rank,
+            self._annotation,
+        ) == (
+            other._differentia,
+            other._deposition_rank,
+            other._annotation,
+        )
+
+    def GetDepositionRank(
+        self: "HereditaryStratumSlotted",
+    ) -> typing.Optional[int]:
+        """Get the deposition order rank associated with this stratum, if stored.
+
+        Deposition rank is the number of strata deposited on a column before
+        self. Deposition rank may not be stored if the stratum retention policy
+        supports calculation of deposition rank from column index.
+        """
+        return self._deposition_rank
+
+    def GetDifferentia(self: "HereditaryStratumSlotted") -> int:
+        """Access differentia.
+
+        Returns the randomly-generated value that distinguishes this stratum
+        from others generated at the same rank in other hereditary columns.
+        """
+        return self._differentia
+
+    def GetAnnotation(
+        self: "HereditaryStratumSlotted",
+    ) -> typing.Optional[typing.Any]:
+        """Access arbitrary, user-specified annotation, if any."""
+        return self._annotation
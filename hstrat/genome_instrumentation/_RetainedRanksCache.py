@@ -0,0 +1,95 @@
+import typing
+
+import lru
+
+
+class RetainedRanksCache:
+    """Memoizes ranks of strata retained by stratum retention policies.
+
+    Columns that do not store deposition ranks within strata must calculate
+    ranks from column indices via the stratum retention policy, which can be
+    expensive (e.g., a linear scan over retained ranks). Because retained ranks
+    depend only on the policy specification and the number of strata
+    deposited, they can be materialized once per depth and shared between all
+    columns at that depth. Results are held in a bounded least-recently-used
+    cache.
+
+    HereditaryStratigraphicColumn consults a single instance shared by all
+    columns, accessible via HereditaryStratigraphicColumn.GetRetainedRanksCache.
+    """
+
+    # maps (policy spec, num strata deposited) to retained ranks
+    _cache: lru.LRU
+    _num_hits: int
+    _num_misses: int
+
+    def __init__(self: "RetainedRanksCache", max_size: int = 256):
+        """Initialize an empty cache.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximum number of retained rank sequences to hold before
+            evicting the least recently used. Default 256.
+        """
+        self._cache = lru.LRU(max_size)
+        self._num_hits = 0
+        self._num_misses = 0
+
+    def GetRanksAtColumnIndices(
+        self: "RetainedRanksCache",
+        policy: typing.Any,
+        num_strata_deposited: int,
+    ) -> typing.Sequence[int]:
+        """Get the rank of the stratum at each column index after n strata
+        have been deposited.
+
+        Ordered from most ancient (index 0) to most recent. Includes a final
+        entry for an in-progress deposition (i.e., rank n), consistent with
+        policies' CalcRankAtColumnIndex.
+
+        Parameters
+        ----------
+        policy : any
+            Stratum retention policy, which must provide IterRetainedRanks.
+        num_strata_deposited : int
+            Number of strata deposited.
+        """
+        assert policy.IterRetainedRanks is not None
+
+        key = (policy.GetSpec(), num_strata_deposited)
+        res = self._cache.get(key)
+        if res is None:
+            self._num_misses += 1
+            res = (
+                *policy.IterRetainedRanks(num_strata_deposited),
+                # in-progress deposition case
+                num_strata_deposited,
+            )
+            self._cache[key] = res
+        else:
+            self._num_hits += 1
+
+        return res
+
+    def Clear(self: "RetainedRanksCache") -> None:
+        """Discard all cached ranks and reset hit and miss counters."""
+        self._cache.clear()
+        self._num_hits = 0
+        self._num_misses = 0
+
+    def GetMaxSize(self: "RetainedRanksCache") -> int:
+        """How many retained rank sequences can be held at most?"""
+        return self._cache.get_size()
+
+    def SetMaxSize(self: "RetainedRanksCache", max_size: int) -> None:
+        """Change how many retained rank sequences can be held at most."""
+        self._cache.set_size(max_size)
+
+    def GetNumHits(self: "RetainedRanksCache") -> int:
+        """How many lookups were served from the cache?"""
+        return self._num_hits
+
+    def GetNumMisses(self: "RetainedRanksCache") -> int:
+        """How many lookups required calculating retained ranks?"""
+        return self._num_misses
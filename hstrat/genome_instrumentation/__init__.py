@@ -1,27 +1,55 @@
 """Data structures to annotate genomes with."""
 
 from . import stratum_ordered_stores
+from ._BufferedDifferentiaSource import BufferedDifferentiaSource
+from ._DropRanksCache import DropRanksCache
 from ._HereditaryStratigraphicColumn import HereditaryStratigraphicColumn
 from ._HereditaryStratigraphicColumnBundle import (
     HereditaryStratigraphicColumnBundle,
 )
+from ._HereditaryStratigraphicColumnPopulation import (
+    HereditaryStratigraphicColumnPopulation,
+)
+from ._HereditaryStratigraphicColumnStripped import (
+    HereditaryStratigraphicColumnStripped,
+)
 from ._HereditaryStratum import HereditaryStratum
+from ._HereditaryStratumSlotted import HereditaryStratumSlotted
+from ._RetainedRanksCache import RetainedRanksCache
+from ._iter_column_snapshot import iter_column_snapshot
+from ._write_column_snapshot import write_column_snapshot
 from .stratum_ordered_stores import *  # noqa: F401
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
+    "BufferedDifferentiaSource",
+    "DropRanksCache",
     "HereditaryStratigraphicColumn",
     "HereditaryStratigraphicColumnBundle",
+    "HereditaryStratigraphicColumnPopulation",
+    "HereditaryStratigraphicColumnStripped",
     "HereditaryStratum",
+    "HereditaryStratumSlotted",
+    "RetainedRanksCache",
+    "iter_column_snapshot",
+    "write_column_snapshot",
 ] + stratum_ordered_stores.__all__
 
 from .._auxiliary_lib import launder_impl_modules as _launder
 
 _launder(
     [
+        BufferedDifferentiaSource,
+        DropRanksCache,
         HereditaryStratigraphicColumn,
         HereditaryStratigraphicColumnBundle,
+        HereditaryStratigraphicColumnPopulation,
+        HereditaryStratigraphicColumnStripped,
         HereditaryStratum,
+        HereditaryStratumSlotted,
+        RetainedRanksCache,
+        iter_column_snapshot,
+        write_column_snapshot,
     ],
     __name__,
 )
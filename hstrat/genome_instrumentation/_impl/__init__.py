@@ -0,0 +1,30 @@
+"""Implementation helpers."""
+
+from ._calc_min_implausible_spurious_consecutive_differentia_collisions import (
+    calc_min_implausible_spurious_consecutive_differentia_collisions,
+)
+from ._calc_packed_differentia_num_bytes import (
+    calc_packed_differentia_num_bytes,
+)
+from ._column_snapshot_format import (
+    COLUMN_SNAPSHOT_MAGIC,
+    COLUMN_SNAPSHOT_RECORD_LENGTH,
+    open_column_snapshot,
+)
+from ._pack_differentia import pack_differentia
+from ._parse_retention_policy import parse_retention_policy
+from ._stringify_retention_policy import stringify_retention_policy
+from ._unpack_differentia import unpack_differentia
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    "COLUMN_SNAPSHOT_MAGIC",
+    "COLUMN_SNAPSHOT_RECORD_LENGTH",
+    "calc_min_implausible_spurious_consecutive_differentia_collisions",
+    "calc_packed_differentia_num_bytes",
+    "open_column_snapshot",
+    "pack_differentia",
+    "parse_retention_policy",
+    "stringify_retention_policy",
+    "unpack_differentia",
+]
@@ -0,0 +1,21 @@
+import functools
+import math
+
+
+# keyed on (differentia bit width, significance level), which take few
+# distinct values in practice, so the table stays small
+@functools.lru_cache(maxsize=None)
+def calc_min_implausible_spurious_consecutive_differentia_collisions(
+    stratum_differentia_bit_width: int,
+    significance_level: float,
+) -> int:
+    """How many consecutive differentia collisions are required to reject
+    the null hypothesis of no shared ancestry at significance_level?
+
+    Memoized, as columns and juxtaposition routines request the same few
+    thresholds for every pair of columns compared.
+    """
+    assert 0.0 <= significance_level <= 1.0
+
+    log_base = 1.0 / 2**stratum_differentia_bit_width
+    return int(math.ceil(math.log(significance_level, log_base)))
@@ -0,0 +1,9 @@
+def calc_packed_differentia_num_bytes(
+    differentia_bit_width: int,
+    num_differentia: int,
+) -> int:
+    """How many bytes does pack_differentia use to encode n differentia?"""
+    if differentia_bit_width <= 64:
+        return (num_differentia * differentia_bit_width + 7) // 8
+    else:
+        return num_differentia * ((differentia_bit_width + 7) // 8)
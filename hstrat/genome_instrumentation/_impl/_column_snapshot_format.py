@@ -0,0 +1,60 @@
+import bz2
+import gzip
+import lzma
+import struct
+import typing
+
+# stream header, identifying a column snapshot and its format version
+COLUMN_SNAPSHOT_MAGIC = b"hsts\x01"
+# precedes each column record within stream, giving record byte length
+COLUMN_SNAPSHOT_RECORD_LENGTH = struct.Struct("<I")
+
+_compression_openers = {
+    "bz2": bz2.open,
+    "gzip": gzip.open,
+    "lzma": lzma.open,
+}
+
+# leading bytes of compressed files, used to detect compression on read
+_compression_signatures = {
+    "bz2": b"BZh",
+    "gzip": b"\x1f\x8b",
+    "lzma": b"\xfd7zXZ\x00",
+}
+
+
+def open_column_snapshot(
+    path: str,
+    mode: str,
+    compression: typing.Optional[str] = None,
+) -> typing.BinaryIO:
+    """Open a column snapshot file as an uncompressed binary stream.
+
+    Parameters
+    ----------
+    path : str
+        Snapshot file to open.
+    mode : {"rb", "wb"}
+        Open file for reading or for writing.
+    compression : {"bz2", "gzip", "lzma"}, optional
+        Compression to apply on write. Ignored on read, where compression is
+        detected from the file's leading bytes.
+    """
+    assert mode in ("rb", "wb")
+    if mode == "rb":
+        with open(path, "rb") as file:
+            leading_bytes = file.read(6)
+        compression = next(
+            (
+                algorithm
+                for algorithm, signature in _compression_signatures.items()
+                if leading_bytes.startswith(signature)
+            ),
+            None,
+        )
+
+    if compression is None:
+        return open(path, mode)
+    else:
+        assert compression in _compression_openers, compression
+        return _compression_openers[compression](path, mode)
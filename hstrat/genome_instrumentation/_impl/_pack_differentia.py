@@ -0,0 +1,31 @@
+import typing
+
+import numpy as np
+
+
+def pack_differentia(
+    differentia: typing.Sequence[int],
+    differentia_bit_width: int,
+) -> bytes:
+    """Encode differentia values as contiguous big-endian bit fields.
+
+    Differentia narrower than a byte are bit-packed, so that n differentia of
+    bit width w occupy ceil(n * w / 8) bytes. Differentia wider than 64 bits
+    are each padded to a whole number of bytes.
+    """
+    if differentia_bit_width in (8, 16, 32, 64):
+        return np.asarray(
+            differentia,
+            dtype=f">u{differentia_bit_width // 8}",
+        ).tobytes()
+    elif differentia_bit_width < 64:
+        values = np.asarray(differentia, dtype=np.uint64).reshape(-1, 1)
+        shifts = np.arange(differentia_bit_width - 1, -1, -1, dtype=np.uint64)
+        bits = ((values >> shifts) & np.uint64(1)).astype(np.uint8)
+        return np.packbits(bits.ravel()).tobytes()
+    else:
+        num_bytes = (differentia_bit_width + 7) // 8
+        return b"".join(
+            int(differentia_).to_bytes(num_bytes, "big")
+            for differentia_ in differentia
+        )
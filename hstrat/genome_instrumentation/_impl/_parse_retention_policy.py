@@ -0,0 +1,31 @@
+import ast
+import re
+import typing
+
+from ...stratum_retention_strategy import stratum_retention_algorithms
+
+# e.g., "fixed_resolution_algo.PolicySpec(fixed_resolution=10)"
+_policy_spec_repr_regex = re.compile(r"^(\w+_algo)\.PolicySpec\((.*)\)$")
+
+
+def parse_retention_policy(policy_str: str) -> typing.Any:
+    """Reconstruct a stratum retention policy described by
+    stringify_retention_policy.
+
+    Raises ValueError if policy_str is not a policy spec description.
+    """
+    match = _policy_spec_repr_regex.match(policy_str)
+    if match is None:
+        raise ValueError(f"malformed policy spec {policy_str!r}")
+
+    algo_identifier, args = match.groups()
+    if algo_identifier not in stratum_retention_algorithms.__all__:
+        raise ValueError(f"unknown retention algorithm {algo_identifier!r}")
+
+    kwargs = {}
+    for arg in filter(None, args.split(", ")):
+        key, value = arg.split("=", 1)
+        kwargs[key] = ast.literal_eval(value)
+
+    algo = getattr(stratum_retention_algorithms, algo_identifier)
+    return algo.Policy(**kwargs)
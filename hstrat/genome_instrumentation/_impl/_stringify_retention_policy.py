@@ -0,0 +1,7 @@
+import typing
+
+
+def stringify_retention_policy(policy: typing.Any) -> str:
+    """Describe a stratum retention policy as a string that
+    parse_retention_policy can reconstruct it from."""
+    return repr(policy.GetSpec())
@@ -0,0 +1,40 @@
+import typing
+
+import numpy as np
+
+
+def unpack_differentia(
+    buffer: bytes,
+    differentia_bit_width: int,
+    num_differentia: int,
+) -> typing.List[int]:
+    """Decode differentia values encoded by pack_differentia.
+
+    Reads only as many bytes from the front of buffer as necessary.
+    """
+    if differentia_bit_width in (8, 16, 32, 64):
+        return np.frombuffer(
+            buffer,
+            dtype=f">u{differentia_bit_width // 8}",
+            count=num_differentia,
+        ).tolist()
+    elif differentia_bit_width < 64:
+        num_bits = num_differentia * differentia_bit_width
+        bits = np.unpackbits(
+            np.frombuffer(buffer, dtype=np.uint8, count=(num_bits + 7) // 8),
+            count=num_bits,
+        ).reshape(num_differentia, differentia_bit_width)
+        weights = np.uint64(1) << np.arange(
+            differentia_bit_width - 1, -1, -1, dtype=np.uint64
+        )
+        return (
+            (bits.astype(np.uint64) * weights)
+            .sum(axis=1, dtype=np.uint64)
+            .tolist()
+        )
+    else:
+        num_bytes = (differentia_bit_width + 7) // 8
+        return [
+            int.from_bytes(buffer[i * num_bytes : (i + 1) * num_bytes], "big")
+            for i in range(num_differentia)
+        ]
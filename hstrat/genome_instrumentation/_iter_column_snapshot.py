@@ -0,0 +1,82 @@
+import typing
+
+from ._HereditaryStratigraphicColumn import HereditaryStratigraphicColumn
+from ._HereditaryStratum import HereditaryStratum
+from ._impl import (
+    COLUMN_SNAPSHOT_MAGIC,
+    COLUMN_SNAPSHOT_RECORD_LENGTH,
+    open_column_snapshot,
+)
+from .stratum_ordered_stores import HereditaryStratumOrderedStoreList
+
+
+def iter_column_snapshot(
+    path: str,
+    *,
+    chunk_size: int = 2**20,
+    stratum_ordered_store_factory: typing.Callable = HereditaryStratumOrderedStoreList,
+    stratum_factory: typing.Callable = HereditaryStratum,
+) -> typing.Iterator[HereditaryStratigraphicColumn]:
+    """Lazily stream columns from a snapshot file.
+
+    The snapshot is read in chunks and columns are deserialized one at a time
+    as the generator is advanced, so memory use is bounded by chunk size and
+    the size of the largest column record rather than snapshot size.
+    Compression is detected automatically.
+
+    Parameters
+    ----------
+    path : str
+        Snapshot file written by write_column_snapshot.
+    chunk_size : int, optional
+        Number of (uncompressed) bytes to read at a time. Default 1 MiB.
+    stratum_ordered_store_factory : callable, optional
+        Callable to generate a container to store strata within deserialized
+        columns.
+    stratum_factory : callable, optional
+        Callable to construct deserialized strata.
+
+    Raises
+    ------
+    ValueError
+        If path is not a column snapshot or is truncated.
+
+    See Also
+    --------
+    write_column_snapshot :
+        Streams columns into a snapshot file.
+    """
+    assert chunk_size > 0
+    with open_column_snapshot(path, "rb") as file:
+        if file.read(len(COLUMN_SNAPSHOT_MAGIC)) != COLUMN_SNAPSHOT_MAGIC:
+            raise ValueError("unrecognized column snapshot format")
+
+        buffer = bytearray()
+        pos = 0
+        while True:
+            # yield all records held complete within buffer
+            while len(buffer) - pos >= COLUMN_SNAPSHOT_RECORD_LENGTH.size:
+                (
+                    record_num_bytes,
+                ) = COLUMN_SNAPSHOT_RECORD_LENGTH.unpack_from(buffer, pos)
+                record_begin = pos + COLUMN_SNAPSHOT_RECORD_LENGTH.size
+                record_end = record_begin + record_num_bytes
+                if record_end > len(buffer):
+                    break
+                yield HereditaryStratigraphicColumn.FromBytes(
+                    bytes(buffer[record_begin:record_end]),
+                    stratum_ordered_store_factory=stratum_ordered_store_factory,
+                    stratum_factory=stratum_factory,
+                )
+                pos = record_end
+
+            # discard consumed records, then read next chunk
+            del buffer[:pos]
+            pos = 0
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+
+        if buffer:
+            raise ValueError("truncated column snapshot")
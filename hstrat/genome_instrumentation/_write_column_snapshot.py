@@ -0,0 +1,60 @@
+import typing
+
+from ._HereditaryStratigraphicColumn import HereditaryStratigraphicColumn
+from ._impl import (
+    COLUMN_SNAPSHOT_MAGIC,
+    COLUMN_SNAPSHOT_RECORD_LENGTH,
+    open_column_snapshot,
+)
+
+
+def write_column_snapshot(
+    columns: typing.Iterable[HereditaryStratigraphicColumn],
+    path: str,
+    *,
+    compression: typing.Optional[str] = None,
+    chunk_size: int = 2**20,
+) -> int:
+    """Stream columns to a snapshot file.
+
+    Columns are consumed from columns one at a time and serialized using
+    HereditaryStratigraphicColumn.ToBytes, so columns may be supplied by a
+    generator to write snapshots larger than available memory. Serialized
+    records are buffered and written in chunks.
+
+    Parameters
+    ----------
+    columns : iterable of HereditaryStratigraphicColumn
+        Columns to write.
+    path : str
+        Destination file, which is overwritten if it exists.
+    compression : {"bz2", "gzip", "lzma"}, optional
+        Compression to apply to the snapshot. Default None, no compression.
+    chunk_size : int, optional
+        Approximate number of bytes to buffer between writes. Default 1 MiB.
+
+    Returns
+    -------
+    int
+        Number of columns written.
+
+    See Also
+    --------
+    iter_column_snapshot :
+        Streams columns back out of a snapshot file.
+    """
+    assert chunk_size > 0
+    num_columns = 0
+    with open_column_snapshot(path, "wb", compression) as file:
+        buffer = bytearray(COLUMN_SNAPSHOT_MAGIC)
+        for column in columns:
+            record = column.ToBytes()
+            buffer += COLUMN_SNAPSHOT_RECORD_LENGTH.pack(len(record))
+            buffer += record
+            num_columns += 1
+            if len(buffer) >= chunk_size:
+                file.write(buffer)
+                buffer.clear()
+        file.write(buffer)
+
+    return num_columns
@@ -0,0 +1,345 @@
+from copy import copy
+import typing
+
+import numpy as np
+
+from ..._auxiliary_lib import min_uint_dtype_for_bit_width
+from .._HereditaryStratum import HereditaryStratum
+
+
+class HereditaryStratumOrderedStoreArray:
+    """Interchangeable backing container for HereditaryStratigraphicColumn.
+
+    Stores differentia and deposition ranks of deposited strata in contiguous
+    NumPy arrays instead of keeping HereditaryStratum objects around.
+    Retained strata are stored from most ancient (index 0, front) to most
+    recent (back). Annotations, which are typically sparse, are held
+    separately in a dict keyed by deposition rank. Cloned stores copy the
+    backing buffers wholesale.
+
+    Potentially useful in scenarios where very many columns are kept alive at
+    once (i.e., large populations), where per-stratum Python object overhead
+    would dominate memory use and garbage collection time. Strata requested
+    from the store are reconstituted on demand, so they compare equal to but
+    are not identical to the strata originally deposited.
+
+    The differentia buffer dtype is selected as the narrowest that can hold
+    the stratum_differentia_bit_width of the column using the store, which
+    HereditaryStratigraphicColumn configures via SetDifferentiaBitWidth.
+    Differentia wider than 64 bits are held in an object array.
+    """
+
+    # deposition ranks, from most ancient (index 0, front) to most recent
+    # buffer may have capacity beyond _num_strata_retained
+    _ranks: np.ndarray
+    # differentia, from most ancient (index 0, front) to most recent
+    # buffer may have capacity beyond _num_strata_retained
+    _differentia: np.ndarray
+    # maps rank to annotation, for strata that have an annotation
+    _annotations: typing.Dict[int, typing.Any]
+    # how many entries at the front of the buffers are live
+    _num_strata_retained: int
+    # were deposited strata constructed with their deposition rank stored?
+    # used to faithfully reconstitute strata
+    _strata_store_rank: typing.Optional[bool]
+    # type of deposited strata, used to faithfully reconstitute strata
+    _stratum_t: typing.Type
+
+    def __init__(
+        self: "HereditaryStratumOrderedStoreArray",
+        differentia_bit_width: int = 64,
+        initial_capacity: int = 8,
+    ):
+        """Initialize instance variables.
+
+        Parameters
+        ----------
+        differentia_bit_width : int, optional
+            Bit width of differentia to be stored, used to choose the dtype of
+            the differentia buffer. Default 64.
+        initial_capacity : int, optional
+            How many strata to reserve buffer space for up front. Buffers are
+            grown geometrically as needed. Default 8.
+        """
+        assert initial_capacity > 0
+        self._ranks = np.empty(initial_capacity, dtype=np.int64)
+        self._differentia = np.empty(
+            initial_capacity,
+            dtype=min_uint_dtype_for_bit_width(differentia_bit_width),
+        )
+        self._annotations = {}
+        self._num_strata_retained = 0
+        self._strata_store_rank = None
+        self._stratum_t = HereditaryStratum
+
+    def __eq__(
+        self: "HereditaryStratumOrderedStoreArray",
+        other: "HereditaryStratumOrderedStoreArray",
+    ) -> bool:
+        """Compare for value-wise equality."""
+        return (
+            isinstance(
+                other,
+                self.__class__,
+            )
+            and self._num_strata_retained == other._num_strata_retained
+            and self._strata_store_rank == other._strata_store_rank
+            and self._stratum_t == other._stratum_t
+            and self._annotations == other._annotations
+            and np.array_equal(
+                self._ranks[: self._num_strata_retained],
+                other._ranks[: other._num_strata_retained],
+            )
+            and np.array_equal(
+                self._differentia[: self._num_strata_retained],
+                other._differentia[: other._num_strata_retained],
+            )
+        )
+
+    def SetDifferentiaBitWidth(
+        self: "HereditaryStratumOrderedStoreArray",
+        differentia_bit_width: int,
+    ) -> None:
+        """Select the differentia buffer dtype for the given bit width.
+
+        Must be called before any strata are deposited. Called by
+        HereditaryStratigraphicColumn on construction.
+        """
+        assert self._num_strata_retained == 0
+        self._differentia = np.empty(
+            len(self._differentia),
+            dtype=min_uint_dtype_for_bit_width(differentia_bit_width),
+        )
+
+    def _Reserve(
+        self: "HereditaryStratumOrderedStoreArray",
+        capacity: int,
+    ) -> None:
+        """Ensure buffers can hold at least capacity strata.
+
+        Implementation detail. Grows buffers geometrically to amortize the
+        cost of repeated depositions.
+        """
+        if capacity > len(self._ranks):
+            new_capacity = max(capacity, 2 * len(self._ranks))
+            self._ranks = np.resize(self._ranks, new_capacity)
+            self._differentia = np.resize(self._differentia, new_capacity)
+
+    def DepositStratum(
+        self: "HereditaryStratumOrderedStoreArray",
+        rank: int,
+        stratum: "HereditaryStratum",
+    ) -> None:
+        """Insert a new stratum into the store.
+
+        Parameters
+        ----------
+        rank : int
+            The position of the stratum being deposited within the sequence of
+            strata deposited into the column. Precisely, the number of strata
+            that have been deposited before stratum.
+        stratum : HereditaryStratum
+            The stratum to deposit.
+        """
+        if self._strata_store_rank is None:
+            self._strata_store_rank = stratum.GetDepositionRank() is not None
+            self._stratum_t = type(stratum)
+
+        self._Reserve(self._num_strata_retained + 1)
+        self._ranks[self._num_strata_retained] = rank
+        self._differentia[self._num_strata_retained] = stratum.GetDifferentia()
+        self._num_strata_retained += 1
+
+        annotation = getattr(stratum, "_annotation", None)
+        if annotation is not None:
+            self._annotations[rank] = annotation
+
+    def GetNumStrataRetained(
+        self: "HereditaryStratumOrderedStoreArray",
+    ) -> int:
+        """How many strata are present in the store?
+
+        May be fewer than the number of strata deposited if deletions have
+        occured.
+        """
+        return self._num_strata_retained
+
+    def GetRetainedRanksArray(
+        self: "HereditaryStratumOrderedStoreArray",
+    ) -> np.ndarray:
+        """Get read-only view of retained deposition ranks, ascending.
+
+        The view may be invalidated by subsequent deposition or deletion.
+        """
+        res = self._ranks[: self._num_strata_retained]
+        res.flags.writeable = False
+        return res
+
+    def GetRetainedDifferentiaArray(
+        self: "HereditaryStratumOrderedStoreArray",
+    ) -> np.ndarray:
+        """Get read-only view of retained differentia.
+
+        Ordered from most ancient to most recent, corresponding to
+        GetRetainedRanksArray. The view may be invalidated by subsequent
+        deposition or deletion.
+        """
+        res = self._differentia[: self._num_strata_retained]
+        res.flags.writeable = False
+        return res
+
+    def GetStratumAtColumnIndex(
+        self: "HereditaryStratumOrderedStoreArray",
+        index: int,
+        # needed for other implementations
+        get_rank_at_column_index: typing.Optional[typing.Callable] = None,
+    ) -> HereditaryStratum:
+        """Get the stratum positioned at index i among retained strata.
+
+        Index order is from most ancient (index 0) to most recent. Returned
+        stratum is reconstituted from stored data.
+
+        Parameters
+        ----------
+        index : int
+            The column index of the stratum to retrieve.
+        get_rank_at_column_index : callable, optional
+            Callable that returns the deposition rank of the stratum positioned
+            at index i among retained strata. Not used in this method.
+        """
+        if index < 0:
+            index += self._num_strata_retained
+        if not 0 <= index < self._num_strata_retained:
+            raise IndexError(index)
+
+        rank = self.GetRankAtColumnIndex(index)
+        return self._stratum_t(
+            annotation=self._annotations.get(rank),
+            deposition_rank=rank if self._strata_store_rank else None,
+            differentia=int(self._differentia[index]),
+        )
+
+    def GetRankAtColumnIndex(
+        self: "HereditaryStratumOrderedStoreArray",
+        index: int,
+    ) -> int:
+        """Map from deposition generation to column position.
+
+        What is the deposition rank of the stratum positioned at index i
+        among retained strata? Index order is from most ancient (index 0) to
+        most recent.
+        """
+        assert index < self._num_strata_retained
+        return int(self._ranks[index])
+
+    def GetColumnIndexOfRank(
+        self: "HereditaryStratumOrderedStoreArray",
+        rank: int,
+    ) -> typing.Optional[int]:
+        """Map from column position to deposition generation
+
+        What is the index position within retained strata of the stratum
+        deposited at rank r? Returns None if no stratum with rank r is present
+        within the store.
+        """
+        live_ranks = self._ranks[: self._num_strata_retained]
+        res_idx = int(np.searchsorted(live_ranks, rank))
+        if res_idx < self._num_strata_retained and live_ranks[res_idx] == rank:
+            return res_idx
+        else:
+            return None
+
+    def DelRanks(
+        self: "HereditaryStratumOrderedStoreArray",
+        ranks: typing.Iterator[int],
+        # needed for other implementations
+        get_column_index_of_rank: typing.Optional[typing.Callable] = None,
+    ) -> None:
+        """Purge strata with specified deposition ranks from the store.
+
+        Parameters
+        ----------
+        ranks : iterator over int
+            The ranks that to be deleted.
+        get_column_index_of_rank : callable, optional
+            Callable that returns the index position within retained strata of
+            the stratum deposited at rank r. Not used in this method, because
+            deposition ranks are always stored.
+        """
+        ranks = [*ranks]
+        if not ranks:
+            return
+
+        live_ranks = self._ranks[: self._num_strata_retained]
+        indices = np.searchsorted(live_ranks, ranks)
+        assert np.array_equal(live_ranks[indices], ranks)
+
+        keep = np.ones(self._num_strata_retained, dtype=bool)
+        keep[indices] = False
+        num_kept = self._num_strata_retained - len(indices)
+        # compact in place, preserving any extra buffer capacity
+        self._ranks[:num_kept] = live_ranks[keep]
+        self._differentia[:num_kept] = self._differentia[
+            : self._num_strata_retained
+        ][keep]
+        self._num_strata_retained = num_kept
+
+        for rank in ranks:
+            self._annotations.pop(rank, None)
+
+    def IterRetainedRanks(
+        self: "HereditaryStratumOrderedStoreArray",
+    ) -> typing.Iterator[int]:
+        """Iterate over deposition ranks of strata present in the store.
+
+        Order of iteration should not be considered guaranteed. The store may
+        be altered during iteration without iterator invalidation, although
+        subsequent updates will not be reflected in the iterator.
+        """
+        # tolist makes a copy, preventing invalidation when strata are deleted
+        yield from self._ranks[: self._num_strata_retained].tolist()
+
+    def IterRankDifferentia(
+        self: "HereditaryStratumOrderedStoreArray",
+        # needed for other implementations
+        get_rank_at_column_index: typing.Optional[typing.Callable] = None,
+        start_column_index: int = 0,
+    ) -> typing.Iterator[typing.Tuple[int, int]]:
+        """Iterate over differentia and corresponding deposition ranks.
+
+        Values yielded as tuples. Guaranteed ordered from most ancient to most
+        recent.
+
+        Parameters
+        ----------
+        get_rank_at_column_index : callable, optional
+            Callable that returns the deposition rank of the stratum positioned
+            at index i among retained strata. Not used in this method, because
+            deposition ranks are always stored.
+        start_column_index : callable, optional
+            Number of strata to skip over before yielding first result from the
+            iterator. Default 0, meaning no strata are skipped over.
+        """
+        stop = self._num_strata_retained
+        yield from zip(
+            self._ranks[start_column_index:stop].tolist(),
+            self._differentia[start_column_index:stop].tolist(),
+        )
+
+    def Clone(
+        self: "HereditaryStratumOrderedStoreArray",
+    ) -> "HereditaryStratumOrderedStoreArray":
+        """Create an independent copy of the store.
+
+        Returned copy contains identical data but may be freely altered without
+        affecting data within this store.
+        """
+        # shallow copy
+        result = copy(self)
+        # do semi-shallow clone on select elements
+        # buffers are copied wholesale, with headroom for one deposition
+        num_copied = self._num_strata_retained + 1
+        result._ranks = np.resize(self._ranks, num_copied)
+        result._differentia = np.resize(self._differentia, num_copied)
+        result._annotations = self._annotations.copy()
+        return result
@@ -14,14 +14,45 @@ class HereditaryStratumOrderedStoreDict:
 
     Potentially useful in scenarios where large strata counts are retained or
     deleted strata tend to be more ancient.
+
+    In copy-on-write mode, cloned stores instead share a common prefix of
+    strata held in a dict that is never altered in place, except to insert
+    more recent strata at its end. Each store keeps strata deposited since it
+    was last cloned in an owned dict. Deleting a stratum within the shared
+    prefix materializes only shared strata from that stratum onward into the
+    owned dict.
     """
 
+    # should clones share strata with this store until altered?
+    _copy_on_write: bool
     # maps rank to stratum
+    # retained strata are the first _num_shared_strata items of _shared_data
+    # followed by the items of _data
     _data: typing.Dict[int, HereditaryStratum]
+    # may be shared with other stores, so items must not be altered in place
+    # (although items may be inserted at its end)
+    _shared_data: typing.Dict[int, HereditaryStratum]
+    _num_shared_strata: int
+    # all ranks in _data are greater than those retained from _shared_data
+    _max_shared_rank: int
+
+    def __init__(
+        self: "HereditaryStratumOrderedStoreDict",
+        copy_on_write: bool = False,
+    ):
+        """Initialize instance variables.
 
-    def __init__(self: "HereditaryStratumOrderedStoreDict"):
-        """Initialize instance variables."""
+        Parameters
+        ----------
+        copy_on_write : bool, optional
+            Should cloned stores share retained strata until altered, rather
+            than copying them? Default False.
+        """
+        self._copy_on_write = copy_on_write
         self._data = {}
+        self._shared_data = {}
+        self._num_shared_strata = 0
+        self._max_shared_rank = -1
 
     def __eq__(
         self: "HereditaryStratumOrderedStoreDict",
@@ -33,9 +64,65 @@ class HereditaryStratumOrderedStoreDict:
                 other,
                 self.__class__,
             )
-            and self.__dict__ == other.__dict__
+            and self._copy_on_write == other._copy_on_write
+            and self.GetNumStrataRetained() == other.GetNumStrataRetained()
+            and all(
+                a == b for a, b in zip(self._IterItems(), other._IterItems())
+            )
         )
 
+    def _IterItems(
+        self: "HereditaryStratumOrderedStoreDict",
+    ) -> typing.Iterator[typing.Tuple[int, HereditaryStratum]]:
+        """Iterate over retained ranks and strata, most ancient first."""
+        # for python 3.7+, dictionaries are guaranteed insertion ordered
+        assert sys.version_info >= (3, 7)
+        if self._num_shared_strata == 0:
+            # fast path, no shared strata to look through
+            return iter(self._data.items())
+        return it.chain(
+            it.islice(self._shared_data.items(), self._num_shared_strata),
+            self._data.items(),
+        )
+
+    def _GetStratumOfRank(
+        self: "HereditaryStratumOrderedStoreDict",
+        rank: int,
+    ) -> HereditaryStratum:
+        """Get the retained stratum deposited at rank r."""
+        if rank > self._max_shared_rank:
+            return self._data[rank]
+        else:
+            return self._shared_data[rank]
+
+    def _MaterializeShared(
+        self: "HereditaryStratumOrderedStoreDict",
+        rank: int,
+    ) -> None:
+        """Move shared strata from rank r onward into owned data."""
+        if rank > self._max_shared_rank:
+            return
+
+        num_shared_strata = 0
+        max_shared_rank = -1
+        materialized = {}
+        for rank_, stratum in it.islice(
+            self._shared_data.items(), self._num_shared_strata
+        ):
+            if rank_ < rank:
+                num_shared_strata += 1
+                max_shared_rank = rank_
+            else:
+                materialized[rank_] = stratum
+
+        materialized.update(self._data)
+        self._data = materialized
+        self._num_shared_strata = num_shared_strata
+        self._max_shared_rank = max_shared_rank
+        if num_shared_strata == 0:
+            # release reference to shared data
+            self._shared_data = {}
+
     def DepositStratum(
         self: "HereditaryStratumOrderedStoreDict",
         rank: int,
@@ -58,7 +145,7 @@ class HereditaryStratumOrderedStoreDict:
         May be fewer than the number of strata deposited if deletions have
         occured.
         """
-        return len(self._data)
+        return self._num_shared_strata + len(self._data)
 
     def GetStratumAtColumnIndex(
         self: "HereditaryStratumOrderedStoreDict",
@@ -78,11 +165,9 @@ class HereditaryStratumOrderedStoreDict:
             the stratum deposited at rank r.
         """
         if get_rank_at_column_index is not None:
-            return self._data[get_rank_at_column_index(index)]
+            return self._GetStratumOfRank(get_rank_at_column_index(index))
         else:
-            # for python 3.7+, dictionaries are guaranteed insertion ordered
-            assert sys.version_info >= (3, 7)
-            return next(it.islice(self._data.values(), index, None))
+            return next(it.islice(self._IterItems(), index, None))[1]
 
     def GetRankAtColumnIndex(
         self: "HereditaryStratumOrderedStoreDict",
@@ -94,9 +179,7 @@ class HereditaryStratumOrderedStoreDict:
         among retained strata? Index order is from most ancient (index 0) to
         most recent.
         """
-        # for python 3.7+, dictionaries are guaranteed insertion ordered
-        assert sys.version_info >= (3, 7)
-        return next(it.islice(self._data.keys(), index, None))
+        return next(it.islice(self._IterItems(), index, None))[0]
 
     def GetColumnIndexOfRank(
         self: "HereditaryStratumOrderedStoreDict",
@@ -108,12 +191,10 @@ class HereditaryStratumOrderedStoreDict:
         deposited at rank r? Returns None if no stratum with rank r is present
         within the store.
         """
-        # for python 3.7+, dictionaries are guaranteed insertion ordered
-        assert sys.version_info >= (3, 7)
         try:
             return next(
                 idx
-                for idx, rank_ in enumerate(self._data.keys())
+                for idx, (rank_, __) in enumerate(self._IterItems())
                 if rank_ == rank
             )
         except StopIteration:
@@ -135,6 +216,10 @@ class HereditaryStratumOrderedStoreDict:
             Callable that returns the deposition rank of the stratum positioned
             at index i among retained strata. Not used in this method.
         """
+        ranks = [*ranks]
+        if ranks:
+            # only shared strata from deepest deletion onward are copied
+            self._MaterializeShared(min(ranks))
         for rank in ranks:
             del self._data[rank]
 
@@ -151,7 +236,7 @@ class HereditaryStratumOrderedStoreDict:
         # `RuntimeError: dictionary changed size during iteration`
         # note, however, that copy is made lazily
         # (only when first item requested)
-        yield from list(self._data.keys())
+        yield from [rank for rank, __ in self._IterItems()]
 
     def IterRankDifferentia(
         self: "HereditaryStratumOrderedStoreDict",
@@ -178,7 +263,7 @@ class HereditaryStratumOrderedStoreDict:
         # from a specified item in the dict?
         # current method must iterate past skipped over items
         # adapted from https://stackoverflow.com/a/12911454
-        iter_ = it.islice(self._data.items(), start_column_index, None)
+        iter_ = it.islice(self._IterItems(), start_column_index, None)
         for rank, stratum in iter_:
             yield (rank, stratum.GetDifferentia())
 
@@ -190,9 +275,37 @@ class HereditaryStratumOrderedStoreDict:
         Returned copy contains identical data but may be freely altered without
         affecting data within this store.
         """
+        if self._copy_on_write:
+            # fold owned data into shared data, then share it with result
+            if self._data:
+                if self._num_shared_strata != len(self._shared_data):
+                    self._shared_data = dict(
+                        it.islice(
+                            self._shared_data.items(), self._num_shared_strata
+                        )
+                    )
+                # other stores only view shared data up to their own shared
+                # strata count and owned ranks are more recent than any
+                # shared rank, so inserting in place is safe
+                self._shared_data.update(self._data)
+                self._num_shared_strata = len(self._shared_data)
+                self._max_shared_rank = max(self._data)
+                self._data = {}
+
+            # shallow copy
+            result = copy(self)
+            result._data = {}
+            return result
+
         # shallow copy
         result = copy(self)
         # do semi-shallow clone on select elements
         # see https://stackoverflow.com/a/5861653 for performance consierations
-        result._data = self._data.copy()
+        if self._num_shared_strata == 0:
+            result._data = self._data.copy()
+        else:
+            result._data = dict(self._IterItems())
+        result._shared_data = {}
+        result._num_shared_strata = 0
+        result._max_shared_rank = -1
         return result
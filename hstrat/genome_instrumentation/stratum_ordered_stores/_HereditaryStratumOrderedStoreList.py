@@ -1,4 +1,5 @@
 from copy import copy
+import itertools as it
 import typing
 
 from interval_search import binary_search
@@ -14,6 +15,14 @@ class HereditaryStratumOrderedStoreList:
     stores instantiate an independent list (although strata are not deepcopied
     themselves).
 
+    In copy-on-write mode, cloned stores instead share a common prefix of
+    strata held in a list that is never altered in place, except to extend it
+    at its end. Each store keeps strata deposited since it was last cloned in
+    an owned list. Deleting a stratum within the shared prefix materializes
+    only the suffix of the prefix from that stratum onward into the owned
+    list. So, cloning a store and then depositing and purging recent strata
+    does not require copying all retained strata.
+
     Potentially useful in scenarios where moderate strata counts are retained,
     many strata are deposited without column cloning, deleted strata tend to
     be more recent (i.e., not more ancient and toward the front of the list),
@@ -21,12 +30,33 @@ class HereditaryStratumOrderedStoreList:
     between stratigraphic columns.
     """
 
+    # should clones share strata with this store until altered?
+    _copy_on_write: bool
     # strata stored from most ancient (index 0, front) to most recent (back)
+    # retained strata are the first _num_shared_strata elements of
+    # _shared_data followed by the elements of _data
     _data: typing.List[HereditaryStratum]
+    # may be shared with other stores, so elements must not be altered in
+    # place (although the list may be extended at its end)
+    _shared_data: typing.List[HereditaryStratum]
+    _num_shared_strata: int
+
+    def __init__(
+        self: "HereditaryStratumOrderedStoreList",
+        copy_on_write: bool = False,
+    ):
+        """Initialize instance variables.
 
-    def __init__(self: "HereditaryStratumOrderedStoreList"):
-        """Initialize instance variables."""
+        Parameters
+        ----------
+        copy_on_write : bool, optional
+            Should cloned stores share retained strata until altered, rather
+            than copying them? Default False.
+        """
+        self._copy_on_write = copy_on_write
         self._data = []
+        self._shared_data = []
+        self._num_shared_strata = 0
 
     def __eq__(
         self: "HereditaryStratumOrderedStoreList",
@@ -38,9 +68,44 @@ class HereditaryStratumOrderedStoreList:
                 other,
                 self.__class__,
             )
-            and self.__dict__ == other.__dict__
+            and self._copy_on_write == other._copy_on_write
+            and self.GetNumStrataRetained() == other.GetNumStrataRetained()
+            and all(
+                a == b for a, b in zip(self._IterStrata(), other._IterStrata())
+            )
+        )
+
+    def _IterStrata(
+        self: "HereditaryStratumOrderedStoreList",
+        start_column_index: int = 0,
+    ) -> typing.Iterator[HereditaryStratum]:
+        """Iterate over retained strata from most ancient to most recent."""
+        num_shared = self._num_shared_strata
+        return it.chain(
+            it.islice(
+                self._shared_data,
+                min(start_column_index, num_shared),
+                num_shared,
+            ),
+            it.islice(
+                self._data, max(start_column_index - num_shared, 0), None
+            ),
         )
 
+    def _MaterializeShared(
+        self: "HereditaryStratumOrderedStoreList",
+        index: int,
+    ) -> None:
+        """Move shared strata from column index i onward into owned data."""
+        if index < self._num_shared_strata:
+            self._data = (
+                self._shared_data[index : self._num_shared_strata] + self._data
+            )
+            self._num_shared_strata = index
+            if index == 0:
+                # release reference to shared data
+                self._shared_data = []
+
     def DepositStratum(
         self: "HereditaryStratumOrderedStoreList",
         rank: int,
@@ -63,7 +128,7 @@ class HereditaryStratumOrderedStoreList:
         May be fewer than the number of strata deposited if deletions have
         occured.
         """
-        return len(self._data)
+        return self._num_shared_strata + len(self._data)
 
     def GetStratumAtColumnIndex(
         self: "HereditaryStratumOrderedStoreList",
@@ -83,7 +148,12 @@ class HereditaryStratumOrderedStoreList:
             Callable that returns the index position within retained strata of
             the stratum deposited at rank r.
         """
-        return self._data[index]
+        if index < 0:
+            index += self.GetNumStrataRetained()
+        if index < self._num_shared_strata:
+            return self._shared_data[index]
+        else:
+            return self._data[index - self._num_shared_strata]
 
     def GetRankAtColumnIndex(
         self: "HereditaryStratumOrderedStoreList",
@@ -144,13 +214,17 @@ class HereditaryStratumOrderedStoreList:
             get_column_index_of_rank = self.GetColumnIndexOfRank
 
         indices = [get_column_index_of_rank(rank) for rank in ranks]
+        if not indices:
+            return
+        assert None not in indices
+        # only the suffix of shared strata affected by deletion is copied
+        self._MaterializeShared(min(indices))
         # adapted from https://stackoverflow.com/a/11303234/17332200
         # iterate over indices in reverse order to prevent invalidation
         # reversed() is an potential optimization
         # given indices is assumed to be in ascending order
         for index in sorted(reversed(indices), reverse=True):
-            assert index is not None
-            del self._data[index]
+            del self._data[index - self._num_shared_strata]
 
     def IterRetainedRanks(
         self: "HereditaryStratumOrderedStoreList",
@@ -164,7 +238,7 @@ class HereditaryStratumOrderedStoreList:
         # must make copy to prevent invalidation when strata are deleted
         # note, however, that copy is made lazily
         # (only when first item requested)
-        ranks = [stratum.GetDepositionRank() for stratum in self._data]
+        ranks = [stratum.GetDepositionRank() for stratum in self._IterStrata()]
         for rank in ranks:
             assert rank is not None
             yield rank
@@ -192,10 +266,24 @@ class HereditaryStratumOrderedStoreList:
         if get_rank_at_column_index is None:
             get_rank_at_column_index = self.GetRankAtColumnIndex
 
-        # adapted from https://stackoverflow.com/a/12911454
-        for index in range(start_column_index, len(self._data)):
-            stratum = self._data[index]
-            yield (get_rank_at_column_index(index), stratum.GetDifferentia())
+        if self._num_shared_strata == 0:
+            # fast path, no shared strata to look through
+            # adapted from https://stackoverflow.com/a/12911454
+            for index in range(start_column_index, len(self._data)):
+                stratum = self._data[index]
+                yield (
+                    get_rank_at_column_index(index),
+                    stratum.GetDifferentia(),
+                )
+        else:
+            for index, stratum in enumerate(
+                self._IterStrata(start_column_index),
+                start=start_column_index,
+            ):
+                yield (
+                    get_rank_at_column_index(index),
+                    stratum.GetDifferentia(),
+                )
 
     def Clone(
         self: "HereditaryStratumOrderedStoreList",
@@ -205,9 +293,34 @@ class HereditaryStratumOrderedStoreList:
         Returned copy contains identical data but may be freely altered without
         affecting data within this store.
         """
+        if self._copy_on_write:
+            # fold owned data into shared data, then share it with result
+            if self._data:
+                if self._num_shared_strata == len(self._shared_data):
+                    # other stores only view shared data up to their own
+                    # shared strata count, so extending in place is safe
+                    self._shared_data.extend(self._data)
+                else:
+                    self._shared_data = (
+                        self._shared_data[: self._num_shared_strata]
+                        + self._data
+                    )
+                self._num_shared_strata = len(self._shared_data)
+                self._data = []
+
+            # shallow copy
+            result = copy(self)
+            result._data = []
+            return result
+
         # shallow copy
         result = copy(self)
         # do semi-shallow clone on select elements
         # see https://stackoverflow.com/a/47859483 for performance consierations
-        result._data = [*self._data]
+        if self._num_shared_strata == 0:
+            result._data = [*self._data]
+        else:
+            result._data = [*self._IterStrata()]
+        result._shared_data = []
+        result._num_shared_strata = 0
         return result
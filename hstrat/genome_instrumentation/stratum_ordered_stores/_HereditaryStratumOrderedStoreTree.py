@@ -1,30 +1,83 @@
 from copy import copy
-import itertools as it
 import typing
 
-import anytree
-
-from ..._auxiliary_lib import AnyTreeAscendingIter
 from .._HereditaryStratum import HereditaryStratum
 
 
+class _Node:
+    """Immutable cell of a persistent, parent-linked list of strata.
+
+    Nodes hold no references to their children, so nodes no longer reachable
+    from any store's leaf are reclaimed by reference counting.
+    """
+
+    __slots__ = ("stratum", "parent", "column_index", "jump")
+
+    stratum: HereditaryStratum
+    # next most ancient node, None for root
+    parent: typing.Optional["_Node"]
+    # number of nodes between self and root
+    column_index: int
+    # skip pointer to an ancestor node, None for root
+    jump: typing.Optional["_Node"]
+
+    def __init__(
+        self: "_Node",
+        stratum: HereditaryStratum,
+        parent: typing.Optional["_Node"],
+    ) -> None:
+        """Create a node holding stratum as a child of parent.
+
+        Sets up the new node's column index and skip pointer. The root node's
+        skip pointer is None, standing in for a pointer to itself.
+        """
+        self.stratum = stratum
+        self.parent = parent
+        if parent is None:
+            self.column_index = 0
+            self.jump = None
+            return
+
+        self.column_index = parent.column_index + 1
+        # skew-binary skip pointers, after Myers (1983)
+        # if parent and its skip target span equal distances, skip over both;
+        # otherwise, skip to parent
+        parent_jump = parent if parent.jump is None else parent.jump
+        parent_jump_jump = (
+            parent_jump if parent_jump.jump is None else parent_jump.jump
+        )
+        if (
+            parent.column_index - parent_jump.column_index
+            == parent_jump.column_index - parent_jump_jump.column_index
+        ):
+            self.jump = parent_jump_jump
+        else:
+            self.jump = parent
+
+
 class HereditaryStratumOrderedStoreTree:
     """Interchangeable backing container for HereditaryStratigraphicColumn.
 
     Stores deposited strata as a linked tree. Retained strata pertinent to the
     store are essentially a linear linked list reaching from tree leaf (most
-    recent stratum) back to the tree root (most ancient stratum). Cloned stores
-    directly share common components of the tree and then branch out different
-    leaves as subsequent strata are deposited. Stratum deletion results in the
+    recent stratum) back to the tree root (most ancient stratum). Nodes only
+    link to their parent and are never modified after creation, so cloned
+    stores directly share common components of the tree and then branch out
+    different leaves as subsequent strata are deposited. Stratum deletion results in the
     entire strata sequence more recent than the deleted stratum being copied
     into an independent branch for the store that requested the deletion.
 
     Potentially useful in scenarios where stratum deletions are uncommon (i.e.,
     the perfect resolution stratum retention policy) or column cloning occurs heavily without much stratum deposition.
+
+    Each node records its column index and a skip pointer to an ancestor node,
+    arranged in a skew-binary pattern so that any ancestor can be reached in
+    O(log n) hops. Skip pointers depend only on a node's ancestors, so they are
+    shared between stores along with the nodes themselves.
     """
 
     # strata stored in a tree with most ancient as root and most recent as leaf
-    _leaf: anytree.AnyNode  # will contain HereditaryStratum
+    _leaf: typing.Optional[_Node]
     # maintaining a counter is much more efficient than counting steps from leaf
     # to root
     _num_strata_retained: int
@@ -34,26 +87,6 @@ class HereditaryStratumOrderedStoreTree:
         self._leaf = None
         self._num_strata_retained = 0
 
-    def __del__(self: "HereditaryStratumOrderedStoreTree"):
-        """Destruct the store.
-
-        Releases resources no longer needed by this store that are needed by no
-        other stores.
-
-        anytree uses bidirectional references between nodes so manual pruning
-        is necessary because garbage collection won't recognize unused nodes as
-        fully unreachable.
-        """
-        # delete all nodes that only lead to this store's leaf
-        for node in self._GetAscendingIter():
-            if sum(1 for __ in zip(node.children, range(2))) == 2:
-                # if node has more than one child, stop deleting
-                break
-            else:
-                # delete and keep ascending
-                node.parent = None
-                del node
-
     def __eq__(
         self: "HereditaryStratumOrderedStoreTree",
         other: "HereditaryStratumOrderedStoreTree",
@@ -69,9 +102,29 @@ class HereditaryStratumOrderedStoreTree:
 
     def _GetAscendingIter(
         self: "HereditaryStratumOrderedStoreTree",
-    ) -> typing.Iterator[anytree.AnyNode]:
+    ) -> typing.Iterator[_Node]:
         """Iterate over retained strata from most recent to most ancient."""
-        return AnyTreeAscendingIter(self._leaf)
+        node = self._leaf
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def _GetNodeAtColumnIndex(
+        self: "HereditaryStratumOrderedStoreTree",
+        index: int,
+    ) -> _Node:
+        """Find the node positioned at index i among retained strata.
+
+        Follows skip pointers from the leaf, taking O(log n) steps.
+        """
+        assert 0 <= index < self.GetNumStrataRetained()
+        node = self._leaf
+        while node.column_index != index:
+            if node.jump.column_index >= index:
+                node = node.jump
+            else:
+                node = node.parent
+        return node
 
     def DepositStratum(
         self: "HereditaryStratumOrderedStoreTree",
@@ -89,9 +142,7 @@ class HereditaryStratumOrderedStoreTree:
         stratum : HereditaryStratum
             The stratum to deposit.
         """
-        new_leaf = anytree.AnyNode(stratum=stratum)
-        new_leaf.parent = self._leaf
-        self._leaf = new_leaf
+        self._leaf = _Node(stratum, self._leaf)
         self._num_strata_retained += 1
 
     def GetNumStrataRetained(self: "HereditaryStratumOrderedStoreTree") -> int:
@@ -120,13 +171,7 @@ class HereditaryStratumOrderedStoreTree:
             Callable that returns the index position within retained strata of
             the stratum deposited at rank r.
         """
-        return next(
-            it.islice(
-                self._GetAscendingIter(),
-                self.GetNumStrataRetained() - 1 - index,
-                None,
-            )
-        ).stratum
+        return self._GetNodeAtColumnIndex(index).stratum
 
     def GetRankAtColumnIndex(
         self: "HereditaryStratumOrderedStoreTree",
@@ -151,13 +196,23 @@ class HereditaryStratumOrderedStoreTree:
         deposited at rank r? Returns None if no stratum with rank r is present
         within the store.
         """
-        try:
-            return next(
-                self.GetNumStrataRetained() - 1 - idx
-                for idx, node in enumerate(self._GetAscendingIter())
-                if node.stratum.GetDepositionRank() == rank
-            )
-        except StopIteration:
+        if self._leaf is None:
+            return None
+
+        # deposition ranks strictly increase from root to leaf,
+        # so descend via skip pointers while staying at or above rank
+        node = self._leaf
+        while node.stratum.GetDepositionRank() > rank:
+            if node.parent is None:
+                return None
+            elif node.jump.stratum.GetDepositionRank() >= rank:
+                node = node.jump
+            else:
+                node = node.parent
+
+        if node.stratum.GetDepositionRank() == rank:
+            return node.column_index
+        else:
             return None
 
     def _do_getrank_DelRanks(
@@ -171,9 +226,8 @@ class HereditaryStratumOrderedStoreTree:
         """
         # duplicate everything after deepest deletion
         # except other ranks slated for deletion
-        pending_node = (
-            None  # top of new chain, needs to be attached to a parent
-        )
+        # (column indices and skip pointers of copied nodes change)
+        copied_strata = []  # ordered most recent to most ancient
 
         ascending_iter = self._GetAscendingIter()
         target_ranks = sorted(ranks)
@@ -186,21 +240,14 @@ class HereditaryStratumOrderedStoreTree:
                 target_ranks.pop()
                 self._num_strata_retained -= 1
             else:
-                # copy untargeted node and use it as parent for pending node
-                new_node = anytree.AnyNode(
-                    stratum=cur_node.stratum,
-                )
-                if pending_node is None:
-                    self._leaf = new_node
-                else:
-                    pending_node.parent = new_node
-                pending_node = new_node
+                # copy untargeted node
+                copied_strata.append(cur_node.stratum)
 
         # hook copied content into existing tree
-        if pending_node is not None:
-            pending_node.parent = next(ascending_iter, None)
-        else:
-            self._leaf = next(ascending_iter, None)
+        new_leaf = next(ascending_iter, None)
+        for stratum in reversed(copied_strata):
+            new_leaf = _Node(stratum, new_leaf)
+        self._leaf = new_leaf
 
     def _do_calcrank_DelRanks(
         self: "HereditaryStratumOrderedStoreTree",
@@ -215,13 +262,11 @@ class HereditaryStratumOrderedStoreTree:
         """
         # duplicate everything after deepest deletion
         # except other ranks slated for deletion
+        # (column indices and skip pointers of copied nodes change)
 
-        pending_node = (
-            None  # top of new chain, needs to be attached to a parent
-        )
-        pending_leaf = None  # bottom of new chain
+        copied_strata = []  # ordered most recent to most ancient
         num_deleted_nodes = 0
-        # RE: pending_leaf, num_deleted_nodes
+        # RE: copied_strata, num_deleted_nodes
         # get_column_index_of_rank can depend on state of this object
         # so we have to cache changes and apply all at once at the end
 
@@ -239,32 +284,23 @@ class HereditaryStratumOrderedStoreTree:
                     # don't copy node targeted for deletion
                     num_deleted_nodes += 1
                 else:
-                    # copy untargeted node and use it as parent for pending node
-                    new_node = anytree.AnyNode(
-                        stratum=cur_node.stratum,
-                    )
-                    if pending_node is None:
-                        pending_leaf = new_node
-                    else:
-                        pending_node.parent = new_node
-                    pending_node = new_node
+                    # copy untargeted node
+                    copied_strata.append(cur_node.stratum)
 
                 # step backward
                 ascending_idx -= 1
 
             assert ascending_idx == target_idx - 1
 
-        # hook copied content into existing tree
-        if pending_node is not None:
-            pending_node.parent = next(ascending_iter, None)
-        else:
-            assert pending_leaf is None
-            pending_leaf = next(ascending_iter, None)
-        # attach self to new copied chain
-        if pending_leaf is not None:
-            self._leaf = pending_leaf
-        # apply cached changes to stratum count
-        self._num_strata_retained -= num_deleted_nodes
+        if num_deleted_nodes:
+            # hook copied content into existing tree
+            new_leaf = next(ascending_iter, None)
+            for stratum in reversed(copied_strata):
+                new_leaf = _Node(stratum, new_leaf)
+            # attach self to new copied chain
+            self._leaf = new_leaf
+            # apply cached changes to stratum count
+            self._num_strata_retained -= num_deleted_nodes
 
     def DelRanks(
         self: "HereditaryStratumOrderedStoreTree",
@@ -367,11 +403,5 @@ class HereditaryStratumOrderedStoreTree:
         affecting data within this store.
         """
         # shallow copy
-        res = copy(self)
-        # must create independent leaf
-        if self._leaf is not None:
-            res._leaf = anytree.AnyNode(
-                stratum=self._leaf.stratum,
-            )
-            res._leaf.parent = self._leaf.parent
-        return res
+        # nodes are immutable, so the entire chain including leaf can be shared
+        return copy(self)
@@ -1,5 +1,8 @@
 """Strata storage implementations for use with HereditaryStratigraphicColumn."""
 
+from ._HereditaryStratumOrderedStoreArray import (
+    HereditaryStratumOrderedStoreArray,
+)
 from ._HereditaryStratumOrderedStoreDict import (
     HereditaryStratumOrderedStoreDict,
 )
@@ -12,6 +15,7 @@ from ._HereditaryStratumOrderedStoreTree import (
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
+    "HereditaryStratumOrderedStoreArray",
     "HereditaryStratumOrderedStoreDict",
     "HereditaryStratumOrderedStoreList",
     "HereditaryStratumOrderedStoreTree",
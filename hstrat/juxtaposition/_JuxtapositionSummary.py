@@ -0,0 +1,111 @@
+import typing
+
+
+class JuxtapositionSummary:
+    """Comparison statistics between two columns at a confidence level.
+
+    Bundles results of several juxtaposition functions so they can be
+    computed together in a single pass over both columns. Construct via
+    summarize_juxtaposition_between.
+    """
+
+    __slots__ = (
+        "_confidence_level",
+        "_rank_of_earliest_detectable_mrca",
+        "_rank_of_first_retained_disparity",
+        "_definitive_max_rank_of_first_retained_disparity",
+        "_rank_of_last_retained_commonality",
+    )
+
+    _confidence_level: float
+    _rank_of_earliest_detectable_mrca: typing.Optional[int]
+    _rank_of_first_retained_disparity: typing.Optional[int]
+    _definitive_max_rank_of_first_retained_disparity: typing.Optional[int]
+    _rank_of_last_retained_commonality: typing.Optional[int]
+
+    def __init__(
+        self: "JuxtapositionSummary",
+        *,
+        confidence_level: float,
+        rank_of_earliest_detectable_mrca: typing.Optional[int],
+        rank_of_first_retained_disparity: typing.Optional[int],
+        definitive_max_rank_of_first_retained_disparity: typing.Optional[int],
+        rank_of_last_retained_commonality: typing.Optional[int],
+    ) -> None:
+        """Initialize from precomputed statistics."""
+        self._confidence_level = confidence_level
+        self._rank_of_earliest_detectable_mrca = (
+            rank_of_earliest_detectable_mrca
+        )
+        self._rank_of_first_retained_disparity = (
+            rank_of_first_retained_disparity
+        )
+        self._definitive_max_rank_of_first_retained_disparity = (
+            definitive_max_rank_of_first_retained_disparity
+        )
+        self._rank_of_last_retained_commonality = (
+            rank_of_last_retained_commonality
+        )
+
+    def __eq__(
+        self: "JuxtapositionSummary",
+        other: typing.Any,
+    ) -> bool:
+        """Compare for value-wise equality."""
+        return isinstance(other, self.__class__) and all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.__slots__
+        )
+
+    def __repr__(self: "JuxtapositionSummary") -> str:
+        return f"""{
+            JuxtapositionSummary.__qualname__
+        }({
+            ', '.join(
+                f'{attr[1:]}={getattr(self, attr)}' for attr in self.__slots__
+            )
+        })"""
+
+    def GetConfidenceLevel(self: "JuxtapositionSummary") -> float:
+        """Get confidence level statistics were calculated at."""
+        return self._confidence_level
+
+    def GetRankOfEarliestDetectableMrca(
+        self: "JuxtapositionSummary",
+    ) -> typing.Optional[int]:
+        """Get result of calc_rank_of_earliest_detectable_mrca_between."""
+        return self._rank_of_earliest_detectable_mrca
+
+    def GetRankOfFirstRetainedDisparity(
+        self: "JuxtapositionSummary",
+    ) -> typing.Optional[int]:
+        """Get result of calc_rank_of_first_retained_disparity_between."""
+        return self._rank_of_first_retained_disparity
+
+    def GetDefinitiveMaxRankOfFirstRetainedDisparity(
+        self: "JuxtapositionSummary",
+    ) -> typing.Optional[int]:
+        """Get result of
+        calc_definitive_max_rank_of_first_retained_disparity_between."""
+        return self._definitive_max_rank_of_first_retained_disparity
+
+    def GetRankOfLastRetainedCommonality(
+        self: "JuxtapositionSummary",
+    ) -> typing.Optional[int]:
+        """Get result of calc_rank_of_last_retained_commonality_between."""
+        return self._rank_of_last_retained_commonality
+
+    def DoesHaveAnyCommonAncestor(
+        self: "JuxtapositionSummary",
+    ) -> typing.Optional[bool]:
+        """Get result of does_have_any_common_ancestor.
+
+        Returns None if insufficient common ranks are available to resolve
+        any common ancestor.
+        """
+        if self._rank_of_earliest_detectable_mrca is None:
+            return None
+        elif self._rank_of_first_retained_disparity is None:
+            return True
+        else:
+            return self._rank_of_first_retained_disparity > 0
@@ -3,6 +3,7 @@
 Provides the foundation for phylogenetic inference tools.
 """
 
+from ._JuxtapositionSummary import JuxtapositionSummary
 from ._calc_definitive_max_rank_of_first_retained_disparity_between import (
     calc_definitive_max_rank_of_first_retained_disparity_between,
 )
@@ -30,9 +31,11 @@ from ._calc_ranks_since_last_retained_commonality_with import (
 from ._diff_retained_ranks import diff_retained_ranks
 from ._get_last_common_stratum_between import get_last_common_stratum_between
 from ._get_nth_common_rank_between import get_nth_common_rank_between
+from ._summarize_juxtaposition_between import summarize_juxtaposition_between
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
+    "JuxtapositionSummary",
     "calc_definitive_max_rank_of_first_retained_disparity_between",
     "calc_definitive_max_rank_of_last_retained_commonality_between",
     "calc_definitive_min_ranks_since_first_retained_disparity_with",
@@ -44,6 +47,7 @@ __all__ = [
     "diff_retained_ranks",
     "get_last_common_stratum_between",
     "get_nth_common_rank_between",
+    "summarize_juxtaposition_between",
 ]
 
 from .._auxiliary_lib import launder_impl_modules as _launder
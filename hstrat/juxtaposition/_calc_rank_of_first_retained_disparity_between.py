@@ -1,12 +1,12 @@
 import typing
 
-from ..genome_instrumentation import (
-    HereditaryStratigraphicColumn,
-    HereditaryStratumOrderedStoreList,
-)
+from ..genome_instrumentation import HereditaryStratigraphicColumn
 from ._impl import (
     calc_rank_of_first_retained_disparity_between_bsearch,
     calc_rank_of_first_retained_disparity_between_generic,
+    calc_rank_of_first_retained_disparity_between_numpy,
+    can_bsearch_between,
+    has_array_backed_strata,
 )
 
 
@@ -65,25 +65,21 @@ def calc_rank_of_first_retained_disparity_between(
     """
     assert 0.0 <= confidence_level <= 1.0
 
-    if (
-        first.HasDiscardedStrata()
-        or second.HasDiscardedStrata()
-        # for performance reasons
-        # only apply binary search to stores that support random access
-        or not isinstance(
-            first._stratum_ordered_store, HereditaryStratumOrderedStoreList
-        )
-        or not isinstance(
-            second._stratum_ordered_store, HereditaryStratumOrderedStoreList
-        )
-        # binary search currently requires no spurious collisions
-        or first.GetStratumDifferentiaBitWidth() < 64
-    ):
-        return calc_rank_of_first_retained_disparity_between_generic(
-            first,
-            second,
-            confidence_level=confidence_level,
-        )
+    if not can_bsearch_between(first, second):
+        # for performance reasons, only vectorize comparison of columns
+        # whose ranks and differentia are already held in arrays
+        if has_array_backed_strata(first) and has_array_backed_strata(second):
+            return calc_rank_of_first_retained_disparity_between_numpy(
+                first,
+                second,
+                confidence_level=confidence_level,
+            )
+        else:
+            return calc_rank_of_first_retained_disparity_between_generic(
+                first,
+                second,
+                confidence_level=confidence_level,
+            )
     else:
         return calc_rank_of_first_retained_disparity_between_bsearch(
             first,
@@ -1,6 +1,11 @@
 import typing
 
 from ..genome_instrumentation import HereditaryStratigraphicColumn
+from ._impl import (
+    get_nth_common_rank_between_generic,
+    get_nth_common_rank_between_numpy,
+    has_array_backed_strata,
+)
 
 
 def get_nth_common_rank_between(
@@ -15,36 +20,9 @@ def get_nth_common_rank_between(
     """
     assert n >= 0
 
-    # helper setup
-    first_iter = first._stratum_ordered_store.IterRankDifferentia(
-        get_rank_at_column_index=first.GetRankAtColumnIndex,
-    )
-    second_iter = second._stratum_ordered_store.IterRankDifferentia(
-        get_rank_at_column_index=second.GetRankAtColumnIndex,
-    )
-    first_cur_rank, first_cur_differentia = next(first_iter)
-    second_cur_rank, second_cur_differentia = next(second_iter)
-
-    try:
-        while True:
-            if first_cur_rank == second_cur_rank:
-                # strata at common rank
-                if n == 0:
-                    return first_cur_rank
-
-                n -= 1
-                # advance first
-                first_cur_rank, first_cur_differentia = next(first_iter)
-                # advance second
-                second_cur_rank, second_cur_differentia = next(second_iter)
-            elif first_cur_rank < second_cur_rank:
-                # current stratum on first column older than on second column
-                # advance to next-newer stratum on first column
-                first_cur_rank, first_cur_differentia = next(first_iter)
-            elif first_cur_rank > second_cur_rank:
-                # current stratum on second column older than on first column
-                # advance to next-newer stratum on second column
-                second_cur_rank, second_cur_differentia = next(second_iter)
-
-    except StopIteration:
-        return None
+    # for performance reasons, only vectorize comparison of columns whose
+    # ranks are already held in arrays
+    if has_array_backed_strata(first) and has_array_backed_strata(second):
+        return get_nth_common_rank_between_numpy(first, second, n)
+    else:
+        return get_nth_common_rank_between_generic(first, second, n)
@@ -6,17 +6,57 @@ from ._calc_rank_of_first_retained_disparity_between_bsearch import (
 from ._calc_rank_of_first_retained_disparity_between_generic import (
     calc_rank_of_first_retained_disparity_between_generic,
 )
+from ._calc_rank_of_first_retained_disparity_between_numpy import (
+    calc_rank_of_first_retained_disparity_between_numpy,
+)
 from ._calc_rank_of_last_retained_commonality_between_bsearch import (
     calc_rank_of_last_retained_commonality_between_bsearch,
 )
 from ._calc_rank_of_last_retained_commonality_between_generic import (
     calc_rank_of_last_retained_commonality_between_generic,
 )
+from ._calc_rank_of_last_retained_commonality_between_numpy import (
+    calc_rank_of_last_retained_commonality_between_numpy,
+)
+from ._can_bsearch_between import can_bsearch_between
+from ._collect_common_ranks_between_generic import (
+    collect_common_ranks_between_generic,
+)
+from ._collect_common_ranks_between_numpy import (
+    collect_common_ranks_between_numpy,
+)
+from ._find_first_disparite_column_index_bsearch import (
+    find_first_disparite_column_index_bsearch,
+)
+from ._get_nth_common_rank_between_generic import (
+    get_nth_common_rank_between_generic,
+)
+from ._get_nth_common_rank_between_numpy import (
+    get_nth_common_rank_between_numpy,
+)
+from ._get_retained_rank_differentia_arrays import (
+    get_retained_rank_differentia_arrays,
+)
+from ._has_aligned_column_indices import has_aligned_column_indices
+from ._has_array_backed_strata import has_array_backed_strata
+from ._has_random_access_strata import has_random_access_strata
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
     "calc_rank_of_first_retained_disparity_between_bsearch",
     "calc_rank_of_first_retained_disparity_between_generic",
+    "calc_rank_of_first_retained_disparity_between_numpy",
     "calc_rank_of_last_retained_commonality_between_bsearch",
     "calc_rank_of_last_retained_commonality_between_generic",
+    "calc_rank_of_last_retained_commonality_between_numpy",
+    "can_bsearch_between",
+    "collect_common_ranks_between_generic",
+    "collect_common_ranks_between_numpy",
+    "find_first_disparite_column_index_bsearch",
+    "get_nth_common_rank_between_generic",
+    "get_nth_common_rank_between_numpy",
+    "get_retained_rank_differentia_arrays",
+    "has_aligned_column_indices",
+    "has_array_backed_strata",
+    "has_random_access_strata",
 ]
@@ -1,11 +1,13 @@
 import typing
 
-from interval_search import binary_search
-
 from ...genome_instrumentation import HereditaryStratigraphicColumn
 from ._calc_rank_of_first_retained_disparity_between_generic import (
     calc_rank_of_first_retained_disparity_between_generic,
 )
+from ._find_first_disparite_column_index_bsearch import (
+    find_first_disparite_column_index_bsearch,
+)
+from ._has_aligned_column_indices import has_aligned_column_indices
 
 
 def calc_rank_of_first_retained_disparity_between_bsearch(
@@ -16,48 +18,31 @@ def calc_rank_of_first_retained_disparity_between_bsearch(
     """Find first mismatching strata between columns.
 
     Implementation detail. Provides optimized implementation for special
-    case where both self and second use the perfect resolution stratum
-    retention policy.
+    case where strata at the same column index share the same rank in
+    first and second (i.e., both use the perfect resolution stratum
+    retention policy or both use the same deterministic policy and have the
+    same number of strata deposited).
     """
-    # both must have (effectively) used the perfect resolution policy
-    assert not first.HasDiscardedStrata() and not second.HasDiscardedStrata()
+    assert has_aligned_column_indices(first, second)
 
-    lower_bound = 0
-    upper_bound = min(
-        [
-            first.GetNumStrataDeposited() - 1,
-            second.GetNumStrataDeposited() - 1,
-        ]
+    assert (
+        first.GetStratumDifferentiaBitWidth()
+        == second.GetStratumDifferentiaBitWidth()
     )
-    assert lower_bound <= upper_bound
-
-    def differentia_at(
-        which: HereditaryStratigraphicColumn,
-        idx: int,
-    ) -> int:
-        return which.GetStratumAtColumnIndex(idx).GetDifferentia()
-
-    def predicate(idx: int) -> bool:
-        return differentia_at(first, idx) != differentia_at(second, idx)
+    collision_implausibility_threshold = (
+        first.CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+            significance_level=1.0 - confidence_level,
+        )
+    )
+    assert collision_implausibility_threshold > 0
 
-    first_disparite_idx = binary_search(
-        predicate,
-        lower_bound,
-        upper_bound,
+    first_disparite_idx = find_first_disparite_column_index_bsearch(
+        first,
+        second,
     )
 
     if first_disparite_idx is not None:
         # disparate strata found
-        assert (
-            first.GetStratumDifferentiaBitWidth()
-            == second.GetStratumDifferentiaBitWidth()
-        )
-        collision_plausibility_threshold = (
-            first.CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
-                significance_level=1.0 - confidence_level,
-            )
-            - 1
-        )
         # discount collision_implausibility_threshold - 1 common
         # ranks due to potential spurious differentia collisions;
         # if not enough common ranks are available we still know
@@ -66,7 +51,7 @@ def calc_rank_of_first_retained_disparity_between_bsearch(
         # conservative assumption that the disparity occured as far
         # back as possible (rank 0)
         spurious_collision_corrected_idx = max(
-            first_disparite_idx - collision_plausibility_threshold,
+            first_disparite_idx + 1 - collision_implausibility_threshold,
             0,
         )
         first_disparite_rank = first.GetRankAtColumnIndex(
@@ -77,11 +62,20 @@ def calc_rank_of_first_retained_disparity_between_bsearch(
         # no disparate strata found
         # fall back to calc_rank_of_first_retained_disparity_between_generic to
         # handle proper bookkeeping in this case while skipping most of the
-        # search
+        # search, keeping enough common strata to discount potential
+        # spurious collisions
+        start_idx = max(
+            min(
+                first.GetNumStrataRetained(),
+                second.GetNumStrataRetained(),
+            )
+            - collision_implausibility_threshold,
+            0,
+        )
         return calc_rank_of_first_retained_disparity_between_generic(
             first,
             second,
-            first_start_idx=upper_bound,
-            second_start_idx=upper_bound,
+            first_start_idx=start_idx,
+            second_start_idx=start_idx,
             confidence_level=confidence_level,
         )
@@ -0,0 +1,93 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from ._get_retained_rank_differentia_arrays import (
+    get_retained_rank_differentia_arrays,
+)
+
+
+def calc_rank_of_first_retained_disparity_between_numpy(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+    *,
+    first_start_idx: int = 0,
+    second_start_idx: int = 0,
+    confidence_level: float,
+) -> typing.Optional[int]:
+    """Find first mismatching strata between columns.
+
+    Implementation detail. Provides vectorized implementation of
+    calc_rank_of_first_retained_disparity_between_generic, intersecting
+    retained ranks and comparing differentia at common ranks as arrays
+    rather than merging stratum iterators.
+    """
+    first_ranks, first_differentia = get_retained_rank_differentia_arrays(
+        first, first_start_idx
+    )
+    second_ranks, second_differentia = get_retained_rank_differentia_arrays(
+        second, second_start_idx
+    )
+
+    assert (
+        first.GetStratumDifferentiaBitWidth()
+        == second.GetStratumDifferentiaBitWidth()
+    )
+    collision_implausibility_threshold = (
+        first.CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+            significance_level=1.0 - confidence_level,
+        )
+    )
+    assert collision_implausibility_threshold > 0
+
+    common_ranks, first_indices, second_indices = np.intersect1d(
+        first_ranks,
+        second_ranks,
+        assume_unique=True,
+        return_indices=True,
+    )
+    (mismatch_positions,) = np.nonzero(
+        first_differentia[first_indices] != second_differentia[second_indices]
+    )
+
+    if len(mismatch_positions):
+        # mismatching differentiae at a common rank
+        # discount collision_implausibility_threshold - 1 preceding common
+        # ranks due to potential spurious differentia collisions; if not
+        # enough common ranks are available, conservatively assume the
+        # disparity occured at the oldest common rank
+        first_mismatch_pos = int(mismatch_positions[0])
+        return int(
+            common_ranks[
+                max(
+                    first_mismatch_pos
+                    + 1
+                    - collision_implausibility_threshold,
+                    0,
+                )
+            ]
+        )
+
+    first_newest_rank = int(first_ranks[-1])
+    second_newest_rank = int(second_ranks[-1])
+    if first_newest_rank == second_newest_rank:
+        # no disparate strata found
+        # and first and second have the same newest rank
+        no_disparity_rank = None
+    else:
+        # although no mismatching strata found, one column has strata ranks
+        # beyond the newest found in the other; conservatively assume
+        # mismatch will be with next rank of the other
+        no_disparity_rank = min(first_newest_rank, second_newest_rank) + 1
+
+    # discount collision_implausibility_threshold - 1 common ranks
+    # preceding no_disparity_rank due to potential spurious collisions
+    res_pos = max(
+        len(common_ranks) + 1 - collision_implausibility_threshold,
+        0,
+    )
+    if res_pos == len(common_ranks):
+        return no_disparity_rank
+    else:
+        return int(common_ranks[res_pos])
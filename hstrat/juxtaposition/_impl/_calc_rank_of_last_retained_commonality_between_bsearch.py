@@ -1,11 +1,13 @@
 import typing
 
-from interval_search import binary_search
-
 from ...genome_instrumentation import HereditaryStratigraphicColumn
 from ._calc_rank_of_last_retained_commonality_between_generic import (
     calc_rank_of_last_retained_commonality_between_generic,
 )
+from ._find_first_disparite_column_index_bsearch import (
+    find_first_disparite_column_index_bsearch,
+)
+from ._has_aligned_column_indices import has_aligned_column_indices
 
 
 def calc_rank_of_last_retained_commonality_between_bsearch(
@@ -15,35 +17,17 @@ def calc_rank_of_last_retained_commonality_between_bsearch(
 ) -> typing.Optional[int]:
     """Find rank of strata commonality before first strata disparity.
 
-    Implementation detail. Provides optimized implementation for
-    special case where both first and second use the perfect resolution
-    stratum retention policy.
+    Implementation detail. Provides optimized implementation for special
+    case where strata at the same column index share the same rank in
+    first and second (i.e., both use the perfect resolution stratum
+    retention policy or both use the same deterministic policy and have the
+    same number of strata deposited).
     """
-    # both must have (effectively) used the perfect resolution policy
-    assert not first.HasDiscardedStrata() and not second.HasDiscardedStrata()
+    assert has_aligned_column_indices(first, second)
 
-    lower_bound = 0
-    upper_bound = min(
-        [
-            first.GetNumStrataDeposited() - 1,
-            second.GetNumStrataDeposited() - 1,
-        ]
-    )
-    assert lower_bound <= upper_bound
-
-    def differentia_at(
-        which: HereditaryStratigraphicColumn,
-        idx: int,
-    ) -> int:
-        return which.GetStratumAtColumnIndex(idx).GetDifferentia()
-
-    def predicate(idx: int) -> bool:
-        return differentia_at(first, idx) != differentia_at(second, idx)
-
-    first_disparite_idx = binary_search(
-        predicate,
-        lower_bound,
-        upper_bound,
+    first_disparite_idx = find_first_disparite_column_index_bsearch(
+        first,
+        second,
     )
 
     collision_implausibility_threshold = (
@@ -56,12 +40,21 @@ def calc_rank_of_last_retained_commonality_between_bsearch(
         # no disparate strata found
         # fall back to calc_rank_of_last_retained_commonality_between_generic
         # to handle proper bookkeeping in this case while skipping most of
-        # the search
+        # the search, keeping enough common strata to discount potential
+        # spurious collisions
+        start_idx = max(
+            min(
+                first.GetNumStrataRetained(),
+                second.GetNumStrataRetained(),
+            )
+            - collision_implausibility_threshold,
+            0,
+        )
         return calc_rank_of_last_retained_commonality_between_generic(
             first,
             second,
-            first_start_idx=upper_bound,
-            second_start_idx=upper_bound,
+            first_start_idx=start_idx,
+            second_start_idx=start_idx,
             confidence_level=confidence_level,
         )
     elif first_disparite_idx >= collision_implausibility_threshold:
@@ -76,7 +69,6 @@ def calc_rank_of_last_retained_commonality_between_bsearch(
         last_common_rank = first.GetRankAtColumnIndex(
             last_common_idx,
         )
-        assert last_common_idx == last_common_rank
         return last_common_rank
     else:
         # no common strata between first and second
@@ -17,12 +17,10 @@ def calc_rank_of_last_retained_commonality_between_generic(
     Implementation detail with general-case implementation.
     """
     # helper setup
-    first_iter = first._stratum_ordered_store.IterRankDifferentia(
-        get_rank_at_column_index=first.GetRankAtColumnIndex,
+    first_iter = first.IterRankDifferentia(
         start_column_index=first_start_idx,
     )
-    second_iter = second._stratum_ordered_store.IterRankDifferentia(
-        get_rank_at_column_index=second.GetRankAtColumnIndex,
+    second_iter = second.IterRankDifferentia(
         start_column_index=second_start_idx,
     )
     first_cur_rank, first_cur_differentia = next(first_iter)
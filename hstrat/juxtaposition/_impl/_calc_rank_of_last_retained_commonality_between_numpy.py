@@ -0,0 +1,68 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from ._get_retained_rank_differentia_arrays import (
+    get_retained_rank_differentia_arrays,
+)
+
+
+def calc_rank_of_last_retained_commonality_between_numpy(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+    *,
+    first_start_idx: int = 0,
+    second_start_idx: int = 0,
+    confidence_level: float,
+) -> typing.Optional[int]:
+    """Find rank of strata commonality before first strata disparity.
+
+    Implementation detail. Provides vectorized implementation of
+    calc_rank_of_last_retained_commonality_between_generic, intersecting
+    retained ranks and comparing differentia at common ranks as arrays
+    rather than merging stratum iterators.
+    """
+    first_ranks, first_differentia = get_retained_rank_differentia_arrays(
+        first, first_start_idx
+    )
+    second_ranks, second_differentia = get_retained_rank_differentia_arrays(
+        second, second_start_idx
+    )
+
+    collision_implausibility_threshold = (
+        first.CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+            significance_level=1.0 - confidence_level,
+        )
+    )
+    assert collision_implausibility_threshold > 0
+
+    common_ranks, first_indices, second_indices = np.intersect1d(
+        first_ranks,
+        second_ranks,
+        assume_unique=True,
+        return_indices=True,
+    )
+    (mismatch_positions,) = np.nonzero(
+        first_differentia[first_indices] != second_differentia[second_indices]
+    )
+    # common strata preceding first disparity, if any
+    num_common_strata = (
+        int(mismatch_positions[0])
+        if len(mismatch_positions)
+        else len(common_ranks)
+    )
+
+    # discount collision_implausibility_threshold - 1 common strata as
+    # potential spurious differentia collisions
+    if num_common_strata >= collision_implausibility_threshold:
+        return int(
+            common_ranks[
+                num_common_strata - collision_implausibility_threshold
+            ]
+        )
+    else:
+        # not enough common strata to discount the possibility all are
+        # spurious collisions with respect to the given confidence level;
+        # conservatively conclude there is no common ancestor
+        return None
@@ -0,0 +1,26 @@
+import typing
+
+from ._has_aligned_column_indices import has_aligned_column_indices
+from ._has_random_access_strata import has_random_access_strata
+
+
+def can_bsearch_between(
+    first: typing.Any,
+    second: typing.Any,
+) -> bool:
+    """Should disparity between columns be found by binary search?
+
+    Implementation detail. Used to dispatch to _bsearch implementations.
+    """
+    return (
+        # binary search requires strata at the same column index to share
+        # the same rank
+        has_aligned_column_indices(first, second)
+        # for performance reasons
+        # only apply binary search to stores that support random access
+        and has_random_access_strata(first)
+        and has_random_access_strata(second)
+        # narrow differentia require wide windows to guard against spurious
+        # collisions, outweighing the benefit of binary search
+        and first.GetStratumDifferentiaBitWidth() >= 8
+    )
@@ -0,0 +1,54 @@
+import typing
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+
+
+def collect_common_ranks_between_generic(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+    min_num_common_ranks: int,
+) -> typing.Tuple[typing.List[int], typing.Optional[int]]:
+    """Find ranks retained by both columns and the first disparity among
+    them in a single merge pass.
+
+    Implementation detail with general-case implementation. Returns ranks
+    retained by both columns, ascending, and the index within these ranks
+    of the first stratum pair with mismatching differentia (or None if no
+    mismatch). Once a mismatch is found, common ranks are only collected
+    until at least min_num_common_ranks are available.
+    """
+    # helper setup
+    first_iter = first.IterRankDifferentia()
+    second_iter = second.IterRankDifferentia()
+    first_cur_rank, first_cur_differentia = next(first_iter)
+    second_cur_rank, second_cur_differentia = next(second_iter)
+
+    common_ranks = []
+    mismatch_idx = None
+    try:
+        while mismatch_idx is None or len(common_ranks) < min_num_common_ranks:
+            if first_cur_rank == second_cur_rank:
+                # strata at same rank can be compared
+                if (
+                    mismatch_idx is None
+                    and first_cur_differentia != second_cur_differentia
+                ):
+                    # first mismatching differentiae at the same rank
+                    mismatch_idx = len(common_ranks)
+                common_ranks.append(first_cur_rank)
+                # advance first
+                first_cur_rank, first_cur_differentia = next(first_iter)
+                # advance second
+                second_cur_rank, second_cur_differentia = next(second_iter)
+            elif first_cur_rank < second_cur_rank:
+                # current stratum on first column older than on second column
+                # advance to next-newer stratum on first column
+                first_cur_rank, first_cur_differentia = next(first_iter)
+            elif first_cur_rank > second_cur_rank:
+                # current stratum on second column older than on first column
+                # advance to next-newer stratum on second column
+                second_cur_rank, second_cur_differentia = next(second_iter)
+    except StopIteration:
+        pass
+
+    return common_ranks, mismatch_idx
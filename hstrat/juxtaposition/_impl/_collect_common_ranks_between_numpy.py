@@ -0,0 +1,43 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from ._get_retained_rank_differentia_arrays import (
+    get_retained_rank_differentia_arrays,
+)
+
+
+def collect_common_ranks_between_numpy(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+    min_num_common_ranks: int,
+) -> typing.Tuple[np.ndarray, typing.Optional[int]]:
+    """Find ranks retained by both columns and the first disparity among
+    them.
+
+    Implementation detail. Provides vectorized implementation of
+    collect_common_ranks_between_generic. All common ranks are returned,
+    regardless of min_num_common_ranks.
+    """
+    first_ranks, first_differentia = get_retained_rank_differentia_arrays(
+        first
+    )
+    second_ranks, second_differentia = get_retained_rank_differentia_arrays(
+        second
+    )
+
+    common_ranks, first_indices, second_indices = np.intersect1d(
+        first_ranks,
+        second_ranks,
+        assume_unique=True,
+        return_indices=True,
+    )
+    (mismatch_positions,) = np.nonzero(
+        first_differentia[first_indices] != second_differentia[second_indices]
+    )
+
+    return (
+        common_ranks,
+        int(mismatch_positions[0]) if len(mismatch_positions) else None,
+    )
@@ -0,0 +1,64 @@
+import math
+import typing
+
+from interval_search import binary_search
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+
+
+def find_first_disparite_column_index_bsearch(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+) -> typing.Optional[int]:
+    """Find column index of first stratum pair with mismatching differentia.
+
+    Implementation detail. Requires columns with aligned column indices.
+    Returns None if no mismatching strata are found.
+
+    After divergence, strata pairs only match through spurious differentia
+    collisions. To keep the binary search predicate monotonic, each probe
+    tests a window of consecutive strata ending at the probed index and
+    detects a disparity if any stratum pair in the window mismatches. The
+    window is sized so that mistaking a window of spurious collisions for
+    commonality is no more plausible than a single collision between 64-bit
+    differentia.
+    """
+    assert (
+        first.GetStratumDifferentiaBitWidth()
+        == second.GetStratumDifferentiaBitWidth()
+    )
+    window_size = math.ceil(64 / first.GetStratumDifferentiaBitWidth())
+
+    lower_bound = 0
+    upper_bound = (
+        min(
+            first.GetNumStrataRetained(),
+            second.GetNumStrataRetained(),
+        )
+        - 1
+    )
+    assert lower_bound <= upper_bound
+
+    def differentia_at(
+        which: HereditaryStratigraphicColumn,
+        idx: int,
+    ) -> int:
+        return which.GetStratumAtColumnIndex(idx).GetDifferentia()
+
+    def predicate(idx: int) -> bool:
+        # check newest first, most likely to short circuit after divergence
+        return any(
+            differentia_at(first, window_idx)
+            != differentia_at(second, window_idx)
+            for window_idx in range(
+                idx,
+                max(idx - window_size, lower_bound - 1),
+                -1,
+            )
+        )
+
+    return binary_search(
+        predicate,
+        lower_bound,
+        upper_bound,
+    )
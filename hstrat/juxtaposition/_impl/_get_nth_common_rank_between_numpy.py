@@ -0,0 +1,29 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from ._get_retained_rank_differentia_arrays import (
+    get_retained_rank_differentia_arrays,
+)
+
+
+def get_nth_common_rank_between_numpy(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+    n: int,
+) -> typing.Optional[int]:
+    """Return the nth rank retained by both columns.
+
+    Implementation detail. Provides vectorized implementation of
+    get_nth_common_rank_between_generic.
+    """
+    first_ranks, __ = get_retained_rank_differentia_arrays(first)
+    second_ranks, __ = get_retained_rank_differentia_arrays(second)
+    common_ranks = np.intersect1d(
+        first_ranks, second_ranks, assume_unique=True
+    )
+    if n < len(common_ranks):
+        return int(common_ranks[n])
+    else:
+        return None
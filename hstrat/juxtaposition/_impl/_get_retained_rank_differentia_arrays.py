@@ -0,0 +1,48 @@
+import typing
+
+import numpy as np
+
+from ..._auxiliary_lib import min_uint_dtype_for_bit_width
+from ...genome_instrumentation import (
+    HereditaryStratigraphicColumnStripped,
+    HereditaryStratumOrderedStoreArray,
+)
+
+
+def get_retained_rank_differentia_arrays(
+    column: typing.Any,
+    start_column_index: int = 0,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Get retained deposition ranks and differentia as parallel arrays.
+
+    Implementation detail. Ordered from most ancient to most recent, skipping
+    the first start_column_index strata. Arrays backing stripped columns and
+    array-backed stores are returned as views without copying; otherwise,
+    strata are iterated over and copied into new arrays.
+    """
+    if isinstance(column, HereditaryStratigraphicColumnStripped):
+        return (
+            column.GetRetainedRanksArray()[start_column_index:],
+            column.GetRetainedDifferentiaArray()[start_column_index:],
+        )
+
+    store = column._stratum_ordered_store
+    if isinstance(store, HereditaryStratumOrderedStoreArray):
+        return (
+            store.GetRetainedRanksArray()[start_column_index:],
+            store.GetRetainedDifferentiaArray()[start_column_index:],
+        )
+
+    rank_differentia = [*column.IterRankDifferentia(start_column_index)]
+    return (
+        np.array(
+            [rank for rank, __ in rank_differentia],
+            dtype=np.int64,
+        ),
+        np.array(
+            [differentia for __, differentia in rank_differentia],
+            dtype=min_uint_dtype_for_bit_width(
+                column.GetStratumDifferentiaBitWidth()
+            ),
+        ),
+    )
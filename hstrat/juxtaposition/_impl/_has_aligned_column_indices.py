@@ -0,0 +1,34 @@
+import typing
+
+from ...stratum_retention_strategy.stratum_retention_algorithms import (
+    stochastic_algo,
+)
+from ...stratum_retention_strategy.stratum_retention_algorithms._detail import (
+    PolicyCouplerBase,
+)
+
+
+def has_aligned_column_indices(
+    first: typing.Any,
+    second: typing.Any,
+) -> bool:
+    """Do strata at the same column index share the same deposition rank?
+
+    Implementation detail. Holds, up to the lesser number of strata
+    retained, if neither column has discarded strata. Otherwise, holds if
+    both columns follow the same deterministic stratum retention policy and
+    have had the same number of strata deposited, because such columns
+    retain exactly the same ranks.
+    """
+    if not first.HasDiscardedStrata() and not second.HasDiscardedStrata():
+        return True
+
+    # stripped columns do not carry a stratum retention policy
+    first_policy = getattr(first, "_stratum_retention_policy", None)
+    second_policy = getattr(second, "_stratum_retention_policy", None)
+    return (
+        first.GetNumStrataDeposited() == second.GetNumStrataDeposited()
+        and isinstance(first_policy, PolicyCouplerBase)
+        and first_policy == second_policy
+        and not isinstance(first_policy.GetSpec(), stochastic_algo.PolicySpec)
+    )
@@ -0,0 +1,19 @@
+import typing
+
+from ...genome_instrumentation import (
+    HereditaryStratigraphicColumnStripped,
+    HereditaryStratumOrderedStoreArray,
+)
+
+
+def has_array_backed_strata(column: typing.Any) -> bool:
+    """Are column's retained ranks and differentia held in numpy arrays?
+
+    Implementation detail. Used to decide whether vectorized comparison is
+    worthwhile, as arrays can be accessed without iterating over strata.
+    """
+    return isinstance(column, HereditaryStratigraphicColumnStripped) or (
+        isinstance(
+            column._stratum_ordered_store, HereditaryStratumOrderedStoreArray
+        )
+    )
@@ -0,0 +1,24 @@
+import typing
+
+from ...genome_instrumentation import (
+    HereditaryStratigraphicColumnStripped,
+    HereditaryStratumOrderedStoreArray,
+    HereditaryStratumOrderedStoreList,
+)
+
+
+def has_random_access_strata(column: typing.Any) -> bool:
+    """Can column's retained strata be accessed by index in constant time?
+
+    Implementation detail. Used to decide whether binary search over column
+    indices is worthwhile.
+    """
+    return isinstance(column, HereditaryStratigraphicColumnStripped) or (
+        isinstance(
+            column._stratum_ordered_store,
+            (
+                HereditaryStratumOrderedStoreArray,
+                HereditaryStratumOrderedStoreList,
+            ),
+        )
+    )
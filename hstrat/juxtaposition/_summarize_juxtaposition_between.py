@@ -0,0 +1,137 @@
+import typing
+
+from ..genome_instrumentation import HereditaryStratigraphicColumn
+from ._JuxtapositionSummary import JuxtapositionSummary
+from ._impl import (
+    can_bsearch_between,
+    collect_common_ranks_between_generic,
+    collect_common_ranks_between_numpy,
+    find_first_disparite_column_index_bsearch,
+    has_array_backed_strata,
+)
+
+
+def summarize_juxtaposition_between(
+    first: HereditaryStratigraphicColumn,
+    second: HereditaryStratigraphicColumn,
+    confidence_level: float = 0.95,
+) -> JuxtapositionSummary:
+    """Compute comparison statistics between first and second together.
+
+    Equivalent to calling calc_rank_of_earliest_detectable_mrca_between,
+    calc_rank_of_first_retained_disparity_between,
+    calc_definitive_max_rank_of_first_retained_disparity_between, and
+    calc_rank_of_last_retained_commonality_between individually, but
+    compares the columns' strata once rather than once per statistic. All
+    statistics are derived from the common ranks and the index of the first
+    disparity among them, found either by a single merge pass or, where
+    strata at the same column index share a rank, by a single binary
+    search.
+
+    Parameters
+    ----------
+    confidence_level : float, optional
+        Confidence level to calculate statistics at. Default 0.95.
+
+    Returns
+    -------
+    JuxtapositionSummary
+        Calculated statistics.
+    """
+    assert 0.0 <= confidence_level <= 1.0
+    assert (
+        first.GetStratumDifferentiaBitWidth()
+        == second.GetStratumDifferentiaBitWidth()
+    )
+
+    collision_implausibility_threshold = (
+        first.CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+            significance_level=1.0 - confidence_level,
+        )
+    )
+    assert collision_implausibility_threshold > 0
+
+    if can_bsearch_between(first, second):
+        # binary search is sublinear, so outperforms a single linear pass;
+        # strata at the same column index share the same rank, so common
+        # ranks are exactly the ranks at column indices both columns retain
+        num_common_ranks = min(
+            first.GetNumStrataRetained(),
+            second.GetNumStrataRetained(),
+        )
+        get_common_rank = first.GetRankAtColumnIndex
+        mismatch_idx = find_first_disparite_column_index_bsearch(first, second)
+    else:
+        if has_array_backed_strata(first) and has_array_backed_strata(second):
+            common_ranks, mismatch_idx = collect_common_ranks_between_numpy(
+                first, second, collision_implausibility_threshold
+            )
+            common_ranks = common_ranks.tolist()
+        else:
+            common_ranks, mismatch_idx = collect_common_ranks_between_generic(
+                first, second, collision_implausibility_threshold
+            )
+        num_common_ranks = len(common_ranks)
+        get_common_rank = common_ranks.__getitem__
+
+    first_newest_rank = first.GetRankAtColumnIndex(
+        first.GetNumStrataRetained() - 1
+    )
+    second_newest_rank = second.GetRankAtColumnIndex(
+        second.GetNumStrataRetained() - 1
+    )
+
+    def calc_rank_of_first_retained_disparity(
+        threshold: int,
+    ) -> typing.Optional[int]:
+        if mismatch_idx is not None:
+            # mismatching differentiae at a common rank;
+            # discount threshold - 1 preceding common ranks due to potential
+            # spurious differentia collisions, conservatively falling back
+            # to the oldest common rank
+            return get_common_rank(max(mismatch_idx + 1 - threshold, 0))
+
+        if first_newest_rank == second_newest_rank:
+            # no disparate strata found and same newest rank
+            no_disparity_rank = None
+        else:
+            # conservatively assume mismatch will be with next rank of the
+            # column with fewer strata deposited
+            no_disparity_rank = min(first_newest_rank, second_newest_rank) + 1
+
+        res_idx = max(num_common_ranks + 1 - threshold, 0)
+        if res_idx == num_common_ranks:
+            return no_disparity_rank
+        else:
+            return get_common_rank(res_idx)
+
+    # common strata preceding first disparity, if any
+    num_common_strata = (
+        mismatch_idx if mismatch_idx is not None else num_common_ranks
+    )
+
+    return JuxtapositionSummary(
+        confidence_level=confidence_level,
+        rank_of_earliest_detectable_mrca=(
+            get_common_rank(collision_implausibility_threshold - 1)
+            if num_common_ranks >= collision_implausibility_threshold
+            else None
+        ),
+        rank_of_first_retained_disparity=(
+            calc_rank_of_first_retained_disparity(
+                collision_implausibility_threshold
+            )
+        ),
+        definitive_max_rank_of_first_retained_disparity=(
+            calc_rank_of_first_retained_disparity(1)
+        ),
+        # discount collision_implausibility_threshold - 1 common strata
+        # preceding first disparity as potential spurious collisions
+        rank_of_last_retained_commonality=(
+            get_common_rank(
+                num_common_strata - collision_implausibility_threshold
+            )
+            if num_common_strata >= collision_implausibility_threshold
+            else None
+        ),
+    )
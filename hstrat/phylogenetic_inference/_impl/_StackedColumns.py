@@ -0,0 +1,99 @@
+import typing
+
+import numpy as np
+
+from ..._auxiliary_lib import min_uint_dtype_for_bit_width
+from ...genome_instrumentation import HereditaryStratigraphicColumnStripped
+
+
+class StackedColumns:
+    """Retained strata of several columns, aligned by deposition rank.
+
+    Implementation detail. Columns' retained strata are laid out as rows of
+    dense matrices, with one matrix column per deposition rank retained by
+    any column. This lets comparisons between many columns be vectorized
+    across rows.
+    """
+
+    # deposition ranks retained by any column, ascending
+    ranks: np.ndarray
+    # shape (num columns, len(ranks)); zero where not retained
+    differentia: np.ndarray
+    # shape (num columns, len(ranks)); does column retain rank?
+    retained: np.ndarray
+    # shape (num columns,)
+    num_strata_deposited: np.ndarray
+    # shape (num columns,); rank of each column's most recent stratum
+    newest_ranks: np.ndarray
+
+    def __init__(
+        self: "StackedColumns",
+        ranks: np.ndarray,
+        differentia: np.ndarray,
+        retained: np.ndarray,
+        num_strata_deposited: np.ndarray,
+        newest_ranks: np.ndarray,
+    ) -> None:
+        assert differentia.shape == retained.shape
+        assert differentia.shape == (len(num_strata_deposited), len(ranks))
+        assert newest_ranks.shape == num_strata_deposited.shape
+        self.ranks = ranks
+        self.differentia = differentia
+        self.retained = retained
+        self.num_strata_deposited = num_strata_deposited
+        self.newest_ranks = newest_ranks
+
+    @classmethod
+    def FromColumns(
+        cls: typing.Type["StackedColumns"],
+        columns: typing.Sequence[typing.Any],
+    ) -> "StackedColumns":
+        """Stack retained strata of columns.
+
+        Columns must share a differentia bit width.
+        """
+        stripped = [
+            column
+            if isinstance(column, HereditaryStratigraphicColumnStripped)
+            else HereditaryStratigraphicColumnStripped(column)
+            for column in columns
+        ]
+        assert len({c.GetStratumDifferentiaBitWidth() for c in stripped}) == 1
+
+        column_ranks = [
+            column.GetRetainedRanksArray().astype(np.int64)
+            for column in stripped
+        ]
+        ranks = np.unique(np.concatenate(column_ranks))
+
+        differentia = np.zeros(
+            (len(stripped), len(ranks)),
+            dtype=min_uint_dtype_for_bit_width(
+                stripped[0].GetStratumDifferentiaBitWidth()
+            ),
+        )
+        retained = np.zeros(differentia.shape, dtype=bool)
+        for row, (column, rank_array) in enumerate(
+            zip(stripped, column_ranks)
+        ):
+            positions = np.searchsorted(ranks, rank_array)
+            differentia[row, positions] = column.GetRetainedDifferentiaArray()
+            retained[row, positions] = True
+
+        return cls(
+            ranks=ranks,
+            differentia=differentia,
+            retained=retained,
+            num_strata_deposited=np.array(
+                [column.GetNumStrataDeposited() for column in stripped],
+                dtype=np.int64,
+            ),
+            newest_ranks=np.array(
+                [rank_array[-1] for rank_array in column_ranks],
+                dtype=np.int64,
+            ),
+        )
+
+    def __len__(self: "StackedColumns") -> int:
+        """How many columns are stacked?"""
+        return len(self.num_strata_deposited)
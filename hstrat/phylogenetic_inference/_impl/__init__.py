@@ -0,0 +1,18 @@
+"""Implementation helpers."""
+
+from ._StackedColumns import StackedColumns
+from ._calc_juxtaposition_statistics import calc_juxtaposition_statistics
+from ._calc_juxtaposition_statistics_batched import (
+    calc_juxtaposition_statistics_batched,
+)
+from ._calc_rank_of_mrca_bounds_from_statistics import (
+    calc_rank_of_mrca_bounds_from_statistics,
+)
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    "StackedColumns",
+    "calc_juxtaposition_statistics",
+    "calc_juxtaposition_statistics_batched",
+    "calc_rank_of_mrca_bounds_from_statistics",
+]
@@ -0,0 +1,121 @@
+import typing
+
+import numpy as np
+
+from ._StackedColumns import StackedColumns
+
+
+def calc_juxtaposition_statistics(
+    stacked: StackedColumns,
+    first_indices: np.ndarray,
+    second_indices: np.ndarray,
+    collision_implausibility_threshold: int,
+) -> typing.Dict[str, np.ndarray]:
+    """Compare many pairs of stacked columns at once.
+
+    Implementation detail. Vectorized equivalent of
+    summarize_juxtaposition_between, comparing stacked columns at
+    first_indices against those at second_indices. Index arrays may have
+    any shapes that broadcast together; for instance, shapes (n, 1) and
+    (1, m) compare all combinations.
+
+    Returns
+    -------
+    dict of str to np.ndarray
+        Float arrays of the broadcast index shape, with nan where the
+        corresponding statistic is None, keyed by
+        rank_of_earliest_detectable_mrca, rank_of_first_retained_disparity,
+        definitive_max_rank_of_first_retained_disparity,
+        rank_of_last_retained_commonality, does_have_any_common_ancestor,
+        and first_num_strata_deposited.
+    """
+    threshold = collision_implausibility_threshold
+    first_indices, second_indices = np.broadcast_arrays(
+        first_indices, second_indices
+    )
+    ranks = stacked.ranks
+
+    common = stacked.retained[first_indices] & stacked.retained[second_indices]
+    # running count of common ranks, along ascending ranks
+    common_counts = np.cumsum(common, axis=-1, dtype=np.int64)
+    num_common = common_counts[..., -1]
+
+    mismatches = common & (
+        stacked.differentia[first_indices]
+        != stacked.differentia[second_indices]
+    )
+    has_mismatch = mismatches.any(axis=-1)
+    mismatch_positions = mismatches.argmax(axis=-1)
+    # index of first mismatch among common ranks
+    mismatch_idx = (
+        np.take_along_axis(
+            common_counts, mismatch_positions[..., None], axis=-1
+        )[..., 0]
+        - 1
+    )
+    del common, mismatches
+
+    def get_nth_common_rank(n: np.ndarray) -> np.ndarray:
+        # common_counts is nondecreasing, so the nth common rank sits at the
+        # position after all entries with at most n preceding common ranks
+        positions = (common_counts <= n[..., None]).sum(axis=-1)
+        return ranks[np.minimum(positions, len(ranks) - 1)]
+
+    first_newest = stacked.newest_ranks[first_indices]
+    second_newest = stacked.newest_ranks[second_indices]
+    same_newest = first_newest == second_newest
+    # conservatively assume disparity at next rank of less-deposited column
+    no_disparity_rank = np.minimum(first_newest, second_newest) + 1
+
+    def calc_rank_of_first_retained_disparity(
+        threshold: int,
+    ) -> np.ndarray:
+        # discount threshold - 1 common ranks preceding first mismatch as
+        # potential spurious differentia collisions
+        res_idx = np.maximum(
+            np.where(has_mismatch, mismatch_idx, num_common) + 1 - threshold,
+            0,
+        )
+        is_fallback = ~has_mismatch & (res_idx == num_common)
+        return np.where(
+            is_fallback,
+            np.where(same_newest, np.nan, no_disparity_rank),
+            get_nth_common_rank(res_idx),
+        )
+
+    is_detectable = num_common >= threshold
+    rank_of_first_retained_disparity = calc_rank_of_first_retained_disparity(
+        threshold
+    )
+
+    num_common_before_mismatch = np.where(
+        has_mismatch, mismatch_idx, num_common
+    )
+    rank_of_last_retained_commonality = np.where(
+        num_common_before_mismatch >= threshold,
+        get_nth_common_rank(num_common_before_mismatch - threshold),
+        np.nan,
+    )
+
+    return {
+        "rank_of_earliest_detectable_mrca": np.where(
+            is_detectable,
+            get_nth_common_rank(np.full_like(num_common, threshold - 1)),
+            np.nan,
+        ),
+        "rank_of_first_retained_disparity": rank_of_first_retained_disparity,
+        "definitive_max_rank_of_first_retained_disparity": (
+            calc_rank_of_first_retained_disparity(1)
+        ),
+        "rank_of_last_retained_commonality": rank_of_last_retained_commonality,
+        "does_have_any_common_ancestor": np.where(
+            is_detectable,
+            # nan comparisons are false, so check for no disparity directly
+            np.isnan(rank_of_first_retained_disparity)
+            | (rank_of_first_retained_disparity > 0),
+            np.nan,
+        ),
+        "first_num_strata_deposited": (
+            stacked.num_strata_deposited[first_indices].astype(np.float64)
+        ),
+    }
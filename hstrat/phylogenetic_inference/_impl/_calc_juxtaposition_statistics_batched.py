@@ -0,0 +1,48 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from ._StackedColumns import StackedColumns
+from ._calc_juxtaposition_statistics import calc_juxtaposition_statistics
+
+
+def calc_juxtaposition_statistics_batched(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairs: typing.Union[np.ndarray, typing.Sequence[typing.Tuple[int, int]]],
+    confidence_level: float,
+) -> typing.Dict[str, np.ndarray]:
+    """Compare many pairs of columns from population at once.
+
+    Implementation detail. Stacks population and applies
+    calc_juxtaposition_statistics to each (i, j) index pair, a chunk of
+    pairs at a time to bound memory use. Returned arrays have one entry per
+    pair.
+    """
+    assert 0.0 <= confidence_level <= 1.0
+    assert len(population)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+    stacked = StackedColumns.FromColumns(population)
+    collision_implausibility_threshold = population[
+        0
+    ].CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+        significance_level=1.0 - confidence_level,
+    )
+
+    # target ~16M elements per intermediate array
+    chunk_size = max(2**24 // len(stacked.ranks), 1)
+    chunks = [
+        calc_juxtaposition_statistics(
+            stacked,
+            pairs[start : start + chunk_size, 0],
+            pairs[start : start + chunk_size, 1],
+            collision_implausibility_threshold,
+        )
+        # always make at least one, possibly empty, chunk
+        for start in range(0, max(len(pairs), 1), chunk_size)
+    ]
+    return {
+        key: np.concatenate([chunk[key] for chunk in chunks])
+        for key in chunks[0]
+    }
@@ -0,0 +1,32 @@
+import typing
+
+import numpy as np
+
+
+def calc_rank_of_mrca_bounds_from_statistics(
+    statistics: typing.Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Derive MRCA rank bounds from juxtaposition statistics.
+
+    Implementation detail. Vectorized equivalent of
+    calc_rank_of_mrca_bounds_between over the output of
+    calc_juxtaposition_statistics. Returns a float array with an added
+    trailing axis of length two holding inclusive lower and exclusive upper
+    bounds, or nan where no common ancestor is resolved.
+    """
+    first_disparity = statistics[
+        "definitive_max_rank_of_first_retained_disparity"
+    ]
+    bounds = np.stack(
+        [
+            statistics["rank_of_last_retained_commonality"],
+            np.where(
+                np.isnan(first_disparity),
+                statistics["first_num_strata_deposited"],
+                first_disparity,
+            ),
+        ],
+        axis=-1,
+    )
+    bounds[statistics["does_have_any_common_ancestor"] != 1] = np.nan
+    return bounds
@@ -4,42 +4,74 @@ columns."""
 from ._calc_rank_of_earliest_detectable_mrca_between import (
     calc_rank_of_earliest_detectable_mrca_between,
 )
+from ._calc_rank_of_earliest_detectable_mrca_between_batched import (
+    calc_rank_of_earliest_detectable_mrca_between_batched,
+)
 from ._calc_rank_of_mrca_bounds_between import calc_rank_of_mrca_bounds_between
+from ._calc_rank_of_mrca_bounds_between_batched import (
+    calc_rank_of_mrca_bounds_between_batched,
+)
 from ._calc_rank_of_mrca_bounds_provided_confidence_level import (
     calc_rank_of_mrca_bounds_provided_confidence_level,
 )
 from ._calc_rank_of_mrca_uncertainty_between import (
     calc_rank_of_mrca_uncertainty_between,
 )
+from ._calc_rank_of_mrca_uncertainty_between_batched import (
+    calc_rank_of_mrca_uncertainty_between_batched,
+)
 from ._calc_ranks_since_earliest_detectable_mrca_with import (
     calc_ranks_since_earliest_detectable_mrca_with,
 )
+from ._calc_ranks_since_earliest_detectable_mrca_with_batched import (
+    calc_ranks_since_earliest_detectable_mrca_with_batched,
+)
 from ._calc_ranks_since_mrca_bounds_provided_confidence_level import (
     calc_ranks_since_mrca_bounds_provided_confidence_level,
 )
 from ._calc_ranks_since_mrca_bounds_with import (
     calc_ranks_since_mrca_bounds_with,
 )
+from ._calc_ranks_since_mrca_bounds_with_batched import (
+    calc_ranks_since_mrca_bounds_with_batched,
+)
 from ._calc_ranks_since_mrca_uncertainty_with import (
     calc_ranks_since_mrca_uncertainty_with,
 )
+from ._calc_ranks_since_mrca_uncertainty_with_batched import (
+    calc_ranks_since_mrca_uncertainty_with_batched,
+)
 from ._does_definitively_have_no_common_ancestor import (
     does_definitively_have_no_common_ancestor,
 )
+from ._does_definitively_have_no_common_ancestor_batched import (
+    does_definitively_have_no_common_ancestor_batched,
+)
 from ._does_have_any_common_ancestor import does_have_any_common_ancestor
+from ._does_have_any_common_ancestor_batched import (
+    does_have_any_common_ancestor_batched,
+)
 
 # adapted from https://stackoverflow.com/a/31079085
 __all__ = [
     "calc_rank_of_earliest_detectable_mrca_between",
+    "calc_rank_of_earliest_detectable_mrca_between_batched",
     "calc_rank_of_mrca_bounds_between",
+    "calc_rank_of_mrca_bounds_between_batched",
     "calc_rank_of_mrca_bounds_provided_confidence_level",
     "calc_rank_of_mrca_uncertainty_between",
+    "calc_rank_of_mrca_uncertainty_between_batched",
     "calc_ranks_since_earliest_detectable_mrca_with",
-    "calc_ranks_since_mrca_bounds_with",
+    "calc_ranks_since_earliest_detectable_mrca_with_batched",
     "calc_ranks_since_mrca_bounds_provided_confidence_level",
+    "calc_ranks_since_mrca_bounds_with",
+    "calc_ranks_since_mrca_bounds_with_batched",
     "calc_ranks_since_mrca_uncertainty_with",
+    "calc_ranks_since_mrca_uncertainty_with_batched",
     "does_definitively_have_no_common_ancestor",
+    "does_definitively_have_no_common_ancestor_batched",
     "does_have_any_common_ancestor",
+    "does_have_any_common_ancestor_batched",
 ]
 
 from ..._auxiliary_lib import launder_impl_modules as _launder
@@ -4,14 +4,7 @@ import warnings
 import opytional as opyt
 
 from ...genome_instrumentation import HereditaryStratigraphicColumn
-from ...juxtaposition import (
-    calc_definitive_max_rank_of_first_retained_disparity_between,
-    calc_rank_of_last_retained_commonality_between,
-)
-from ._calc_rank_of_earliest_detectable_mrca_between import (
-    calc_rank_of_earliest_detectable_mrca_between,
-)
-from ._does_have_any_common_ancestor import does_have_any_common_ancestor
+from ...juxtaposition import summarize_juxtaposition_between
 
 
 def calc_rank_of_mrca_bounds_between(
@@ -88,39 +81,28 @@ def calc_rank_of_mrca_bounds_between(
     """
     assert 0.0 <= confidence_level <= 1.0
 
-    if (
-        calc_rank_of_earliest_detectable_mrca_between(
-            first,
-            second,
-            confidence_level=confidence_level,
-        )
-        is None
-    ):
+    # compute all required statistics in one pass over both columns
+    summary = summarize_juxtaposition_between(
+        first,
+        second,
+        confidence_level=confidence_level,
+    )
+
+    if summary.GetRankOfEarliestDetectableMrca() is None:
         warnings.warn(
             "Insufficient common ranks between columns to detect common "
             "ancestry at given confidence level."
         )
 
-    if does_have_any_common_ancestor(
-        first,
-        second,
-        confidence_level=confidence_level,
-    ):
+    if summary.DoesHaveAnyCommonAncestor():
         first_disparity = (
-            calc_definitive_max_rank_of_first_retained_disparity_between(
-                first,
-                second,
-            )
+            summary.GetDefinitiveMaxRankOfFirstRetainedDisparity()
         )
         if first_disparity is None:
             num_self_deposited = first.GetNumStrataDeposited()
             num_other_deposited = second.GetNumStrataDeposited()
             assert num_self_deposited == num_other_deposited
-        last_commonality = calc_rank_of_last_retained_commonality_between(
-            first,
-            second,
-            confidence_level=confidence_level,
-        )
+        last_commonality = summary.GetRankOfLastRetainedCommonality()
         assert last_commonality is not None
         return (
             last_commonality,
@@ -0,0 +1,55 @@
+import typing
+import warnings
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import (
+    calc_juxtaposition_statistics_batched,
+    calc_rank_of_mrca_bounds_from_statistics,
+)
+
+
+def calc_rank_of_mrca_bounds_between_batched(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairs: typing.Union[np.ndarray, typing.Sequence[typing.Tuple[int, int]]],
+    confidence_level: float = 0.95,
+) -> np.ndarray:
+    """Apply calc_rank_of_mrca_bounds_between to many pairs.
+
+    Columns are aligned into dense arrays once per call and all pairs are
+    compared with vectorized operations, so per-pair overhead is amortized
+    across the batch. Prefer few calls with many pairs.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    pairs : array-like of int, shape (n, 2)
+        Indices (first, second) into population of column pairs to compare.
+    confidence_level : float, optional
+        Bounds must capture what probability of containing the true rank of
+        the MRCA? Default 0.95.
+
+    Returns
+    -------
+    np.ndarray
+        Float array of shape (n, 2) holding inclusive lower and exclusive
+        upper bounds for each pair, with nan where
+        calc_rank_of_mrca_bounds_between returns None.
+
+    See Also
+    --------
+    build_rank_of_mrca_bounds_matrix :
+        Calculate bounds for all pairs of columns in a population.
+    """
+    statistics = calc_juxtaposition_statistics_batched(
+        population, pairs, confidence_level
+    )
+    if np.isnan(statistics["rank_of_earliest_detectable_mrca"]).any():
+        warnings.warn(
+            "Insufficient common ranks between some columns to detect common "
+            "ancestry at given confidence level."
+        )
+    return calc_rank_of_mrca_bounds_from_statistics(statistics)
@@ -0,0 +1,43 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import (
+    calc_juxtaposition_statistics_batched,
+    calc_rank_of_mrca_bounds_from_statistics,
+)
+
+
+def calc_rank_of_mrca_uncertainty_between_batched(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairs: typing.Union[np.ndarray, typing.Sequence[typing.Tuple[int, int]]],
+    confidence_level: float = 0.95,
+) -> np.ndarray:
+    """Apply calc_rank_of_mrca_uncertainty_between to many pairs.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    pairs : array-like of int, shape (n, 2)
+        Indices (first, second) into population of column pairs to compare.
+    confidence_level : float, optional
+        Default 0.95.
+
+    Returns
+    -------
+    np.ndarray
+        Float array of shape (n,), with nan where
+        calc_rank_of_mrca_uncertainty_between returns None.
+    """
+    statistics = calc_juxtaposition_statistics_batched(
+        population, pairs, confidence_level
+    )
+    bounds = calc_rank_of_mrca_bounds_from_statistics(statistics)
+    return np.where(
+        np.isnan(statistics["rank_of_earliest_detectable_mrca"]),
+        np.nan,
+        np.nan_to_num(np.abs(bounds[:, 1] - bounds[:, 0]) - 1, nan=0),
+    )
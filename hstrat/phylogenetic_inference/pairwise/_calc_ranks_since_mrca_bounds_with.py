@@ -4,14 +4,7 @@ import warnings
 import opytional as opyt
 
 from ...genome_instrumentation import HereditaryStratigraphicColumn
-from ...juxtaposition import (
-    calc_definitive_min_ranks_since_first_retained_disparity_with,
-    calc_ranks_since_last_retained_commonality_with,
-)
-from ._calc_rank_of_earliest_detectable_mrca_between import (
-    calc_rank_of_earliest_detectable_mrca_between,
-)
-from ._does_have_any_common_ancestor import does_have_any_common_ancestor
+from ...juxtaposition import summarize_juxtaposition_between
 
 
 def calc_ranks_since_mrca_bounds_with(
@@ -89,42 +82,36 @@ def calc_ranks_since_mrca_bounds_with(
     """
     assert 0.0 <= confidence_level <= 1.0
 
-    if (
-        calc_rank_of_earliest_detectable_mrca_between(
-            focal,
-            other,
-            confidence_level=confidence_level,
-        )
-        is None
-    ):
+    # compute all required statistics in one pass over both columns
+    summary = summarize_juxtaposition_between(
+        focal,
+        other,
+        confidence_level=confidence_level,
+    )
+
+    if summary.GetRankOfEarliestDetectableMrca() is None:
         warnings.warn(
             "Insufficient common ranks between columns to detect common "
             "ancestry at given confidence level."
         )
 
-    if does_have_any_common_ancestor(
-        focal,
-        other,
-        confidence_level=confidence_level,
-    ):
-        since_first_disparity = (
-            calc_definitive_min_ranks_since_first_retained_disparity_with(
-                focal,
-                other,
-            )
+    if summary.DoesHaveAnyCommonAncestor():
+        first_disparity = (
+            summary.GetDefinitiveMaxRankOfFirstRetainedDisparity()
+        )
+        since_first_disparity = opyt.apply_if(
+            first_disparity,
+            lambda rank: focal.GetNumStrataDeposited() - 1 - rank,
         )
 
         lb_exclusive = opyt.or_value(since_first_disparity, -1)
         lb_inclusive = lb_exclusive + 1
 
+        last_commonality = summary.GetRankOfLastRetainedCommonality()
+        assert last_commonality is not None
         since_last_commonality = (
-            calc_ranks_since_last_retained_commonality_with(
-                focal,
-                other,
-                confidence_level=confidence_level,
-            )
+            focal.GetNumStrataDeposited() - 1 - last_commonality
         )
-        assert since_last_commonality is not None
         ub_inclusive = since_last_commonality
         ub_exclusive = ub_inclusive + 1
 
@@ -0,0 +1,51 @@
+import typing
+import warnings
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import (
+    calc_juxtaposition_statistics_batched,
+    calc_rank_of_mrca_bounds_from_statistics,
+)
+
+
+def calc_ranks_since_mrca_bounds_with_batched(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairs: typing.Union[np.ndarray, typing.Sequence[typing.Tuple[int, int]]],
+    confidence_level: float = 0.95,
+) -> np.ndarray:
+    """Apply calc_ranks_since_mrca_bounds_with to many pairs.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    pairs : array-like of int, shape (n, 2)
+        Indices (focal, other) into population of column pairs to compare.
+    confidence_level : float, optional
+        Bounds must capture what probability of containing the true number
+        of ranks since the MRCA? Default 0.95.
+
+    Returns
+    -------
+    np.ndarray
+        Float array of shape (n, 2) holding inclusive lower and exclusive
+        upper bounds for each pair, with nan where
+        calc_ranks_since_mrca_bounds_with returns None.
+    """
+    statistics = calc_juxtaposition_statistics_batched(
+        population, pairs, confidence_level
+    )
+    if np.isnan(statistics["rank_of_earliest_detectable_mrca"]).any():
+        warnings.warn(
+            "Insufficient common ranks between some columns to detect common "
+            "ancestry at given confidence level."
+        )
+    rank_bounds = calc_rank_of_mrca_bounds_from_statistics(statistics)
+    # exclusive upper rank bound becomes inclusive lower ranks since bound,
+    # and inclusive lower rank bound becomes exclusive upper ranks since
+    # bound
+    num_strata_deposited = statistics["first_num_strata_deposited"]
+    return num_strata_deposited[:, None] - rank_bounds[:, ::-1]
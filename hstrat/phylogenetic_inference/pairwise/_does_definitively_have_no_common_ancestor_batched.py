@@ -0,0 +1,34 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import calc_juxtaposition_statistics_batched
+
+
+def does_definitively_have_no_common_ancestor_batched(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairs: typing.Union[np.ndarray, typing.Sequence[typing.Tuple[int, int]]],
+) -> np.ndarray:
+    """Apply does_definitively_have_no_common_ancestor to many pairs.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    pairs : array-like of int, shape (n, 2)
+        Indices (first, second) into population of column pairs to compare.
+
+    Returns
+    -------
+    np.ndarray
+        Bool array of shape (n,).
+    """
+    # definitive statistics do not depend on confidence level
+    return (
+        calc_juxtaposition_statistics_batched(population, pairs, 0.95)[
+            "definitive_max_rank_of_first_retained_disparity"
+        ]
+        == 0
+    )
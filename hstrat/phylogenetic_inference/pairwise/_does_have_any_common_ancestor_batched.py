@@ -0,0 +1,34 @@
+import typing
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import calc_juxtaposition_statistics_batched
+
+
+def does_have_any_common_ancestor_batched(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairs: typing.Union[np.ndarray, typing.Sequence[typing.Tuple[int, int]]],
+    confidence_level: float = 0.95,
+) -> np.ndarray:
+    """Apply does_have_any_common_ancestor to many pairs.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    pairs : array-like of int, shape (n, 2)
+        Indices (first, second) into population of column pairs to compare.
+    confidence_level : float, optional
+        Default 0.95.
+
+    Returns
+    -------
+    np.ndarray
+        Float array of shape (n,) holding 1.0 for True, 0.0 for False, and
+        nan where does_have_any_common_ancestor returns None.
+    """
+    return calc_juxtaposition_statistics_batched(
+        population, pairs, confidence_level
+    )["does_have_any_common_ancestor"]
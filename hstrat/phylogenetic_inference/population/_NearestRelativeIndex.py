@@ -0,0 +1,199 @@
+import typing
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+
+
+class _IndexNode:
+    """Prefix trie node for NearestRelativeIndex.
+
+    Implementation detail. Represents a stratum at a particular rank with a
+    particular differentia, reached through a particular chain of more
+    ancient strata.
+    """
+
+    __slots__ = (
+        "parent",
+        "rank",
+        "differentia",
+        "children",
+        "num_columns",
+        "column_ids",
+    )
+
+    parent: typing.Optional["_IndexNode"]
+    # deposition rank and differentia of stratum, None for root
+    rank: typing.Optional[int]
+    differentia: typing.Optional[int]
+    # keyed by (rank, differentia) of child stratum
+    children: typing.Dict[typing.Tuple[int, int], "_IndexNode"]
+    # number of indexed columns passing through this node
+    num_columns: int
+    # ids of indexed columns whose most recent stratum is this node
+    column_ids: typing.Set[int]
+
+    def __init__(
+        self: "_IndexNode",
+        parent: typing.Optional["_IndexNode"],
+        rank: typing.Optional[int],
+        differentia: typing.Optional[int],
+    ) -> None:
+        self.parent = parent
+        self.rank = rank
+        self.differentia = differentia
+        self.children = {}
+        self.num_columns = 0
+        self.column_ids = set()
+
+    def IterColumnIds(self: "_IndexNode") -> typing.Iterator[int]:
+        """Yield ids of all indexed columns passing through this node."""
+        # iterate rather than recurse, as tries may be very deep
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.column_ids
+            stack.extend(node.children.values())
+
+
+class NearestRelativeIndex:
+    """Look up the closest relatives of a column among indexed columns.
+
+    Indexed columns' retained strata are stored in a prefix trie keyed on
+    deposition rank and differentia, from most ancient to most recent. The
+    indexed columns sharing the longest prefix of strata with a query
+    column are its nearest relatives, with the rank of the last shared
+    stratum estimating the rank of their MRCA. A query walks one path down
+    the trie and then back up, enumerating only as many columns as
+    requested, so its cost does not grow with the number of indexed
+    columns. Columns may be added and removed at any time, each at a cost of
+    O(retained strata).
+
+    Differentia collisions are not discounted, so narrow differentia bit
+    widths yield spuriously recent MRCA estimates. Relatedness is only
+    resolved through ranks retained by both the query and indexed columns,
+    as is the case for columns sharing a stratum retention policy and
+    deposition count; differently retained ranks end the shared prefix.
+
+    See Also
+    --------
+    PhylogenyTrie :
+        Reconstruct phylogeny of columns over the same kind of trie.
+    """
+
+    _root: _IndexNode
+    # terminal node of each indexed column, by id
+    _column_nodes: typing.Dict[int, _IndexNode]
+    _next_column_id: int
+
+    def __init__(self: "NearestRelativeIndex") -> None:
+        """Initialize an empty index."""
+        self._root = _IndexNode(parent=None, rank=None, differentia=None)
+        self._column_nodes = {}
+        self._next_column_id = 0
+
+    def __len__(self: "NearestRelativeIndex") -> int:
+        """How many columns are indexed?"""
+        return len(self._column_nodes)
+
+    def GetColumnIds(self: "NearestRelativeIndex") -> typing.List[int]:
+        """Get ids of indexed columns, ascending."""
+        return sorted(self._column_nodes)
+
+    def AddColumn(
+        self: "NearestRelativeIndex",
+        column: HereditaryStratigraphicColumn,
+    ) -> int:
+        """Index column.
+
+        Later alteration of column does not affect the index. Stripped
+        columns are also accepted.
+
+        Returns
+        -------
+        int
+            Id of column within index. Ids are never reused.
+        """
+        node = self._root
+        node.num_columns += 1
+        for rank, differentia in column.IterRankDifferentia():
+            key = (rank, differentia)
+            if key not in node.children:
+                node.children[key] = _IndexNode(
+                    parent=node, rank=rank, differentia=differentia
+                )
+            node = node.children[key]
+            node.num_columns += 1
+
+        column_id = self._next_column_id
+        self._next_column_id += 1
+        node.column_ids.add(column_id)
+        self._column_nodes[column_id] = node
+        return column_id
+
+    def RemoveColumn(
+        self: "NearestRelativeIndex",
+        column_id: int,
+    ) -> None:
+        """Remove column from index."""
+        node = self._column_nodes.pop(column_id)
+        node.column_ids.remove(column_id)
+        while node is not self._root:
+            node.num_columns -= 1
+            parent = node.parent
+            if not node.num_columns:
+                # prune paths no longer used by any column
+                del parent.children[(node.rank, node.differentia)]
+            node = parent
+        self._root.num_columns -= 1
+
+    def GetNearestRelatives(
+        self: "NearestRelativeIndex",
+        column: HereditaryStratigraphicColumn,
+        num_relatives: int = 1,
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """Find indexed columns with most recent common ancestry to column.
+
+        If column itself is indexed, it will be reported as its own nearest
+        relative.
+
+        Parameters
+        ----------
+        column : HereditaryStratigraphicColumn
+            Column to find relatives of. Need not be indexed.
+        num_relatives : int, default 1
+            How many relatives to report, at most. Ties at the most distant
+            reported relationship are broken arbitrarily.
+
+        Returns
+        -------
+        list of (int, int)
+            Ids of indexed columns sharing any strata with column, paired
+            with the rank of the last stratum they share, ordered from most
+            to least recent shared rank.
+        """
+        node = self._root
+        for rank, differentia in column.IterRankDifferentia():
+            child = node.children.get((rank, differentia))
+            if child is None:
+                break
+            node = child
+
+        res = []
+        visited_child = None
+        while node is not self._root and len(res) < num_relatives:
+            # relatives branching off at node, excluding subtree already
+            # enumerated from below
+            for column_id in node.column_ids:
+                res.append((column_id, node.rank))
+                if len(res) == num_relatives:
+                    return res
+            for child in node.children.values():
+                if child is visited_child:
+                    continue
+                for column_id in child.IterColumnIds():
+                    res.append((column_id, node.rank))
+                    if len(res) == num_relatives:
+                        return res
+            visited_child = node
+            node = node.parent
+
+        return res
@@ -0,0 +1,147 @@
+import typing
+
+import pandas as pd
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from ._impl import make_alifestd_phylogeny_df
+
+
+class PhylogenyTrie:
+    """Incrementally estimate phylogenetic history of extant columns.
+
+    Columns are inserted into a prefix trie keyed on their retained strata,
+    from most ancient to most recent. Each trie node represents a
+    deposition rank and differentia, so columns sharing a prefix of strata
+    share a path from the root and diverge where their strata first
+    differ. Inserting a column walks or extends a single path, so building
+    a trie over n columns costs O(n * retained strata) with no pairwise
+    comparisons. Columns may be inserted at any time, including after a
+    phylogeny has been extracted.
+
+    Reconstruction is exact with respect to shared strata when inserted
+    columns retain the same ranks, as columns sharing a stratum retention
+    policy and deposition count do. Columns with differing retained ranks
+    diverge at the first rank retained by only one of them.
+    """
+
+    # trie node 0 is a sentinel root; other nodes each represent a stratum
+    # parent trie node of each trie node, None for root sentinel
+    _node_parents: typing.List[typing.Optional[int]]
+    # deposition rank of each trie node's stratum, None for root sentinel
+    _node_ranks: typing.List[typing.Optional[int]]
+    # maps (parent trie node, rank, differentia) to child trie node
+    _node_children: typing.Dict[typing.Tuple[int, int, int], int]
+    # trie node each inserted column's most recent stratum sits at
+    _column_nodes: typing.List[int]
+    _column_origin_times: typing.List[int]
+    _column_taxon_labels: typing.List[typing.Any]
+    _stratum_differentia_bit_width: typing.Optional[int]
+
+    def __init__(self: "PhylogenyTrie") -> None:
+        """Initialize an empty trie."""
+        self._node_parents = [None]
+        self._node_ranks = [None]
+        self._node_children = {}
+        self._column_nodes = []
+        self._column_origin_times = []
+        self._column_taxon_labels = []
+        self._stratum_differentia_bit_width = None
+
+    def __len__(self: "PhylogenyTrie") -> int:
+        """How many columns have been inserted?"""
+        return len(self._column_nodes)
+
+    def InsertColumn(
+        self: "PhylogenyTrie",
+        column: HereditaryStratigraphicColumn,
+        taxon_label: typing.Any = None,
+    ) -> int:
+        """Add a column to the trie.
+
+        Parameters
+        ----------
+        column : HereditaryStratigraphicColumn
+            Column to insert. Must share differentia bit width with columns
+            already inserted. Stripped columns are also accepted. Later
+            alteration of column does not affect the trie.
+        taxon_label : optional
+            Label reported for column in extracted phylogenies. Defaults to
+            the column's id.
+
+        Returns
+        -------
+        int
+            Id of column within extracted phylogenies, numbered in insertion
+            order from zero.
+        """
+        if self._stratum_differentia_bit_width is None:
+            self._stratum_differentia_bit_width = (
+                column.GetStratumDifferentiaBitWidth()
+            )
+        assert (
+            column.GetStratumDifferentiaBitWidth()
+            == self._stratum_differentia_bit_width
+        )
+
+        node = 0
+        for rank, differentia in column.IterRankDifferentia():
+            key = (node, rank, differentia)
+            child = self._node_children.get(key)
+            if child is None:
+                child = len(self._node_parents)
+                self._node_parents.append(node)
+                self._node_ranks.append(rank)
+                self._node_children[key] = child
+            node = child
+
+        column_id = len(self._column_nodes)
+        self._column_nodes.append(node)
+        self._column_origin_times.append(column.GetNumStrataDeposited() - 1)
+        self._column_taxon_labels.append(
+            column_id if taxon_label is None else taxon_label
+        )
+        return column_id
+
+    def ToPhylogenyDataFrame(self: "PhylogenyTrie") -> pd.DataFrame:
+        """Extract estimated phylogeny of inserted columns.
+
+        Returns
+        -------
+        pd.DataFrame
+            Reconstructed phylogeny in alife data standard format, with
+            columns id, ancestor_list, origin_time, and taxon_label, laid out
+            as by build_tree. Inserted columns have ids in insertion order
+            from zero; inner nodes, which have taxon_label None, follow.
+            Inner nodes correspond to trie nodes where lineages branch, with
+            origin time at the rank of the trie node's stratum.
+        """
+        num_nodes = len(self._node_parents)
+        num_children = [0] * num_nodes
+        for parent in self._node_parents[1:]:
+            num_children[parent] += 1
+        for node in self._column_nodes:
+            num_children[node] += 1
+
+        # drop unbranching trie nodes, mapping each trie node to its nearest
+        # kept ancestor-or-self; parents always precede children
+        inner_ids = [None] * num_nodes
+        nearest_kept = [None] * num_nodes
+        ancestor_ids = [None] * len(self)
+        origin_times = [*self._column_origin_times]
+        taxon_labels = [*self._column_taxon_labels]
+        for node in range(1, num_nodes):
+            parent = self._node_parents[node]
+            nearest_kept[node] = nearest_kept[parent]
+            if num_children[node] >= 2:
+                inner_ids[node] = len(ancestor_ids)
+                ancestor_ids.append(nearest_kept[parent])
+                origin_times.append(self._node_ranks[node])
+                taxon_labels.append(None)
+                nearest_kept[node] = inner_ids[node]
+
+        for column_id, node in enumerate(self._column_nodes):
+            ancestor_ids[column_id] = nearest_kept[node]
+
+        return make_alifestd_phylogeny_df(
+            ancestor_ids, origin_times, taxon_labels
+        )
@@ -1,7 +1,22 @@
 """Functions to infer phylogenetic history among a population of extant hstrat
 columns."""
 
-__all__ = []
+from ._NearestRelativeIndex import NearestRelativeIndex
+from ._PhylogenyTrie import PhylogenyTrie
+from ._build_pairwise_matrix import build_pairwise_matrix
+from ._build_rank_of_mrca_bounds_matrix import build_rank_of_mrca_bounds_matrix
+from ._build_tree import build_tree
+from ._calc_rank_of_mrca_bounds_among import calc_rank_of_mrca_bounds_among
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    "NearestRelativeIndex",
+    "PhylogenyTrie",
+    "build_pairwise_matrix",
+    "build_rank_of_mrca_bounds_matrix",
+    "build_tree",
+    "calc_rank_of_mrca_bounds_among",
+]
 
 from ..._auxiliary_lib import launder_impl_modules as _launder
 
@@ -0,0 +1,249 @@
+from concurrent.futures import ProcessPoolExecutor
+import itertools as it
+from multiprocessing import shared_memory
+import typing
+
+import numpy as np
+
+from ..._auxiliary_lib import min_uint_dtype_for_bit_width
+from ...genome_instrumentation import (
+    HereditaryStratigraphicColumn,
+    HereditaryStratigraphicColumnStripped,
+)
+
+# name, dtype, and shape of an array held in shared memory
+_SharedArraySpec = typing.Tuple[str, str, typing.Tuple[int, ...]]
+
+# columns, output matrix, and pairwise function for the current process
+_worker_state: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+
+def _make_shared_array(
+    shape: typing.Tuple[int, ...],
+    dtype: np.dtype,
+) -> typing.Tuple[shared_memory.SharedMemory, np.ndarray]:
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(
+        create=True,
+        # zero-size shared memory blocks are not allowed
+        size=max(int(np.prod(shape)) * dtype.itemsize, 1),
+    )
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _attach_shared_array(
+    spec: _SharedArraySpec,
+) -> typing.Tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, dtype, shape = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _initialize_worker(
+    array_specs: typing.Dict[str, _SharedArraySpec],
+    stratum_differentia_bit_width: int,
+    pairwise_function: typing.Callable,
+) -> None:
+    shms, arrays = {}, {}
+    for key, spec in array_specs.items():
+        shms[key], arrays[key] = _attach_shared_array(spec)
+    _set_worker_state(
+        shms,
+        arrays,
+        stratum_differentia_bit_width,
+        pairwise_function,
+    )
+
+
+def _set_worker_state(
+    shms: typing.Dict[str, shared_memory.SharedMemory],
+    arrays: typing.Dict[str, np.ndarray],
+    stratum_differentia_bit_width: int,
+    pairwise_function: typing.Callable,
+) -> None:
+    global _worker_state
+    offsets = arrays["offsets"]
+    _worker_state = {
+        # keep shared memory handles alive as long as views into them
+        "shms": shms,
+        "columns": [
+            HereditaryStratigraphicColumnStripped.FromArrays(
+                arrays["ranks"][begin:end],
+                arrays["differentia"][begin:end],
+                num_strata_deposited=int(num_strata_deposited),
+                stratum_differentia_bit_width=stratum_differentia_bit_width,
+            )
+            for begin, end, num_strata_deposited in zip(
+                offsets[:-1], offsets[1:], arrays["num_strata_deposited"]
+            )
+        ],
+        "out": arrays["out"],
+        "pairwise_function": pairwise_function,
+    }
+
+
+def _clear_worker_state() -> None:
+    global _worker_state
+    _worker_state = None
+
+
+def _calc_tile(
+    first_start: int,
+    first_stop: int,
+    second_start: int,
+    second_stop: int,
+) -> None:
+    columns = _worker_state["columns"]
+    out = _worker_state["out"]
+    pairwise_function = _worker_state["pairwise_function"]
+    for i, j in it.product(
+        range(first_start, first_stop),
+        range(second_start, second_stop),
+    ):
+        result = pairwise_function(columns[i], columns[j])
+        out[i, j] = np.nan if result is None else result
+
+
+def build_pairwise_matrix(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    pairwise_function: typing.Callable,
+    *,
+    result_shape: typing.Tuple[int, ...] = (),
+    tile_size: int = 64,
+    num_workers: typing.Optional[int] = None,
+) -> np.ndarray:
+    """Apply a pairwise comparison to all ordered pairs of columns in
+    parallel.
+
+    The pair space is split into square tiles, which are distributed over a
+    pool of worker processes. Columns' retained ranks and differentia are
+    packed into compact arrays placed in shared memory, which workers map
+    once at startup rather than receiving pickled columns with each task.
+    Workers write results directly into a preallocated output matrix, also
+    in shared memory.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    pairwise_function : callable
+        Function of two columns, such as calc_rank_of_mrca_bounds_between or
+        calc_ranks_since_mrca_bounds_with. Workers pass it stripped columns.
+        Must be picklable; use functools.partial to bind extra arguments
+        such as confidence_level.
+    result_shape : tuple of int, default ()
+        Shape of values returned by pairwise_function. For instance, (2,)
+        for functions returning bounds.
+    tile_size : int, default 64
+        Side length of square tiles of pairs computed per task.
+    num_workers : int, optional
+        How many worker processes to use. Defaults to number of processors.
+        If 1, all tiles are computed within the calling process.
+
+    Returns
+    -------
+    np.ndarray
+        Float array of shape (len(population), len(population),
+        *result_shape). Entry [i, j] holds
+        pairwise_function(population[i], population[j]), or nan where the
+        function returned None.
+    """
+    assert tile_size >= 1
+    num_columns = len(population)
+    if not num_columns:
+        return np.empty((0, 0, *result_shape), dtype=np.float64)
+
+    stripped = [
+        column
+        if isinstance(column, HereditaryStratigraphicColumnStripped)
+        else HereditaryStratigraphicColumnStripped(column)
+        for column in population
+    ]
+    stratum_differentia_bit_width = stripped[0].GetStratumDifferentiaBitWidth()
+    assert all(
+        column.GetStratumDifferentiaBitWidth() == stratum_differentia_bit_width
+        for column in stripped
+    )
+
+    num_retained = [column.GetNumStrataRetained() for column in stripped]
+    shapes_dtypes = {
+        "ranks": ((sum(num_retained),), np.int64),
+        "differentia": (
+            (sum(num_retained),),
+            min_uint_dtype_for_bit_width(stratum_differentia_bit_width),
+        ),
+        "offsets": ((num_columns + 1,), np.int64),
+        "num_strata_deposited": ((num_columns,), np.int64),
+        "out": ((num_columns, num_columns, *result_shape), np.float64),
+    }
+
+    shms, arrays = {}, {}
+    try:
+        for key, (shape, dtype) in shapes_dtypes.items():
+            shms[key], arrays[key] = _make_shared_array(shape, dtype)
+
+        arrays["offsets"][0] = 0
+        np.cumsum(num_retained, out=arrays["offsets"][1:])
+        for column, begin, end in zip(
+            stripped, arrays["offsets"][:-1], arrays["offsets"][1:]
+        ):
+            arrays["ranks"][begin:end] = column.GetRetainedRanksArray()
+            arrays["differentia"][
+                begin:end
+            ] = column.GetRetainedDifferentiaArray()
+        arrays["num_strata_deposited"][:] = [
+            column.GetNumStrataDeposited() for column in stripped
+        ]
+
+        bounds = range(0, num_columns, tile_size)
+        tiles = [
+            (
+                first_start,
+                min(first_start + tile_size, num_columns),
+                second_start,
+                min(second_start + tile_size, num_columns),
+            )
+            for first_start, second_start in it.product(bounds, repeat=2)
+        ]
+
+        if num_workers == 1:
+            _set_worker_state(
+                shms,
+                arrays,
+                stratum_differentia_bit_width,
+                pairwise_function,
+            )
+            try:
+                for tile in tiles:
+                    _calc_tile(*tile)
+            finally:
+                _clear_worker_state()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_initialize_worker,
+                initargs=(
+                    {
+                        key: (
+                            shm.name,
+                            arrays[key].dtype.str,
+                            arrays[key].shape,
+                        )
+                        for key, shm in shms.items()
+                    },
+                    stratum_differentia_bit_width,
+                    pairwise_function,
+                ),
+            ) as executor:
+                # consume results to propagate any worker exceptions
+                for __ in executor.map(_calc_tile, *zip(*tiles)):
+                    pass
+
+        return arrays["out"].copy()
+    finally:
+        # views into shared memory must be released before closing it
+        arrays.clear()
+        for shm in shms.values():
+            shm.close()
+            shm.unlink()
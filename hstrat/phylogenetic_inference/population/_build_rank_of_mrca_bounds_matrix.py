@@ -0,0 +1,137 @@
+from concurrent.futures import ProcessPoolExecutor
+import typing
+import warnings
+
+import numpy as np
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import (
+    StackedColumns,
+    calc_juxtaposition_statistics,
+    calc_rank_of_mrca_bounds_from_statistics,
+)
+
+# stacked columns and threshold for the current worker process
+_worker_state: typing.Optional[typing.Tuple[StackedColumns, int]] = None
+
+
+def _initialize_worker(
+    stacked: StackedColumns,
+    collision_implausibility_threshold: int,
+) -> None:
+    global _worker_state
+    _worker_state = (stacked, collision_implausibility_threshold)
+
+
+def _calc_rows(
+    stacked: StackedColumns,
+    collision_implausibility_threshold: int,
+    start: int,
+    stop: int,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    statistics = calc_juxtaposition_statistics(
+        stacked,
+        np.arange(start, stop)[:, None],
+        np.arange(len(stacked))[None, :],
+        collision_implausibility_threshold,
+    )
+    return (
+        calc_rank_of_mrca_bounds_from_statistics(statistics),
+        ~np.isnan(statistics["rank_of_earliest_detectable_mrca"]),
+    )
+
+
+def _calc_rows_in_worker(
+    start: int,
+    stop: int,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    return _calc_rows(*_worker_state, start, stop)
+
+
+def build_rank_of_mrca_bounds_matrix(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    confidence_level: float = 0.95,
+    *,
+    chunk_size: typing.Optional[int] = None,
+    num_processes: int = 1,
+) -> np.ndarray:
+    """Within what generation range did MRCA fall, for every pair?
+
+    Calculate calc_rank_of_mrca_bounds_between for all ordered pairs of
+    columns in population. Rather than comparing pairs one at a time, the
+    retained strata of all columns are aligned into a dense matrix so that
+    each column can be compared against the whole population in a handful
+    of vectorized operations.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to compare. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    confidence_level : float, optional
+        Bounds must capture what probability of containing the true rank of
+        the MRCA? Default 0.95.
+    chunk_size : int, optional
+        How many columns to compare against the population at once? Peak
+        memory use scales with chunk_size * len(population) * number of
+        distinct retained ranks. If None, chosen automatically.
+    num_processes : int, default 1
+        If greater than 1, distribute chunks over a pool of this many worker
+        processes. Columns are shipped to each worker once, at startup.
+
+    Returns
+    -------
+    np.ndarray
+        Float array of shape (len(population), len(population), 2). Entry
+        [i, j] holds inclusive lower and exclusive upper bounds on the rank
+        of the MRCA of population[i] and population[j], as reported by
+        calc_rank_of_mrca_bounds_between(population[i], population[j]), or
+        nan if no common ancestor is resolved. For a point estimate, take
+        the mean over the last axis.
+
+    See Also
+    --------
+    calc_rank_of_mrca_bounds_between :
+        Calculate bounds between a single pair of columns.
+    """
+    assert 0.0 <= confidence_level <= 1.0
+    assert num_processes >= 1
+    if not len(population):
+        return np.empty((0, 0, 2), dtype=np.float64)
+
+    stacked = StackedColumns.FromColumns(population)
+    collision_implausibility_threshold = population[
+        0
+    ].CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+        significance_level=1.0 - confidence_level,
+    )
+
+    num_columns = len(stacked)
+    if chunk_size is None:
+        # target ~16M elements per intermediate array
+        chunk_size = max(2**24 // (num_columns * len(stacked.ranks)), 1)
+    chunks = [
+        (start, min(start + chunk_size, num_columns))
+        for start in range(0, num_columns, chunk_size)
+    ]
+
+    if num_processes > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(num_processes, len(chunks)),
+            initializer=_initialize_worker,
+            initargs=(stacked, collision_implausibility_threshold),
+        ) as executor:
+            results = [*executor.map(_calc_rows_in_worker, *zip(*chunks))]
+    else:
+        results = [
+            _calc_rows(stacked, collision_implausibility_threshold, *chunk)
+            for chunk in chunks
+        ]
+
+    bounds = np.concatenate([chunk_bounds for chunk_bounds, __ in results])
+    if not all(detectable.all() for __, detectable in results):
+        warnings.warn(
+            "Insufficient common ranks between some columns to detect common "
+            "ancestry at given confidence level."
+        )
+    return bounds
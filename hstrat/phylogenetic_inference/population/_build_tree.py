@@ -0,0 +1,120 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import StackedColumns
+from ._impl import make_alifestd_phylogeny_df
+
+
+def build_tree(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    taxon_labels: typing.Optional[typing.Sequence[typing.Any]] = None,
+) -> pd.DataFrame:
+    """Estimate the phylogenetic history of a population of extant columns.
+
+    Columns are compared at the deposition ranks retained by every column
+    in population. Sorting columns lexicographically by their differentia at
+    these ranks places each column next to its closest relatives, so the
+    tree can be assembled from the lengths of prefixes shared between
+    neighbors in sorted order. Runtime is O(n log n) comparisons of
+    differentia sequences and memory is O(n) in the number of columns n; no
+    pairwise distance matrix is built, so populations of hundreds of
+    thousands of columns are practical.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Extant columns to reconstruct phylogenetic history for. Must share a
+        differentia bit width. Stripped columns are also accepted.
+    taxon_labels : sequence, optional
+        Labels for population members, reported in the taxon_label column of
+        the result. Defaults to each column's index within population.
+
+    Returns
+    -------
+    pd.DataFrame
+        Reconstructed phylogeny in alife data standard format, with columns
+        id, ancestor_list, origin_time, and taxon_label. Population member i
+        has id i; inner nodes, which have taxon_label None, follow. Origin
+        time of inner nodes is the last rank at which all their descendants
+        share a differentia; origin time of population members is the rank of
+        their most recent stratum. Columns with no shared differentia at all
+        are placed in separate trees.
+
+    Notes
+    -----
+    Spurious differentia collisions are not discounted, so narrow
+    differentia bit widths yield spuriously deep shared prefixes and hence
+    MRCA estimates skewed late. Strata retained by only some columns are
+    not considered, so populations with very uneven deposition counts
+    reconstruct with lower resolution.
+
+    See Also
+    --------
+    PhylogenyTrie :
+        Reconstruct phylogeny incrementally as columns become available.
+    build_rank_of_mrca_bounds_matrix :
+        All-pairs MRCA rank bounds, suitable for distance-based tree
+        reconstruction of smaller populations.
+    """
+    num_columns = len(population)
+    if taxon_labels is None:
+        taxon_labels = range(num_columns)
+    assert len(taxon_labels) == num_columns
+    if not num_columns:
+        return make_alifestd_phylogeny_df([], [], [])
+
+    stacked = StackedColumns.FromColumns(population)
+    is_shared = stacked.retained.all(axis=0)
+    shared_ranks = stacked.ranks[is_shared]
+    shared_differentia = stacked.differentia[:, is_shared]
+    # policies must retain the most ancient stratum
+    num_shared = len(shared_ranks)
+    assert num_shared
+
+    # sort with differentia at most ancient shared rank as primary key
+    order = np.lexsort(shared_differentia.T[::-1])
+    sorted_differentia = shared_differentia[order]
+    mismatches = sorted_differentia[1:] != sorted_differentia[:-1]
+    # number of leading shared ranks with matching differentia between each
+    # column and its predecessor in sorted order
+    prefix_lengths = np.where(
+        mismatches.any(axis=1),
+        mismatches.argmax(axis=1),
+        num_shared,
+    )
+
+    ancestor_ids = [None] * num_columns
+    origin_times = (stacked.num_strata_deposited - 1).tolist()
+    node_labels = [*taxon_labels]
+
+    # path from root to most recently placed column, as (node id, prefix
+    # length) with prefix lengths strictly increasing; sentinel root None
+    # collects columns without any shared differentia
+    stack = [(None, 0)]
+    leaf_prefix_length = num_shared + 1
+
+    def unwind(prefix_length: int) -> None:
+        popped = None
+        while stack[-1][1] > prefix_length:
+            popped, __ = stack.pop()
+            if stack[-1][1] >= prefix_length:
+                ancestor_ids[popped] = stack[-1][0]
+        if popped is not None and stack[-1][1] < prefix_length:
+            # splice in new inner node as ancestor of popped subtree
+            inner_id = len(ancestor_ids)
+            ancestor_ids.append(None)
+            origin_times.append(int(shared_ranks[prefix_length - 1]))
+            node_labels.append(None)
+            ancestor_ids[popped] = inner_id
+            stack.append((inner_id, prefix_length))
+
+    stack.append((int(order[0]), leaf_prefix_length))
+    for column_idx, prefix_length in zip(order[1:], prefix_lengths):
+        unwind(int(prefix_length))
+        stack.append((int(column_idx), leaf_prefix_length))
+    unwind(0)
+
+    return make_alifestd_phylogeny_df(ancestor_ids, origin_times, node_labels)
@@ -0,0 +1,114 @@
+import typing
+import warnings
+
+import numpy as np
+import opytional as opyt
+
+from ...genome_instrumentation import HereditaryStratigraphicColumn
+from .._impl import StackedColumns
+
+
+def calc_rank_of_mrca_bounds_among(
+    population: typing.Sequence[HereditaryStratigraphicColumn],
+    confidence_level: float = 0.95,
+) -> typing.Optional[typing.Tuple[int, int]]:
+    """Within what generation range did the MRCA of all columns fall?
+
+    Calculate bounds on estimate for the number of depositions elapsed
+    along the line of descent before the most recent common ancestor of
+    every column in population. Generalizes calc_rank_of_mrca_bounds_between
+    from two to any number of columns, with identical results for two.
+
+    All columns' strata are compared in a single merge over ranks, rather
+    than by reducing over pairwise comparisons. Ranks retained by every
+    column are common ranks; the first disparity is the first common rank
+    where not all columns' differentia agree.
+
+    Parameters
+    ----------
+    population : sequence of HereditaryStratigraphicColumn
+        Columns to find MRCA of. Must share a differentia bit width. Stripped
+        columns are also accepted.
+    confidence_level : float, optional
+        Bounds must capture what probability of containing the true rank of
+        the MRCA? Default 0.95.
+
+    Returns
+    -------
+    (int, int), optional
+        Inclusive lower and then exclusive upper bound on estimate or None
+        if no common ancestor among all columns can be resolved with
+        sufficient confidence.
+
+    See Also
+    --------
+    calc_rank_of_mrca_bounds_between :
+        Calculate bounds between a single pair of columns.
+
+    Notes
+    -----
+    Spurious differentia collisions are discounted as they would be between
+    two columns. Spurious agreement among more than two columns is less
+    likely, so bounds are conservative.
+    """
+    assert 0.0 <= confidence_level <= 1.0
+    assert len(population)
+
+    stacked = StackedColumns.FromColumns(population)
+    collision_implausibility_threshold = population[
+        0
+    ].CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+        significance_level=1.0 - confidence_level,
+    )
+
+    is_common = stacked.retained.all(axis=0)
+    common_ranks = stacked.ranks[is_common].tolist()
+    common_differentia = stacked.differentia[:, is_common]
+    (mismatch_positions,) = np.nonzero(
+        (common_differentia != common_differentia[0]).any(axis=0)
+    )
+    num_common_strata = (
+        int(mismatch_positions[0])
+        if len(mismatch_positions)
+        else len(common_ranks)
+    )
+
+    if len(common_ranks) < collision_implausibility_threshold:
+        warnings.warn(
+            "Insufficient common ranks among columns to detect common "
+            "ancestry at given confidence level."
+        )
+        return None
+
+    newest_rank = int(stacked.newest_ranks.min())
+    same_newest = bool((stacked.newest_ranks == newest_rank).all())
+
+    def calc_rank_of_first_retained_disparity(
+        threshold: int,
+    ) -> typing.Optional[int]:
+        # discount threshold - 1 preceding common ranks due to potential
+        # spurious differentia collisions
+        res_idx = max(num_common_strata + 1 - threshold, 0)
+        if len(mismatch_positions) or res_idx < len(common_ranks):
+            return common_ranks[res_idx]
+        elif same_newest:
+            return None
+        else:
+            # conservatively assume mismatch with next rank of the column
+            # with fewest strata deposited
+            return newest_rank + 1
+
+    first_disparity = calc_rank_of_first_retained_disparity(
+        collision_implausibility_threshold
+    )
+    if first_disparity == 0:
+        return None
+
+    assert num_common_strata >= collision_implausibility_threshold
+    return (
+        common_ranks[num_common_strata - collision_implausibility_threshold],
+        opyt.or_value(
+            calc_rank_of_first_retained_disparity(1),
+            int(stacked.num_strata_deposited[0]),
+        ),
+    )
@@ -0,0 +1,8 @@
+"""Implementation helpers."""
+
+from ._make_alifestd_phylogeny_df import make_alifestd_phylogeny_df
+
+# adapted from https://stackoverflow.com/a/31079085
+__all__ = [
+    "make_alifestd_phylogeny_df",
+]
@@ -0,0 +1,30 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+def make_alifestd_phylogeny_df(
+    ancestor_ids: typing.Sequence[typing.Optional[int]],
+    origin_times: typing.Sequence[int],
+    taxon_labels: typing.Sequence[typing.Any],
+) -> pd.DataFrame:
+    """Assemble a phylogeny table in alife data standard format.
+
+    Implementation detail. Node ids are positions within the argument
+    sequences. Root nodes have ancestor id None.
+
+    See <https://alife-data-standards.github.io/alife-data-standards/phylogeny.html>.
+    """
+    assert len(ancestor_ids) == len(origin_times) == len(taxon_labels)
+    return pd.DataFrame(
+        {
+            "id": np.arange(len(ancestor_ids)),
+            "ancestor_list": [
+                "[none]" if ancestor_id is None else f"[{ancestor_id}]"
+                for ancestor_id in ancestor_ids
+            ],
+            "origin_time": origin_times,
+            "taxon_label": taxon_labels,
+        }
+    )
@@ -31,6 +31,10 @@ class PolicySpec(PolicySpecBase):
             self._depth_proportional_resolution,
         ) == (other._depth_proportional_resolution,)
 
+    def __hash__(self: "PolicySpec") -> int:
+        """Hash object instance."""
+        return hash((self._depth_proportional_resolution,))
+
     def __repr__(self: "PolicySpec") -> str:
         return f"""{
             self.GetAlgoIdentifier()
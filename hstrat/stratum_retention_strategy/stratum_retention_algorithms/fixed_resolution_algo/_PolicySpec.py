@@ -29,6 +29,10 @@ class PolicySpec(PolicySpecBase):
             self._fixed_resolution,
         ) == (other._fixed_resolution,)
 
+    def __hash__(self: "PolicySpec") -> int:
+        """Hash object instance."""
+        return hash((self._fixed_resolution,))
+
     def __repr__(self: "PolicySpec") -> str:
         return f"""{
             self.GetAlgoIdentifier()
@@ -50,6 +50,15 @@ class PolicySpec(PolicySpecBase):
             other._interspersal,
         )
 
+    def __hash__(self: "PolicySpec") -> int:
+        """Hash object instance."""
+        return hash(
+            (
+                self._degree,
+                self._interspersal,
+            )
+        )
+
     def __repr__(self: "PolicySpec") -> str:
         return f"""{
             self.GetAlgoIdentifier()
@@ -9,6 +9,10 @@ class PolicySpec(PolicySpecBase):
     def __eq__(self: "PolicySpec", other: typing.Any) -> bool:
         return isinstance(other, self.__class__)
 
+    def __hash__(self: "PolicySpec") -> int:
+        """Hash object instance."""
+        return hash(self.GetAlgoIdentifier())
+
     def __repr__(self: "PolicySpec") -> str:
         return f"""{
             self.GetAlgoIdentifier()
@@ -24,11 +24,15 @@ class PolicySpec(PolicySpecBase):
             other._hash_salt,
         )
 
+    def __hash__(self: "PolicySpec") -> int:
+        """Hash object instance."""
+        return hash((self._hash_salt,))
+
     def __repr__(self: "PolicySpec") -> str:
         return f"""{
             self.GetAlgoIdentifier()
         }.{
-            __package__.split(".")[-1]
+            PolicySpec.__qualname__
         }(hash_salt={
             self._hash_salt
         })"""
@@ -20,7 +20,9 @@ requirements = [
     "matplotlib>=3.5.2",
     "mmh3>=3.0.0",
     "mpmath>=1.1.0",
+    "numpy>=1.21.0",
     "opytional>=0.1.0",
+    "pandas>=1.1.0",
     "python-slugify>=6.1.2",
     "safe_assert>=0.2.0",
     "seaborn>=0.11.2",
@@ -0,0 +1,26 @@
+import unittest
+
+import numpy as np
+
+from hstrat._auxiliary_lib import min_uint_dtype_for_bit_width
+
+
+class TestMinUintDtypeForBitWidth(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test(self):
+        assert min_uint_dtype_for_bit_width(1) == np.uint8
+        assert min_uint_dtype_for_bit_width(8) == np.uint8
+        assert min_uint_dtype_for_bit_width(9) == np.uint16
+        assert min_uint_dtype_for_bit_width(16) == np.uint16
+        assert min_uint_dtype_for_bit_width(17) == np.uint32
+        assert min_uint_dtype_for_bit_width(32) == np.uint32
+        assert min_uint_dtype_for_bit_width(33) == np.uint64
+        assert min_uint_dtype_for_bit_width(64) == np.uint64
+        assert min_uint_dtype_for_bit_width(65) == object
+
+
+if __name__ == "__main__":
+    unittest.main()
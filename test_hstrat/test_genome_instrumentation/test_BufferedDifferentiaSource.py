@@ -0,0 +1,85 @@
+import pytest
+
+from hstrat import hstrat
+
+
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 2, 8, 32, 63, 64, 65, 129],
+)
+@pytest.mark.parametrize(
+    "block_size",
+    [1, 7, 4096],
+)
+def test_range(differentia_bit_width, block_size):
+    source = hstrat.BufferedDifferentiaSource(block_size=block_size)
+    draws = [source(differentia_bit_width) for __ in range(100)]
+    assert all(isinstance(draw, int) for draw in draws)
+    assert all(0 <= draw < 2**differentia_bit_width for draw in draws)
+    if differentia_bit_width >= 32:
+        assert len(set(draws)) == len(draws)
+
+
+def test_coverage():
+    source = hstrat.BufferedDifferentiaSource(block_size=10)
+    assert {source(2) for __ in range(1000)} == {0, 1, 2, 3}
+    assert {source(1) for __ in range(1000)} == {0, 1}
+
+
+def test_seed():
+    source1 = hstrat.BufferedDifferentiaSource(block_size=10, seed=1)
+    source2 = hstrat.BufferedDifferentiaSource(block_size=10, seed=1)
+    source3 = hstrat.BufferedDifferentiaSource(block_size=10, seed=2)
+    draws1 = [source1(64) for __ in range(100)]
+    draws2 = [source2(64) for __ in range(100)]
+    draws3 = [source3(64) for __ in range(100)]
+    assert draws1 == draws2
+    assert draws1 != draws3
+
+
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreArray,
+        hstrat.HereditaryStratumOrderedStoreDict,
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreTree,
+    ],
+)
+def test_column(ordered_store):
+    def make_column():
+        return hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_source=hstrat.BufferedDifferentiaSource(
+                seed=1,
+            ),
+            stratum_ordered_store_factory=ordered_store,
+            stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(3),
+        )
+
+    column1 = make_column()
+    column2 = make_column()
+    for __ in range(100):
+        column1.DepositStratum()
+        column2.DepositStratum()
+    assert [*column1._stratum_ordered_store.IterRankDifferentia()] == [
+        *column2._stratum_ordered_store.IterRankDifferentia()
+    ]
+
+    descendant1 = column1.CloneDescendant()
+    descendant2 = column1.CloneDescendant()
+    assert (
+        descendant1._stratum_differentia_source
+        is column1._stratum_differentia_source
+    )
+    assert (
+        hstrat.calc_rank_of_last_retained_commonality_between(
+            descendant1, descendant2
+        )
+        == 99
+    )
+    assert (
+        hstrat.calc_rank_of_first_retained_disparity_between(
+            descendant1, descendant2
+        )
+        == 101
+    )
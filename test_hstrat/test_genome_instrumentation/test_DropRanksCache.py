@@ -0,0 +1,128 @@
+import pytest
+
+from hstrat import hstrat
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.depth_proportional_resolution_algo.Policy(4),
+        hstrat.depth_proportional_resolution_tapered_algo.Policy(4),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.geom_seq_nth_root_algo.Policy(3, 2),
+        hstrat.geom_seq_nth_root_tapered_algo.Policy(3, 2),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.pseudostochastic_algo.Policy(hash_salt=1),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+def test_GenDropRanks(retention_policy):
+    cache = hstrat.DropRanksCache()
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=retention_policy,
+    )
+    for __ in range(200):
+        num_deposited = column.GetNumStrataDeposited()
+        column._stratum_ordered_store.DepositStratum(
+            rank=num_deposited,
+            stratum=hstrat.HereditaryStratum(deposition_rank=num_deposited),
+        )
+        for __ in range(3):
+            assert [
+                *cache.GenDropRanks(
+                    retention_policy,
+                    num_stratum_depositions_completed=num_deposited,
+                    retained_ranks=column.IterRetainedRanks(),
+                )
+            ] == [
+                *retention_policy.GenDropRanks(
+                    num_stratum_depositions_completed=num_deposited,
+                    retained_ranks=column.IterRetainedRanks(),
+                )
+            ]
+        column._stratum_ordered_store.DelRanks(
+            ranks=[
+                *retention_policy.GenDropRanks(
+                    num_stratum_depositions_completed=num_deposited,
+                    retained_ranks=column.IterRetainedRanks(),
+                )
+            ],
+        )
+        column._num_strata_deposited += 1
+
+    assert cache.GetNumMisses() == 200
+    assert cache.GetNumHits() == 400
+
+
+def test_hits_misses():
+    cache = hstrat.DropRanksCache()
+    policy = hstrat.fixed_resolution_algo.Policy(3)
+    equivalent_policy = hstrat.fixed_resolution_algo.Policy(3)
+    other_policy = hstrat.fixed_resolution_algo.Policy(4)
+    retained_ranks = [0, 3, 4, 5]
+
+    assert [*cache.GenDropRanks(policy, 5, retained_ranks)] == [4]
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 1)
+    assert [*cache.GenDropRanks(equivalent_policy, 5, iter(()))] == [4]
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (1, 1)
+    cache.GenDropRanks(other_policy, 5, retained_ranks)
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (1, 2)
+    cache.GenDropRanks(policy, 6, retained_ranks)
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (1, 3)
+
+    cache.Clear()
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 0)
+    cache.GenDropRanks(policy, 5, retained_ranks)
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 1)
+
+
+def test_max_size():
+    cache = hstrat.DropRanksCache(max_size=2)
+    assert cache.GetMaxSize() == 2
+    policy = hstrat.perfect_resolution_algo.Policy()
+    for num_deposited in range(3):
+        cache.GenDropRanks(policy, num_deposited, range(num_deposited))
+    cache.GenDropRanks(policy, 0, ())
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 4)
+
+    cache.SetMaxSize(10)
+    assert cache.GetMaxSize() == 10
+
+
+def test_stochastic_bypass():
+    cache = hstrat.DropRanksCache()
+    policy = hstrat.stochastic_algo.Policy()
+    for __ in range(10):
+        cache.GenDropRanks(policy, 5, [0, 1, 2, 3, 4, 5])
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 0)
+
+
+def test_column():
+    cache = hstrat.HereditaryStratigraphicColumn.GetDropRanksCache()
+    assert cache is hstrat.HereditaryStratigraphicColumn.GetDropRanksCache()
+    cache.Clear()
+
+    policy = hstrat.recency_proportional_resolution_algo.Policy(3)
+    population = [
+        hstrat.HereditaryStratigraphicColumn(stratum_retention_policy=policy)
+        for __ in range(10)
+    ]
+    for __ in range(99):
+        for column in population:
+            column.DepositStratum()
+
+    assert cache.GetNumMisses() == 100
+    assert cache.GetNumHits() == 900
+
+    reference = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=policy,
+    )
+    cache.Clear()
+    for __ in range(99):
+        reference.DepositStratum()
+    for column in population:
+        assert [*column.IterRetainedRanks()] == [
+            *reference.IterRetainedRanks()
+        ]
+    assert population[0] != population[1]
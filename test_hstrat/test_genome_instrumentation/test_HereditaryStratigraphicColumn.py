@@ -1,5 +1,7 @@
 from copy import deepcopy
+import functools
 import itertools as it
+import math
 import pickle
 import random
 import tempfile
@@ -20,8 +22,15 @@ from hstrat import hstrat
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -53,8 +62,15 @@ def test_Clone1(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -89,8 +105,15 @@ def test_Clone2(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -134,8 +157,15 @@ def test_Clone3(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -173,8 +203,15 @@ def test_Clone4(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -203,8 +240,15 @@ def test_pickle(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -235,8 +279,15 @@ def test_pickle_with_deposits(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -275,8 +326,15 @@ def test_pickle_with_population(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -321,8 +379,15 @@ def test_eq(
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -372,8 +437,15 @@ def test_annotation(retention_policy, ordered_store):
 @pytest.mark.parametrize(
     "ordered_store",
     [
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreDict,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreDict, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreList,
+        functools.partial(
+            hstrat.HereditaryStratumOrderedStoreList, copy_on_write=True
+        ),
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -404,6 +476,181 @@ def test_always_store_rank_in_stratum(retention_policy, ordered_store):
         second.DepositStratum()
 
 
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.depth_proportional_resolution_algo.Policy(4),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.geom_seq_nth_root_tapered_algo.Policy(2, 3),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.pseudostochastic_algo.Policy(hash_salt=1),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreArray,
+        hstrat.HereditaryStratumOrderedStoreDict,
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreTree,
+    ],
+)
+@pytest.mark.parametrize(
+    "always_store_rank_in_stratum",
+    [True, False],
+)
+def test_DepositStrata(
+    retention_policy, ordered_store, always_store_rank_in_stratum
+):
+    def make_column():
+        return hstrat.HereditaryStratigraphicColumn(
+            always_store_rank_in_stratum=always_store_rank_in_stratum,
+            stratum_ordered_store_factory=ordered_store,
+            stratum_retention_policy=retention_policy,
+        )
+
+    column = make_column()
+    reference = make_column()
+    for num_strata in 0, 1, 5, 0, 37, 1, 200:
+        column.DepositStrata(num_strata)
+        for __ in range(num_strata):
+            reference.DepositStratum()
+
+        assert (
+            column.GetNumStrataDeposited() == reference.GetNumStrataDeposited()
+        )
+        assert column.GetNumStrataRetained() == (
+            reference.GetNumStrataRetained()
+        )
+        assert [*column.IterRetainedRanks()] == [
+            *reference.IterRetainedRanks()
+        ]
+
+        clone = column.CloneDescendant()
+        column.DepositStrata(1)
+        assert (
+            hstrat.calc_rank_of_first_retained_disparity_between(column, clone)
+            == clone.GetNumStrataDeposited() - 1
+        )
+        reference.DepositStratum()
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.depth_proportional_resolution_algo.Policy(4),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.geom_seq_nth_root_tapered_algo.Policy(2, 3),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.pseudostochastic_algo.Policy(hash_salt=1),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+        hstrat.stochastic_algo.Policy(),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 3, 8, 13, 64, 65, 129],
+)
+@pytest.mark.parametrize(
+    "always_store_rank_in_stratum",
+    [True, False],
+)
+def test_ToBytes_FromBytes(
+    retention_policy, differentia_bit_width, always_store_rank_in_stratum
+):
+    column = hstrat.HereditaryStratigraphicColumn(
+        always_store_rank_in_stratum=always_store_rank_in_stratum,
+        stratum_differentia_bit_width=differentia_bit_width,
+        stratum_retention_policy=retention_policy,
+    )
+    for num_strata in 0, 1, 10, 100:
+        column.DepositStrata(num_strata)
+        record = column.ToBytes()
+        assert isinstance(record, bytes)
+        assert hstrat.HereditaryStratigraphicColumn.FromBytes(record) == column
+
+        for ordered_store in (
+            functools.partial(
+                hstrat.HereditaryStratumOrderedStoreArray,
+                differentia_bit_width=differentia_bit_width,
+            ),
+            hstrat.HereditaryStratumOrderedStoreTree,
+        ):
+            deserialized = hstrat.HereditaryStratigraphicColumn.FromBytes(
+                bytearray(record),
+                stratum_ordered_store_factory=ordered_store,
+            )
+            assert deserialized.GetNumStrataDeposited() == (
+                column.GetNumStrataDeposited()
+            )
+            assert sorted(deserialized.IterRetainedRanks()) == [
+                *column.IterRetainedRanks()
+            ]
+            assert [
+                deserialized.GetStratumAtColumnIndex(idx).GetDifferentia()
+                for idx in range(deserialized.GetNumStrataRetained())
+            ] == [
+                column.GetStratumAtColumnIndex(idx).GetDifferentia()
+                for idx in range(column.GetNumStrataRetained())
+            ]
+            assert hstrat.calc_rank_of_first_retained_disparity_between(
+                column, deserialized
+            ) == hstrat.calc_rank_of_first_retained_disparity_between(
+                column, column.Clone()
+            )
+
+
+def test_ToBytes_size():
+    def make_column(retention_policy, differentia_bit_width):
+        column = hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_bit_width,
+            stratum_retention_policy=retention_policy,
+        )
+        column.DepositStrata(999)
+        return column
+
+    policy = hstrat.perfect_resolution_algo.Policy()
+    omitted = make_column(policy, 1).ToBytes()
+    included = make_column(policy.WithoutCalcRankAtColumnIndex(), 1).ToBytes()
+    assert len(included) - len(omitted) == 8 * 1000
+    assert len(omitted) < 200
+
+    assert len(make_column(policy, 64).ToBytes()) - len(omitted) == 7875
+
+
+def test_FromBytes_no_deposition():
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(3),
+    )
+    column.DepositStrata(100)
+    record = column.ToBytes()
+
+    drop_ranks_cache = hstrat.HereditaryStratigraphicColumn.GetDropRanksCache()
+    num_hits = drop_ranks_cache.GetNumHits()
+    num_misses = drop_ranks_cache.GetNumMisses()
+    random_state = random.getstate()
+
+    assert hstrat.HereditaryStratigraphicColumn.FromBytes(record) == column
+
+    # no throwaway stratum should be generated or purged
+    assert random.getstate() == random_state
+    assert drop_ranks_cache.GetNumHits() == num_hits
+    assert drop_ranks_cache.GetNumMisses() == num_misses
+
+
+def test_FromBytes_malformed():
+    record = hstrat.HereditaryStratigraphicColumn().ToBytes()
+    with pytest.raises(ValueError):
+        hstrat.HereditaryStratigraphicColumn.FromBytes(record[:10])
+    with pytest.raises(ValueError):
+        hstrat.HereditaryStratigraphicColumn.FromBytes(record[:-1])
+    with pytest.raises(ValueError):
+        hstrat.HereditaryStratigraphicColumn.FromBytes(b"x" + record[1:])
+
+
 def test_GetNumStrataDeposited():
     column = hstrat.HereditaryStratigraphicColumn()
     for i in range(10):
@@ -570,3 +817,37 @@ def test_CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions():
         )
         == 1
     )
+
+
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 2, 5, 8, 64],
+)
+@pytest.mark.parametrize(
+    "significance_level",
+    [0.0001, 0.01, 0.05, 0.51, 1.0],
+)
+def test_CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions_shared(
+    differentia_bit_width, significance_level
+):
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_differentia_bit_width=differentia_bit_width,
+    )
+    expected = int(
+        math.ceil(
+            math.log(
+                significance_level,
+                column.CalcProbabilityDifferentiaCollision(),
+            )
+        )
+    )
+    stripped = hstrat.HereditaryStratigraphicColumnStripped(column)
+    # repeat calls are served from the shared table
+    for __ in range(2):
+        for c in column, stripped:
+            assert (
+                c.CalcMinImplausibleSpuriousConsecutiveDifferentiaCollisions(
+                    significance_level=significance_level,
+                )
+                == expected
+            )
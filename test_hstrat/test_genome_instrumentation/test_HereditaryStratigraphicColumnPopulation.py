@@ -0,0 +1,281 @@
+import itertools as it
+import random
+
+import numpy as np
+import pytest
+
+from hstrat import hstrat
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.depth_proportional_resolution_algo.Policy(4),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.geom_seq_nth_root_algo.Policy(3, 2),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.pseudostochastic_algo.Policy(hash_salt=1),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 8, 64],
+)
+def test_DepositStrata(retention_policy, differentia_bit_width):
+    population = hstrat.HereditaryStratigraphicColumnPopulation(
+        stratum_differentia_bit_width=differentia_bit_width,
+    )
+    column_ids = population.NewColumns(10, retention_policy)
+    assert len(population) == 10
+    reference = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=retention_policy,
+        stratum_differentia_bit_width=differentia_bit_width,
+    )
+
+    for generation in range(100):
+        for column_id in column_ids:
+            column = population.GetColumn(column_id)
+            assert column.GetNumStrataDeposited() == generation + 1
+            assert population.GetNumStrataDeposited(column_id) == (
+                generation + 1
+            )
+            assert [*column.IterRetainedRanks()] == [
+                *reference.IterRetainedRanks()
+            ]
+            store = column._stratum_ordered_store
+            assert all(
+                0 <= differentia < 2**differentia_bit_width
+                for __, differentia in store.IterRankDifferentia()
+            )
+
+        population.DepositStrata()
+        reference.DepositStratum()
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+def test_CloneColumns(retention_policy):
+    population = hstrat.HereditaryStratigraphicColumnPopulation()
+    (founder,) = population.NewColumns(1, retention_policy)
+    for __ in range(10):
+        population.DepositStrata()
+
+    clone1, clone2, clone3 = population.CloneColumns([founder] * 3)
+    assert len(population) == 4
+    assert population.GetColumn(clone1) == population.GetColumn(founder)
+    for __ in range(30):
+        population.DepositStrata()
+
+    for first, second in it.combinations([founder, clone1, clone2, clone3], 2):
+        lb, ub = hstrat.calc_rank_of_mrca_bounds_between(
+            population.GetColumn(first),
+            population.GetColumn(second),
+        )
+        assert lb <= 10 < ub
+
+
+def test_RemoveColumns():
+    population = hstrat.HereditaryStratigraphicColumnPopulation()
+    column_ids = population.NewColumns(
+        10, hstrat.fixed_resolution_algo.Policy(3)
+    )
+    population.DepositStrata()
+    column_ids += population.NewColumns(
+        10, hstrat.fixed_resolution_algo.Policy(3)
+    )
+    assert len(population._groups) == 2
+
+    population.RemoveColumns(column_ids[:10])
+    assert len(population) == 10
+    assert population.GetColumnIds() == column_ids[10:]
+    assert len(population._groups) == 1
+
+    population.DepositStrata()
+    for column_id in column_ids[10:]:
+        assert population.GetNumStrataDeposited(column_id) == 2
+
+
+def test_NewColumns_empty():
+    population = hstrat.HereditaryStratigraphicColumnPopulation()
+    assert population.NewColumns(0) == []
+    assert len(population) == 0
+    assert len(population._groups) == 0
+
+    population.NewColumns(3)
+    population.DepositStrata()
+    assert population.NewColumns(0) == []
+    assert len(population) == 3
+    assert len(population._groups) == 1
+
+
+def test_group_lookup_after_DepositStrata():
+    policy = hstrat.fixed_resolution_algo.Policy(3)
+    population = hstrat.HereditaryStratigraphicColumnPopulation()
+    column_ids = population.NewColumns(5, policy)
+    population.DepositStrata()
+    population.DepositStrata()
+
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_differentia_bit_width=64,
+        stratum_retention_policy=policy,
+    )
+    for __ in range(2):
+        column.DepositStratum()
+
+    # added column joins the existing group at the same depth
+    column_ids.append(population.AddColumn(column))
+    assert len(population._groups) == 1
+    population.DepositStrata()
+    assert len(population._groups) == 1
+    for column_id in column_ids:
+        assert population.GetNumStrataDeposited(column_id) == 4
+
+
+def test_AddColumn():
+    population = hstrat.HereditaryStratigraphicColumnPopulation()
+    policy = hstrat.geom_seq_nth_root_algo.Policy(2, 2)
+    columns = [
+        hstrat.HereditaryStratigraphicColumn(
+            always_store_rank_in_stratum=False,
+            stratum_retention_policy=policy,
+        )
+        for __ in range(5)
+    ]
+    column_ids = []
+    for generation in range(20):
+        for column in columns:
+            column.DepositStratum()
+        column_ids.append(population.AddColumn(random.choice(columns)))
+
+    for column_id in column_ids:
+        population.GetColumn(column_id)
+
+    final_ids = []
+    for column in columns:
+        column_id = population.AddColumn(column)
+        final_ids.append(column_id)
+        extracted = population.GetColumn(column_id)
+        assert [*extracted.IterRetainedRanks()] == [
+            *column.IterRetainedRanks()
+        ]
+        assert [*extracted._stratum_ordered_store.IterRankDifferentia()] == [
+            *column._stratum_ordered_store.IterRankDifferentia(
+                get_rank_at_column_index=column.GetRankAtColumnIndex,
+            )
+        ]
+
+    population.DepositStrata()
+    for column in columns:
+        column.DepositStratum()
+    for column_id in final_ids:
+        assert [*population.GetColumn(column_id).IterRetainedRanks()] == [
+            *columns[0].IterRetainedRanks()
+        ]
+
+
+def test_seed():
+    population1 = hstrat.HereditaryStratigraphicColumnPopulation(seed=1)
+    population2 = hstrat.HereditaryStratigraphicColumnPopulation(seed=1)
+    for population in population1, population2:
+        population.NewColumns(10)
+        population.DepositStrata()
+
+    for column_id in population1.GetColumnIds():
+        assert population1.GetColumn(column_id) == population2.GetColumn(
+            column_id
+        )
+
+
+def test_stochastic_policy():
+    population = hstrat.HereditaryStratigraphicColumnPopulation()
+    with pytest.raises(AssertionError):
+        population.NewColumns(10, hstrat.stochastic_algo.Policy())
+
+
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 8, 16, 64],
+)
+@pytest.mark.parametrize(
+    "mmap_mode",
+    ["r", "c", None],
+)
+def test_ToFile_FromFile(tmp_path, differentia_bit_width, mmap_mode):
+    population = hstrat.HereditaryStratigraphicColumnPopulation(
+        stratum_differentia_bit_width=differentia_bit_width,
+    )
+    population.NewColumns(5, hstrat.fixed_resolution_algo.Policy(3))
+    for __ in range(10):
+        population.DepositStrata()
+    population.NewColumns(5, hstrat.geom_seq_nth_root_algo.Policy(2, 2))
+    population.NewColumns(5, hstrat.pseudostochastic_algo.Policy(hash_salt=1))
+    population.DepositStrata()
+
+    path = str(tmp_path / "population.hstrpop")
+    population.ToFile(path)
+    loaded = hstrat.HereditaryStratigraphicColumnPopulation.FromFile(
+        path,
+        mmap_mode=mmap_mode,
+    )
+
+    assert len(loaded) == len(population)
+    assert loaded.GetColumnIds() == population.GetColumnIds()
+    assert loaded.GetStratumDifferentiaBitWidth() == differentia_bit_width
+    for column_id in population.GetColumnIds():
+        assert loaded.GetColumn(column_id) == population.GetColumn(column_id)
+        differentia = loaded.GetColumnDifferentia(column_id)
+        assert isinstance(differentia.base, np.memmap) == (
+            mmap_mode is not None
+        )
+        assert differentia.tolist() == (
+            population.GetColumnDifferentia(column_id).tolist()
+        )
+        assert loaded.GetColumnRanks(column_id).tolist() == (
+            population.GetColumnRanks(column_id).tolist()
+        )
+
+    for column_id in population.GetColumnIds():
+        stripped = loaded.GetColumnStripped(column_id)
+        assert stripped == hstrat.HereditaryStratigraphicColumnStripped(
+            population.GetColumn(column_id)
+        )
+        assert np.shares_memory(
+            stripped.GetRetainedDifferentiaArray(),
+            loaded.GetColumnDifferentia(column_id),
+        )
+
+    # loaded populations can be advanced without altering file
+    (clone_id,) = loaded.CloneColumns(loaded.GetColumnIds()[:1])
+    assert clone_id not in population.GetColumnIds()
+    for __ in range(5):
+        population.DepositStrata()
+        loaded.DepositStrata()
+    for column_id in population.GetColumnIds():
+        assert loaded.GetNumStrataDeposited(column_id) == (
+            population.GetNumStrataDeposited(column_id)
+        )
+        assert [*loaded.GetColumn(column_id).IterRetainedRanks()] == [
+            *population.GetColumn(column_id).IterRetainedRanks()
+        ]
+
+    reloaded = hstrat.HereditaryStratigraphicColumnPopulation.FromFile(path)
+    assert len(reloaded) == 15
+
+
+def test_FromFile_malformed(tmp_path):
+    path = tmp_path / "population.hstrpop"
+    path.write_bytes(b"not a population file")
+    with pytest.raises(ValueError):
+        hstrat.HereditaryStratigraphicColumnPopulation.FromFile(str(path))
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        hstrat.HereditaryStratigraphicColumnPopulation.FromFile(str(path))
@@ -0,0 +1,203 @@
+import inspect
+import itertools as it
+
+import numpy as np
+import pytest
+
+from hstrat import hstrat
+import hstrat.juxtaposition as juxtaposition
+import hstrat.phylogenetic_inference.pairwise as pairwise
+
+
+def _make_family(retention_policy, differentia_bit_width, ordered_store):
+    common_ancestor = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=retention_policy,
+        stratum_differentia_bit_width=differentia_bit_width,
+        stratum_ordered_store_factory=ordered_store,
+    )
+    for __ in range(20):
+        common_ancestor.DepositStratum(annotation="x" * 100)
+    first = common_ancestor.Clone()
+    second = common_ancestor.Clone()
+    for __ in range(10):
+        first.DepositStratum()
+    for __ in range(15):
+        second.DepositStratum()
+    unrelated = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=retention_policy,
+        stratum_differentia_bit_width=differentia_bit_width,
+        stratum_ordered_store_factory=ordered_store,
+    )
+    unrelated.DepositStrata(25)
+    return [common_ancestor, first, second, unrelated]
+
+
+def test_stripped_FromArrays():
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(3),
+        stratum_differentia_bit_width=8,
+    )
+    column.DepositStrata(10)
+    ranks, differentia = map(np.array, zip(*column.IterRankDifferentia()))
+    differentia = differentia.astype(np.uint8)
+
+    stripped = hstrat.HereditaryStratigraphicColumnStripped.FromArrays(
+        ranks,
+        differentia,
+        num_strata_deposited=column.GetNumStrataDeposited(),
+        stratum_differentia_bit_width=8,
+    )
+    assert stripped == hstrat.HereditaryStratigraphicColumnStripped(column)
+    assert np.shares_memory(stripped.GetRetainedRanksArray(), ranks)
+    assert np.shares_memory(
+        stripped.GetRetainedDifferentiaArray(), differentia
+    )
+    with pytest.raises(ValueError):
+        stripped.GetRetainedDifferentiaArray()[0] = 1
+    # wrapped arrays stay writeable for their owner
+    differentia[0] = 1
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+        hstrat.stochastic_algo.Policy(),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreDict,
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreTree,
+    ],
+)
+def test_stripped_accessors(
+    retention_policy, differentia_bit_width, ordered_store
+):
+    for column in _make_family(
+        retention_policy, differentia_bit_width, ordered_store
+    ):
+        stripped = hstrat.HereditaryStratigraphicColumnStripped(column)
+        assert stripped == hstrat.HereditaryStratigraphicColumnStripped(column)
+        assert (
+            stripped.GetNumStrataDeposited() == column.GetNumStrataDeposited()
+        )
+        assert stripped.GetNumStrataRetained() == column.GetNumStrataRetained()
+        assert stripped.HasDiscardedStrata() == column.HasDiscardedStrata()
+        assert (
+            stripped.GetStratumDifferentiaBitWidth()
+            == column.GetStratumDifferentiaBitWidth()
+        )
+        assert [*stripped.IterRankDifferentia()] == [
+            *column.IterRankDifferentia()
+        ]
+        assert [*stripped.IterRankDifferentia(3)] == [
+            *column.IterRankDifferentia(3)
+        ]
+        assert [*stripped.IterRetainedRanks()] == sorted(
+            column.IterRetainedRanks()
+        )
+        for index in range(column.GetNumStrataRetained()):
+            rank = column.GetRankAtColumnIndex(index)
+            assert stripped.GetRankAtColumnIndex(index) == rank
+            assert stripped.GetColumnIndexOfRank(rank) == index
+            stratum = stripped.GetStratumAtColumnIndex(index)
+            assert stratum.GetDepositionRank() == rank
+            assert (
+                stratum.GetDifferentia()
+                == column.GetStratumAtColumnIndex(index).GetDifferentia()
+            )
+        assert (
+            stripped.GetColumnIndexOfRank(column.GetNumStrataDeposited())
+            is None
+        )
+
+
+def test_stripped_immutable():
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.perfect_resolution_algo.Policy(),
+    )
+    stripped = hstrat.HereditaryStratigraphicColumnStripped(column)
+    column.DepositStrata(10)
+    assert stripped.GetNumStrataDeposited() == 1
+    assert stripped.GetNumStrataRetained() == 1
+
+    with pytest.raises(ValueError):
+        stripped.GetRetainedRanksArray()[0] = 1
+    with pytest.raises(ValueError):
+        stripped.GetRetainedDifferentiaArray()[0] = 1
+    with pytest.raises(AttributeError):
+        stripped.annotation = None
+
+
+def test_stripped_narrow_dtype():
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.perfect_resolution_algo.Policy(),
+        stratum_differentia_bit_width=8,
+    )
+    column.DepositStrata(100)
+    stripped = hstrat.HereditaryStratigraphicColumnStripped(column)
+    assert stripped.GetRetainedRanksArray().dtype == np.uint8
+    assert stripped.GetRetainedDifferentiaArray().dtype == np.uint8
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_bit_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "module",
+    [juxtaposition, pairwise],
+)
+def test_stripped_comparisons(retention_policy, differentia_bit_width, module):
+    family = _make_family(
+        retention_policy,
+        differentia_bit_width,
+        hstrat.HereditaryStratumOrderedStoreList,
+    )
+    stripped_family = [
+        hstrat.HereditaryStratigraphicColumnStripped(column)
+        for column in family
+    ]
+
+    def normalize(result):
+        if isinstance(result, hstrat.HereditaryStratum):
+            return (result.GetDepositionRank(), result.GetDifferentia())
+        return result
+
+    for function_name in module.__all__:
+        function = getattr(module, function_name)
+        if not inspect.isfunction(function) or function_name.endswith(
+            "_batched"
+        ):
+            continue
+        args = (2,) if function_name == "get_nth_common_rank_between" else ()
+        for (first, second), (stripped_first, stripped_second) in zip(
+            it.product(family, repeat=2),
+            it.product(stripped_family, repeat=2),
+        ):
+            expected = normalize(function(first, second, *args))
+            assert (
+                normalize(function(stripped_first, stripped_second, *args))
+                == expected
+            )
+            assert (
+                normalize(function(stripped_first, second, *args)) == expected
+            )
@@ -0,0 +1,114 @@
+from copy import deepcopy
+import pickle
+import tempfile
+import unittest
+
+from hstrat import hstrat
+
+
+class TestHereditaryStratumSlotted(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_deposition_rank(self):
+        assert (
+            hstrat.HereditaryStratumSlotted(
+                deposition_rank=42,
+            ).GetDepositionRank()
+            == 42
+        )
+
+    def test_differentia_generation(self):
+        original1 = hstrat.HereditaryStratumSlotted(
+            deposition_rank=42,
+        )
+        copy1 = deepcopy(original1)
+        original2 = hstrat.HereditaryStratumSlotted(
+            deposition_rank=42,
+        )
+
+        assert original1 == copy1
+        assert original1 != original2
+        assert copy1 != original2
+
+        assert original1.GetDifferentia() == copy1.GetDifferentia()
+        assert original1.GetDifferentia() != original2.GetDifferentia()
+        assert copy1.GetDifferentia() != original2.GetDifferentia()
+
+    def test_equality1(self):
+        assert (
+            hstrat.HereditaryStratumSlotted()
+            != hstrat.HereditaryStratumSlotted()
+        )
+        stratum1 = hstrat.HereditaryStratumSlotted()
+        stratum2 = stratum1
+        assert stratum1 == stratum2
+        assert stratum1 == deepcopy(stratum2)
+
+    def test_equality2(self):
+        def stratum_factory():
+            return hstrat.HereditaryStratumSlotted(deposition_rank=42)
+
+        assert stratum_factory() != stratum_factory()
+        stratum1 = stratum_factory()
+        stratum2 = stratum1
+        assert stratum1 == stratum2
+        assert stratum1 == deepcopy(stratum2)
+
+    def test_pickle(self):
+        original = hstrat.HereditaryStratumSlotted()
+        with tempfile.TemporaryDirectory() as tmp_path:
+            with open(f"{tmp_path}/data", "wb") as tmp_file:
+                pickle.dump(original, tmp_file)
+
+            with open(f"{tmp_path}/data", "rb") as tmp_file:
+                reconstituted = pickle.load(tmp_file)
+                assert reconstituted == original
+                assert reconstituted != hstrat.HereditaryStratumSlotted()
+
+    def test_optional_fields(self):
+        stratum = hstrat.HereditaryStratumSlotted()
+        assert stratum.GetDepositionRank() is None
+        assert stratum.GetAnnotation() is None
+        assert not hasattr(stratum, "__dict__")
+
+        stratum = hstrat.HereditaryStratumSlotted(
+            annotation="annotation",
+            deposition_rank=7,
+            differentia=42,
+        )
+        assert stratum.GetDepositionRank() == 7
+        assert stratum.GetAnnotation() == "annotation"
+        assert stratum.GetDifferentia() == 42
+
+    def test_differentia_bit_width(self):
+        for __ in range(100):
+            stratum = hstrat.HereditaryStratumSlotted(differentia_bit_width=3)
+            assert 0 <= stratum.GetDifferentia() < 8
+
+    def test_column(self):
+        column = hstrat.HereditaryStratigraphicColumn(
+            initial_stratum_annotation="initial",
+            stratum_factory=hstrat.HereditaryStratumSlotted,
+            stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(3),
+        )
+        for __ in range(20):
+            column.DepositStratum()
+        descendant = column.CloneDescendant()
+
+        assert isinstance(
+            column.GetStratumAtColumnIndex(0),
+            hstrat.HereditaryStratumSlotted,
+        )
+        assert column.GetStratumAtColumnIndex(0).GetAnnotation() == "initial"
+        assert (
+            hstrat.calc_rank_of_last_retained_commonality_between(
+                column, descendant, confidence_level=0.49
+            )
+            == 18
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
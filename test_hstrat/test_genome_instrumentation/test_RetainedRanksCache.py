@@ -0,0 +1,107 @@
+import pytest
+
+from hstrat import hstrat
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.depth_proportional_resolution_algo.Policy(4),
+        hstrat.depth_proportional_resolution_tapered_algo.Policy(4),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.geom_seq_nth_root_algo.Policy(3, 2),
+        hstrat.geom_seq_nth_root_tapered_algo.Policy(3, 2),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+def test_GetRanksAtColumnIndices(retention_policy):
+    cache = hstrat.RetainedRanksCache()
+    for num_strata_deposited in range(1, 300):
+        ranks = cache.GetRanksAtColumnIndices(
+            retention_policy, num_strata_deposited
+        )
+        assert ranks == cache.GetRanksAtColumnIndices(
+            retention_policy, num_strata_deposited
+        )
+        assert len(ranks) == (
+            retention_policy.CalcNumStrataRetainedExact(num_strata_deposited)
+            + 1
+        )
+        assert ranks[-1] == num_strata_deposited
+        for index, rank in enumerate(ranks[:-1]):
+            assert rank == retention_policy.CalcRankAtColumnIndex(
+                index=index,
+                num_strata_deposited=num_strata_deposited,
+            )
+
+    assert cache.GetNumMisses() == 299
+    assert cache.GetNumHits() == 299
+
+
+def test_hits_misses():
+    cache = hstrat.RetainedRanksCache(max_size=2)
+    assert cache.GetMaxSize() == 2
+    policy = hstrat.fixed_resolution_algo.Policy(3)
+
+    assert cache.GetRanksAtColumnIndices(policy, 7) == (0, 3, 6, 7)
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 1)
+    cache.GetRanksAtColumnIndices(hstrat.fixed_resolution_algo.Policy(3), 7)
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (1, 1)
+    cache.GetRanksAtColumnIndices(policy, 8)
+    cache.GetRanksAtColumnIndices(policy, 9)
+    cache.GetRanksAtColumnIndices(policy, 7)
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (1, 4)
+
+    cache.SetMaxSize(10)
+    assert cache.GetMaxSize() == 10
+    cache.Clear()
+    assert (cache.GetNumHits(), cache.GetNumMisses()) == (0, 0)
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.geom_seq_nth_root_algo.Policy(3, 2),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreArray,
+        hstrat.HereditaryStratumOrderedStoreDict,
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreTree,
+    ],
+)
+def test_column(retention_policy, ordered_store):
+    cache = hstrat.HereditaryStratigraphicColumn.GetRetainedRanksCache()
+    assert cache is (
+        hstrat.HereditaryStratigraphicColumn.GetRetainedRanksCache()
+    )
+
+    def make_column(always_store_rank_in_stratum):
+        return hstrat.HereditaryStratigraphicColumn(
+            always_store_rank_in_stratum=always_store_rank_in_stratum,
+            stratum_ordered_store_factory=ordered_store,
+            stratum_retention_policy=retention_policy,
+        )
+
+    column = make_column(always_store_rank_in_stratum=False)
+    reference = make_column(always_store_rank_in_stratum=True)
+    for generation in range(200):
+        num_hits = cache.GetNumHits()
+        assert [*column.IterRetainedRanks()] == sorted(
+            reference.IterRetainedRanks()
+        )
+        for index, rank in enumerate(sorted(reference.IterRetainedRanks())):
+            assert column.GetRankAtColumnIndex(index) == rank
+            assert column.GetColumnIndexOfRank(rank) == index
+        assert column.GetColumnIndexOfRank(generation + 1) is None
+        assert cache.GetNumHits() > num_hits
+
+        column.DepositStratum()
+        reference.DepositStratum()
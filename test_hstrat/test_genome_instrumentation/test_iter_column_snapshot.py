@@ -0,0 +1,80 @@
+import itertools as it
+
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_columns(num_columns):
+    policies = [
+        hstrat.fixed_resolution_algo.Policy(3),
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.stochastic_algo.Policy(),
+    ]
+    for i in range(num_columns):
+        column = hstrat.HereditaryStratigraphicColumn(
+            stratum_retention_policy=policies[i % len(policies)],
+            stratum_differentia_bit_width=[1, 8, 64][i % 3],
+        )
+        column.DepositStrata(i)
+        yield column
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [None, "bz2", "gzip", "lzma"],
+)
+@pytest.mark.parametrize(
+    "chunk_size",
+    [1, 7, 2**20],
+)
+def test_iter_column_snapshot(tmp_path, compression, chunk_size):
+    columns = [*_make_columns(30)]
+    path = str(tmp_path / "snapshot.hsts")
+    hstrat.write_column_snapshot(
+        iter(columns),
+        path,
+        compression=compression,
+        chunk_size=chunk_size,
+    )
+
+    loaded = hstrat.iter_column_snapshot(path, chunk_size=chunk_size)
+    for expected, actual in it.zip_longest(columns, loaded):
+        assert actual is not None and expected is not None
+        assert actual.ToBytes() == expected.ToBytes()
+        assert [*actual.IterRetainedRanks()] == [*expected.IterRetainedRanks()]
+
+
+def test_iter_column_snapshot_lazy(tmp_path):
+    path = str(tmp_path / "snapshot.hsts")
+    hstrat.write_column_snapshot(_make_columns(100), path)
+
+    loaded = hstrat.iter_column_snapshot(path, chunk_size=64)
+    assert next(loaded).GetNumStrataDeposited() == 1
+    assert next(loaded).GetNumStrataDeposited() == 2
+
+
+def test_iter_column_snapshot_store_factory(tmp_path):
+    path = str(tmp_path / "snapshot.hsts")
+    hstrat.write_column_snapshot(_make_columns(3), path)
+
+    for column in hstrat.iter_column_snapshot(
+        path,
+        stratum_ordered_store_factory=hstrat.HereditaryStratumOrderedStoreDict,
+    ):
+        assert isinstance(
+            column._stratum_ordered_store,
+            hstrat.HereditaryStratumOrderedStoreDict,
+        )
+
+
+def test_iter_column_snapshot_malformed(tmp_path):
+    path = tmp_path / "snapshot.hsts"
+    path.write_bytes(b"not a column snapshot")
+    with pytest.raises(ValueError):
+        [*hstrat.iter_column_snapshot(str(path))]
+
+    hstrat.write_column_snapshot(_make_columns(5), str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        [*hstrat.iter_column_snapshot(str(path))]
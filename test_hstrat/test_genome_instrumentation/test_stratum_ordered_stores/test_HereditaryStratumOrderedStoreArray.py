@@ -0,0 +1,600 @@
+import functools
+import unittest
+
+import numpy as np
+
+from hstrat import hstrat
+
+
+class TestHereditaryStratumOrderedStoreArray(unittest.TestCase):
+
+    # tests can run independently
+    _multiprocess_can_split_ = True
+
+    def test_deposition(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        assert store1.GetNumStrataRetained() == 0
+
+        stratum1 = hstrat.HereditaryStratum(deposition_rank=0)
+        store1.DepositStratum(0, stratum1)
+        assert store1.GetNumStrataRetained() == 1
+        assert store1.GetStratumAtColumnIndex(0) == stratum1
+
+        store2 = store1.Clone()
+
+        stratum2 = hstrat.HereditaryStratum(deposition_rank=1)
+        store1.DepositStratum(1, stratum2)
+        assert store1.GetNumStrataRetained() == 2
+        assert store1.GetStratumAtColumnIndex(1) == stratum2
+        assert store1.GetStratumAtColumnIndex(0) != stratum2
+
+        assert store2.GetNumStrataRetained() == 1
+        assert store2.GetStratumAtColumnIndex(0) == stratum1
+
+    def test_deletion1(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        stratum1 = hstrat.HereditaryStratum(deposition_rank=0)
+        store1.DepositStratum(0, stratum1)
+
+        store2 = store1.Clone()
+        stratum2 = hstrat.HereditaryStratum(deposition_rank=1)
+        store1.DepositStratum(1, stratum2)
+
+        del store1
+        assert store2.GetNumStrataRetained() == 1
+        assert store2.GetStratumAtColumnIndex(0) == stratum1
+
+    def test_deletion2(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        stratum1 = hstrat.HereditaryStratum(deposition_rank=0)
+        store1.DepositStratum(0, stratum1)
+
+        store2 = store1.Clone()
+        stratum2 = hstrat.HereditaryStratum(deposition_rank=1)
+        store1.DepositStratum(1, stratum2)
+
+        del store2
+        assert store1.GetNumStrataRetained() == 2
+        assert store1.GetStratumAtColumnIndex(0) == stratum1
+        assert store1.GetStratumAtColumnIndex(1) == stratum2
+
+    def test_equality(self):
+        assert (
+            hstrat.HereditaryStratumOrderedStoreArray()
+            == hstrat.HereditaryStratumOrderedStoreArray()
+        )
+
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        store1.DepositStratum(0, hstrat.HereditaryStratum(deposition_rank=0))
+        store2 = store1.Clone()
+        assert store1 == store2
+
+        store2.DepositStratum(1, hstrat.HereditaryStratum(deposition_rank=1))
+        assert store1 != store2
+
+    def test_GetRankAtColumnIndex(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        store1.DepositStratum(0, hstrat.HereditaryStratum(deposition_rank=0))
+        store1.DepositStratum(1, hstrat.HereditaryStratum(deposition_rank=1))
+        store1.DepositStratum(2, hstrat.HereditaryStratum(deposition_rank=2))
+        assert store1.GetRankAtColumnIndex(0) == 0
+        assert store1.GetRankAtColumnIndex(1) == 1
+        assert store1.GetRankAtColumnIndex(2) == 2
+
+        store1.DelRanks([1])
+        assert store1.GetRankAtColumnIndex(0) == 0
+        assert store1.GetRankAtColumnIndex(1) == 2
+
+    def test_GetStratumAtColumnIndex(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in range(3)
+        ]
+        for rank, stratum in enumerate(strata):
+            store1.DepositStratum(rank, stratum)
+
+        for rank, stratum in enumerate(strata):
+            assert store1.GetStratumAtColumnIndex(rank) == strata[rank]
+
+        store1.DelRanks([1])
+        assert store1.GetStratumAtColumnIndex(0) == strata[0]
+        assert store1.GetStratumAtColumnIndex(1) == strata[2]
+
+    def test_GetNumStrataRetained(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        for rank in range(5):
+            assert store1.GetNumStrataRetained() == rank
+            store1.DepositStratum(rank, hstrat.HereditaryStratum())
+        assert store1.GetNumStrataRetained() == 5
+
+        store1.DelRanks([1, 2], get_column_index_of_rank=lambda x: x)
+        assert store1.GetNumStrataRetained() == 3
+
+        store1.DepositStratum(5, hstrat.HereditaryStratum())
+        assert store1.GetNumStrataRetained() == 4
+
+        store1.DelRanks(
+            [5],
+            get_column_index_of_rank=lambda x: {
+                3: 0,
+                5: 1,
+            }[x],
+        )
+        assert store1.GetNumStrataRetained() == 3
+
+    def test_GetColumnIndexOfRank(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 63]
+        for rank in ranks:
+            store1.DepositStratum(
+                rank=rank,
+                stratum=hstrat.HereditaryStratum(deposition_rank=rank),
+            )
+
+        assert store1.GetColumnIndexOfRank(-1) is None
+        assert store1.GetColumnIndexOfRank(0) == 0
+        assert store1.GetColumnIndexOfRank(1) is None
+        assert store1.GetColumnIndexOfRank(8) == 1
+        assert store1.GetColumnIndexOfRank(42) == 2
+        assert store1.GetColumnIndexOfRank(63) == 3
+        assert store1.GetColumnIndexOfRank(64) is None
+
+    def test_IterRetainedRanks(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 63]
+        for rank in ranks:
+            store1.DepositStratum(
+                rank=rank,
+                stratum=hstrat.HereditaryStratum(deposition_rank=rank),
+            )
+
+        assert set(store1.IterRetainedRanks()) == set(ranks)
+
+    def test_GetRetainedArrays(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 63]
+        strata = [hstrat.HereditaryStratum(deposition_rank=r) for r in ranks]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+        store1.DelRanks([8])
+
+        assert store1.GetRetainedRanksArray().tolist() == [0, 42, 63]
+        assert store1.GetRetainedDifferentiaArray().tolist() == [
+            strata[i].GetDifferentia() for i in (0, 2, 3)
+        ]
+        assert not store1.GetRetainedRanksArray().flags.writeable
+        assert not store1.GetRetainedDifferentiaArray().flags.writeable
+
+    def test_IterRankDifferentia1(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 63]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        assert [
+            *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+        ] == [*store1.IterRankDifferentia()]
+        assert [*zip(ranks, [stratum.GetDifferentia() for stratum in strata])][
+            0:
+        ] == [*store1.IterRankDifferentia(start_column_index=0)]
+        assert [*zip(ranks, [stratum.GetDifferentia() for stratum in strata])][
+            2:
+        ] == [*store1.IterRankDifferentia(start_column_index=2)]
+
+    def test_IterRankDifferentia2(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 63]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        def col_index_to_rank(column_idx):
+            return ranks[column_idx]
+
+        assert [
+            *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+        ] == [
+            *store1.IterRankDifferentia(
+                get_rank_at_column_index=col_index_to_rank,
+            )
+        ]
+        assert [*zip(ranks, [stratum.GetDifferentia() for stratum in strata])][
+            0:
+        ] == [
+            *store1.IterRankDifferentia(
+                get_rank_at_column_index=col_index_to_rank,
+                start_column_index=0,
+            )
+        ]
+        assert [*zip(ranks, [stratum.GetDifferentia() for stratum in strata])][
+            2:
+        ] == [
+            *store1.IterRankDifferentia(
+                get_rank_at_column_index=col_index_to_rank,
+                start_column_index=2,
+            )
+        ]
+
+    def test_DelRanks_getrank_impl1(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [8, 42],
+            [],
+            [55],
+            [],
+            [0, 63],
+            [],
+        ):
+            store1.DelRanks(deletion)
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [*store1.IterRankDifferentia()]
+
+    def test_DelRanks_getrank_impl2(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [0, 63],
+            [],
+            [8],
+            [],
+            [55],
+            [],
+            [42],
+            [],
+        ):
+            store1.DelRanks(deletion)
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [*store1.IterRankDifferentia()]
+
+    def test_DelRanks_getrank_impl3(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63, 80]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [0, 80],
+            [],
+            [63],
+            [],
+            [8, 55],
+            [],
+            [42],
+            [],
+        ):
+            store1.DelRanks(deletion)
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [*store1.IterRankDifferentia()]
+
+    def test_DelRanks_getrank_impl4(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [55, 63],
+            [],
+            [0, 8],
+            [],
+            [42],
+            [],
+        ):
+            store1.DelRanks(deletion)
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [*store1.IterRankDifferentia()]
+
+    def test_DelRanks_getrank_impl5(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [
+            hstrat.HereditaryStratum(deposition_rank=rank) for rank in ranks
+        ]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [42, 63],
+            [],
+            [0, 8, 55],
+            [],
+        ):
+            store1.DelRanks(deletion)
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [*store1.IterRankDifferentia()]
+
+    def test_DelRanks_calcrank_impl1(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [hstrat.HereditaryStratum() for rank in ranks]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [8, 42],
+            [],
+            [55],
+            [],
+            [0, 63],
+            [],
+        ):
+            store1.DelRanks(
+                get_column_index_of_rank=lambda rank: ranks.index(rank),
+                ranks=deletion,
+            )
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [
+                *store1.IterRankDifferentia(
+                    get_rank_at_column_index=lambda idx: ranks[idx],
+                )
+            ]
+
+    def test_DelRanks_calcrank_impl2(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [hstrat.HereditaryStratum() for rank in ranks]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [0, 63],
+            [],
+            [8],
+            [],
+            [55],
+            [],
+            [42],
+            [],
+        ):
+            store1.DelRanks(
+                get_column_index_of_rank=lambda rank: ranks.index(rank),
+                ranks=deletion,
+            )
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [
+                *store1.IterRankDifferentia(
+                    get_rank_at_column_index=lambda idx: ranks[idx],
+                )
+            ]
+
+    def test_DelRanks_calcrank_impl3(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63, 80]
+        strata = [hstrat.HereditaryStratum() for rank in ranks]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [0, 80],
+            [],
+            [63],
+            [],
+            [8, 55],
+            [],
+            [42],
+            [],
+        ):
+            store1.DelRanks(
+                get_column_index_of_rank=lambda rank: ranks.index(rank),
+                ranks=deletion,
+            )
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [
+                *store1.IterRankDifferentia(
+                    get_rank_at_column_index=lambda idx: ranks[idx],
+                )
+            ]
+
+    def test_DelRanks_calcrank_impl4(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [hstrat.HereditaryStratum() for rank in ranks]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [55, 63],
+            [],
+            [0, 8],
+            [],
+            [42],
+            [],
+        ):
+            store1.DelRanks(
+                get_column_index_of_rank=lambda rank: ranks.index(rank),
+                ranks=deletion,
+            )
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [
+                *store1.IterRankDifferentia(
+                    get_rank_at_column_index=lambda idx: ranks[idx],
+                )
+            ]
+
+    def test_DelRanks_calcrank_impl5(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        ranks = [0, 8, 42, 55, 63]
+        strata = [hstrat.HereditaryStratum() for rank in ranks]
+        for rank, stratum in zip(ranks, strata):
+            store1.DepositStratum(rank=rank, stratum=stratum)
+
+        for deletion in (
+            [],
+            [42, 63],
+            [],
+            [0, 8, 55],
+            [],
+        ):
+            store1.DelRanks(
+                get_column_index_of_rank=lambda rank: ranks.index(rank),
+                ranks=deletion,
+            )
+            for rank in deletion:
+                del strata[ranks.index(rank)]
+                ranks.remove(rank)
+            assert [
+                *zip(ranks, [stratum.GetDifferentia() for stratum in strata])
+            ] == [
+                *store1.IterRankDifferentia(
+                    get_rank_at_column_index=lambda idx: ranks[idx],
+                )
+            ]
+
+    def test_differentia_dtype(self):
+        for bit_width, dtype in (
+            (1, np.uint8),
+            (8, np.uint8),
+            (9, np.uint16),
+            (32, np.uint32),
+            (64, np.uint64),
+            (65, object),
+        ):
+            store1 = hstrat.HereditaryStratumOrderedStoreArray(
+                differentia_bit_width=bit_width,
+            )
+            assert store1._differentia.dtype == dtype
+            stratum = hstrat.HereditaryStratum(
+                deposition_rank=0,
+                differentia_bit_width=bit_width,
+            )
+            store1.DepositStratum(0, stratum)
+            assert store1.GetStratumAtColumnIndex(0) == stratum
+
+    def test_annotation(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreArray()
+        for rank in range(20):
+            store1.DepositStratum(
+                rank,
+                hstrat.HereditaryStratum(
+                    annotation=rank if rank % 2 else None,
+                    deposition_rank=rank,
+                ),
+            )
+        store2 = store1.Clone()
+        store1.DelRanks([1, 2, 3])
+        assert store1.GetStratumAtColumnIndex(2).GetAnnotation() == 5
+        assert store2.GetStratumAtColumnIndex(1).GetAnnotation() == 1
+        assert 1 not in store1._annotations
+        assert 1 in store2._annotations
+
+    def test_column_narrow_differentia(self):
+        column = hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=8,
+            stratum_ordered_store_factory=functools.partial(
+                hstrat.HereditaryStratumOrderedStoreArray,
+                differentia_bit_width=8,
+            ),
+            stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(3),
+        )
+        for __ in range(100):
+            column.DepositStratum()
+        descendant = column.CloneDescendant()
+        assert column._stratum_ordered_store._differentia.dtype == np.uint8
+        assert [*column.IterRetainedRanks()] == [*range(0, 100, 3)] + [100]
+        assert all(
+            0 <= differentia < 256
+            for __, differentia in descendant._stratum_ordered_store.IterRankDifferentia()
+        )
+        assert (
+            hstrat.calc_rank_of_last_retained_commonality_between(
+                column, descendant, confidence_level=0.49
+            )
+            == 99
+        )
+
+    def test_column_configures_differentia_dtype(self):
+        for bit_width, dtype in (1, np.uint8), (32, np.uint32), (128, object):
+            column = hstrat.HereditaryStratigraphicColumn(
+                stratum_differentia_bit_width=bit_width,
+                stratum_ordered_store_factory=(
+                    hstrat.HereditaryStratumOrderedStoreArray
+                ),
+            )
+            for __ in range(10):
+                column.DepositStratum()
+            store = column._stratum_ordered_store
+            assert store._differentia.dtype == dtype
+            assert all(
+                0 <= differentia < 2**bit_width
+                for __, differentia in store.IterRankDifferentia()
+            )
+            clone = column.CloneDescendant()
+            assert (
+                hstrat.calc_rank_of_last_retained_commonality_between(
+                    column, clone, confidence_level=0.49
+                )
+                == column.GetNumStrataDeposited() - 1
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from hstrat import hstrat
@@ -491,6 +492,77 @@ class TestHereditaryStratumOrderedStoreDict(unittest.TestCase):
                 )
             ]
 
+    def test_copy_on_write(self):
+        random.seed(1)
+        stores = [hstrat.HereditaryStratumOrderedStoreDict(copy_on_write=True)]
+        references = [[]]
+        for rank in range(300):
+            for store, reference in zip(stores, references):
+                stratum = hstrat.HereditaryStratum(deposition_rank=rank)
+                store.DepositStratum(rank=rank, stratum=stratum)
+                reference.append(stratum)
+
+            if rank % 5 == 0:
+                parent_idx = random.randrange(len(stores))
+                stores.append(stores[parent_idx].Clone())
+                references.append(references[parent_idx].copy())
+
+            for store, reference in zip(stores, references):
+                deletion = random.sample(
+                    [stratum.GetDepositionRank() for stratum in reference],
+                    min(len(reference) // 4, random.randrange(3)),
+                )
+                store.DelRanks(ranks=deletion)
+                reference[:] = [
+                    stratum
+                    for stratum in reference
+                    if stratum.GetDepositionRank() not in deletion
+                ]
+
+        for store, reference in zip(stores, references):
+            assert store.GetNumStrataRetained() == len(reference)
+            assert [*store.IterRetainedRanks()] == [
+                stratum.GetDepositionRank() for stratum in reference
+            ]
+            assert [*store.IterRankDifferentia()] == [
+                (stratum.GetDepositionRank(), stratum.GetDifferentia())
+                for stratum in reference
+            ]
+            for idx, stratum in enumerate(reference):
+                assert store.GetStratumAtColumnIndex(idx) is stratum
+                assert (
+                    store.GetColumnIndexOfRank(stratum.GetDepositionRank())
+                    == idx
+                )
+
+    def test_copy_on_write_sharing(self):
+        store1 = hstrat.HereditaryStratumOrderedStoreDict(copy_on_write=True)
+        for rank in range(10):
+            store1.DepositStratum(
+                rank=rank,
+                stratum=hstrat.HereditaryStratum(deposition_rank=rank),
+            )
+        store2 = store1.Clone()
+        assert store1 == store2
+        assert store1._shared_data is store2._shared_data
+
+        store2.DepositStratum(
+            rank=10,
+            stratum=hstrat.HereditaryStratum(deposition_rank=10),
+        )
+        store2.DelRanks(ranks=[8])
+        assert store1._shared_data is store2._shared_data
+        assert store2._num_shared_strata == 8
+        assert [*store1.IterRetainedRanks()] == [*range(10)]
+        assert [*store2.IterRetainedRanks()] == [0, 1, 2, 3, 4, 5, 6, 7, 9, 10]
+
+        store3 = store2.Clone()
+        store1.DelRanks(ranks=[0])
+        assert [*store1.IterRetainedRanks()] == [*range(1, 10)]
+        assert [*store2.IterRetainedRanks()] == [0, 1, 2, 3, 4, 5, 6, 7, 9, 10]
+        assert store2 == store3
+        assert store1 != store3
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,5 @@
+import gc
+import random
 import unittest
 
 from hstrat import hstrat
@@ -557,6 +559,80 @@ class TestHereditaryStratumOrderedStoreTree(unittest.TestCase):
                 )
             ]
 
+    def test_indexed_access_skip_pointers(self):
+        random.seed(1)
+        stores = [hstrat.HereditaryStratumOrderedStoreTree()]
+        references = [[]]
+        for rank in range(300):
+            for store, reference in zip(stores, references):
+                stratum = hstrat.HereditaryStratum(deposition_rank=rank)
+                store.DepositStratum(rank=rank, stratum=stratum)
+                reference.append(stratum)
+
+            if rank % 7 == 0:
+                stores.append(stores[-1].Clone())
+                references.append(references[-1].copy())
+
+            for store, reference in zip(stores, references):
+                deletion = random.sample(
+                    [stratum.GetDepositionRank() for stratum in reference],
+                    min(len(reference) // 4, 3),
+                )
+                store.DelRanks(ranks=deletion)
+                reference[:] = [
+                    stratum
+                    for stratum in reference
+                    if stratum.GetDepositionRank() not in deletion
+                ]
+
+        for store, reference in zip(stores, references):
+            assert store.GetNumStrataRetained() == len(reference)
+            reference_ranks = {
+                stratum.GetDepositionRank() for stratum in reference
+            }
+            for idx, stratum in enumerate(reference):
+                assert store.GetStratumAtColumnIndex(idx) is stratum
+                assert (
+                    store.GetColumnIndexOfRank(stratum.GetDepositionRank())
+                    == idx
+                )
+            for rank in range(-1, 301):
+                if rank not in reference_ranks:
+                    assert store.GetColumnIndexOfRank(rank) is None
+
+    def test_node_reclamation(self):
+        def count_nodes(node_t):
+            return sum(isinstance(obj, node_t) for obj in gc.get_objects())
+
+        store1 = hstrat.HereditaryStratumOrderedStoreTree()
+        for rank in range(100):
+            store1.DepositStratum(
+                rank=rank,
+                stratum=hstrat.HereditaryStratum(deposition_rank=rank),
+            )
+        node_t = type(store1._leaf)
+        baseline = count_nodes(node_t)
+
+        store2 = store1.Clone()
+        for rank in range(100, 150):
+            store2.DepositStratum(
+                rank=rank,
+                stratum=hstrat.HereditaryStratum(deposition_rank=rank),
+            )
+        assert count_nodes(node_t) == baseline + 50
+
+        store2.DelRanks(ranks=[50])
+        assert count_nodes(node_t) == baseline + 99
+
+        del store1
+        assert count_nodes(node_t) == baseline + 49
+        assert [*store2.IterRetainedRanks()] == [
+            *reversed([rank for rank in range(150) if rank != 50])
+        ]
+
+        del store2
+        assert count_nodes(node_t) == baseline - 100
+
 
 if __name__ == "__main__":
     unittest.main()
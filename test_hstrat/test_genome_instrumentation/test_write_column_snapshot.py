@@ -0,0 +1,44 @@
+import pytest
+
+from hstrat import hstrat
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [None, "bz2", "gzip", "lzma"],
+)
+def test_write_column_snapshot(tmp_path, compression):
+    path = str(tmp_path / "snapshot.hsts")
+    columns = (
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(2),
+        )
+        for __ in range(10)
+    )
+    assert (
+        hstrat.write_column_snapshot(columns, path, compression=compression)
+        == 10
+    )
+    assert len([*hstrat.iter_column_snapshot(path)]) == 10
+
+
+def test_write_column_snapshot_empty(tmp_path):
+    path = str(tmp_path / "snapshot.hsts")
+    assert hstrat.write_column_snapshot([], path) == 0
+    assert [*hstrat.iter_column_snapshot(path)] == []
+
+
+def test_write_column_snapshot_compressed_size(tmp_path):
+    column = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.perfect_resolution_algo.Policy(),
+        stratum_differentia_bit_width=8,
+    )
+    column.DepositStrata(100)
+
+    uncompressed = tmp_path / "uncompressed.hsts"
+    compressed = tmp_path / "compressed.hsts"
+    hstrat.write_column_snapshot([column] * 100, str(uncompressed))
+    hstrat.write_column_snapshot(
+        [column] * 100, str(compressed), compression="gzip"
+    )
+    assert compressed.stat().st_size < uncompressed.stat().st_size
@@ -21,6 +21,7 @@ from hstrat import hstrat
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -79,6 +80,7 @@ def test_comparison_commutativity_asyncrhonous(
             marks=pytest.mark.heavy_2b,
         ),
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -132,6 +134,7 @@ def test_comparison_commutativity_syncrhonous(
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -199,6 +202,7 @@ def test_comparison_validity(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -243,6 +247,7 @@ def test_scenario_no_mrca(
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -276,6 +281,7 @@ def test_scenario_no_divergence(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -319,6 +325,7 @@ def test_scenario_partial_even_divergence(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -366,6 +373,7 @@ def test_scenario_partial_uneven_divergence(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -569,6 +577,7 @@ def test_CalcRankOfFirstRetainedDisparityWith1(
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -726,6 +735,7 @@ def test_CalcRankOfFirstRetainedDisparityWith2(ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -783,6 +793,7 @@ def test_CalcRankOfFirstRetainedDisparityWith3(ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -897,6 +908,7 @@ def test_CalcRankOfFirstRetainedDisparityWith4(ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -1036,3 +1048,64 @@ def test_CalcRankOfFirstRetainedDisparityWith5(
                 assert hstrat.calc_rank_of_first_retained_disparity_between(
                     c, c, conf
                 ) == c.GetRankAtColumnIndex(col_idx)
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.recency_proportional_resolution_algo.Policy(
+            recency_proportional_resolution=2
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [8, 16, 64],
+)
+def test_aligned_bsearch_matches_generic(
+    retention_policy, ordered_store, differentia_width
+):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_ordered_store_factory=ordered_store,
+            stratum_retention_policy=retention_policy,
+        )
+        for __ in range(5)
+    ]
+
+    def to_sequential_access(column):
+        return hstrat.HereditaryStratigraphicColumn.FromBytes(
+            column.ToBytes(),
+            stratum_ordered_store_factory=(
+                hstrat.HereditaryStratumOrderedStoreDict
+            ),
+        )
+
+    for generation in range(120):
+        for first, second in it.combinations(population, 2):
+            for confidence_level in 0.49, 0.95, 0.999:
+                assert hstrat.calc_rank_of_first_retained_disparity_between(
+                    first, second, confidence_level=confidence_level
+                ) == hstrat.calc_rank_of_first_retained_disparity_between(
+                    to_sequential_access(first),
+                    to_sequential_access(second),
+                    confidence_level=confidence_level,
+                )
+
+        # advance generations synchronously
+        random.shuffle(population)
+        for target in range(2):
+            population[target] = population[-1].Clone()
+        for individual in population:
+            individual.DepositStratum()
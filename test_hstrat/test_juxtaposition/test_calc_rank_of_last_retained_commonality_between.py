@@ -20,6 +20,7 @@ from hstrat import hstrat
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -76,6 +77,7 @@ def test_comparison_commutativity_asyncrhonous(
             marks=pytest.mark.heavy_2b,
         ),
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -127,6 +129,7 @@ def test_comparison_commutativity_syncrhonous(
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -193,6 +196,7 @@ def test_comparison_validity(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -241,6 +245,7 @@ def test_scenario_no_mrca(
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -274,6 +279,7 @@ def test_scenario_no_divergence(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -317,6 +323,7 @@ def test_scenario_partial_even_divergence(retention_policy, ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         pytest.param(
             hstrat.HereditaryStratumOrderedStoreTree,
             marks=pytest.mark.heavy,
@@ -477,6 +484,7 @@ def _do_test_CalcRankOfLastRetainedCommonalityWith1(
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -553,6 +561,7 @@ def test_CalcRankOfLastRetainedCommonalityWith2(ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -597,6 +606,7 @@ def test_CalcRankOfLastRetainedCommonalityWith3(ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -675,6 +685,7 @@ def test_CalcRankOfLastRetainedCommonalityWith4(ordered_store):
     [
         hstrat.HereditaryStratumOrderedStoreDict,
         hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
         hstrat.HereditaryStratumOrderedStoreTree,
     ],
 )
@@ -784,3 +795,64 @@ def test_CalcRankOfLastRetainedCommonalityWith5(
             assert hstrat.calc_rank_of_last_retained_commonality_between(
                 c, c, conf
             ) == c.GetRankAtColumnIndex(col_idx)
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.recency_proportional_resolution_algo.Policy(
+            recency_proportional_resolution=2
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [8, 16, 64],
+)
+def test_aligned_bsearch_matches_generic(
+    retention_policy, ordered_store, differentia_width
+):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_ordered_store_factory=ordered_store,
+            stratum_retention_policy=retention_policy,
+        )
+        for __ in range(5)
+    ]
+
+    def to_sequential_access(column):
+        return hstrat.HereditaryStratigraphicColumn.FromBytes(
+            column.ToBytes(),
+            stratum_ordered_store_factory=(
+                hstrat.HereditaryStratumOrderedStoreDict
+            ),
+        )
+
+    for generation in range(120):
+        for first, second in it.combinations(population, 2):
+            for confidence_level in 0.49, 0.95, 0.999:
+                assert hstrat.calc_rank_of_last_retained_commonality_between(
+                    first, second, confidence_level=confidence_level
+                ) == hstrat.calc_rank_of_last_retained_commonality_between(
+                    to_sequential_access(first),
+                    to_sequential_access(second),
+                    confidence_level=confidence_level,
+                )
+
+        # advance generations synchronously
+        random.shuffle(population)
+        for target in range(2):
+            population[target] = population[-1].Clone()
+        for individual in population:
+            individual.DepositStratum()
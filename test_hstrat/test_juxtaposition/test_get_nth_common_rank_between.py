@@ -54,3 +54,38 @@ def test_GetNthCommonRankWith():
 
     assert hstrat.get_nth_common_rank_between(c1, c3, 2) == 4
     assert hstrat.get_nth_common_rank_between(c3, c1, 2) == 4
+
+
+def test_GetNthCommonRankWith_array_backed():
+    c1 = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.perfect_resolution_algo.Policy(),
+    )
+    c2 = hstrat.HereditaryStratigraphicColumn(
+        stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(3),
+    )
+    for __ in range(100):
+        c1.DepositStratum()
+    for __ in range(70):
+        c2.DepositStratum()
+
+    def to_array_backed(column):
+        return hstrat.HereditaryStratigraphicColumn.FromBytes(
+            column.ToBytes(),
+            stratum_ordered_store_factory=(
+                hstrat.HereditaryStratumOrderedStoreArray
+            ),
+        )
+
+    for x1, x2 in it.permutations([c1, c2], 2):
+        for y1, y2 in (
+            (to_array_backed(x1), to_array_backed(x2)),
+            (
+                hstrat.HereditaryStratigraphicColumnStripped(x1),
+                hstrat.HereditaryStratigraphicColumnStripped(x2),
+            ),
+            (hstrat.HereditaryStratigraphicColumnStripped(x1), x2),
+        ):
+            for n in range(x1.GetNumStrataRetained() + 1):
+                assert hstrat.get_nth_common_rank_between(
+                    y1, y2, n
+                ) == hstrat.get_nth_common_rank_between(x1, x2, n)
@@ -0,0 +1,97 @@
+import itertools as it
+import random
+
+import pytest
+
+from hstrat import hstrat
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+    ],
+)
+@pytest.mark.parametrize(
+    "ordered_store",
+    [
+        hstrat.HereditaryStratumOrderedStoreDict,
+        hstrat.HereditaryStratumOrderedStoreList,
+        hstrat.HereditaryStratumOrderedStoreArray,
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "confidence_level",
+    [0.49, 0.95, 0.99],
+)
+def test_summarize_juxtaposition_between(
+    retention_policy, ordered_store, differentia_width, confidence_level
+):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_ordered_store_factory=ordered_store,
+            stratum_retention_policy=retention_policy,
+        )
+        for __ in range(6)
+    ]
+
+    for generation in range(40):
+        stripped = [
+            hstrat.HereditaryStratigraphicColumnStripped(column)
+            for column in population
+        ]
+        for first, second in it.chain(
+            it.combinations(population, 2),
+            it.combinations(stripped, 2),
+        ):
+            summary = hstrat.summarize_juxtaposition_between(
+                first, second, confidence_level=confidence_level
+            )
+            assert summary.GetConfidenceLevel() == confidence_level
+            assert (
+                summary.GetRankOfEarliestDetectableMrca()
+                == hstrat.calc_rank_of_earliest_detectable_mrca_between(
+                    first, second, confidence_level=confidence_level
+                )
+            )
+            assert (
+                summary.GetRankOfFirstRetainedDisparity()
+                == hstrat.calc_rank_of_first_retained_disparity_between(
+                    first, second, confidence_level=confidence_level
+                )
+            )
+            assert summary.GetDefinitiveMaxRankOfFirstRetainedDisparity() == (
+                hstrat.calc_definitive_max_rank_of_first_retained_disparity_between(
+                    first, second
+                )
+            )
+            assert (
+                summary.GetRankOfLastRetainedCommonality()
+                == hstrat.calc_rank_of_last_retained_commonality_between(
+                    first, second, confidence_level=confidence_level
+                )
+            )
+            assert (
+                summary.DoesHaveAnyCommonAncestor()
+                == hstrat.does_have_any_common_ancestor(
+                    first, second, confidence_level=confidence_level
+                )
+            )
+            assert summary == hstrat.summarize_juxtaposition_between(
+                second, first, confidence_level=confidence_level
+            )
+
+        # advance generations asynchronously
+        random.shuffle(population)
+        for target in range(2):
+            population[target] = population[-1].Clone()
+        for individual in population:
+            if random.choice([True, False]):
+                individual.DepositStratum()
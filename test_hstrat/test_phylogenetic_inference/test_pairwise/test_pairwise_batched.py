@@ -0,0 +1,141 @@
+import itertools as it
+import random
+import warnings
+
+import numpy as np
+import pytest
+
+from hstrat import hstrat
+
+# (pairwise function, batched counterpart, takes confidence_level)
+_batched_functions = [
+    (
+        hstrat.calc_rank_of_earliest_detectable_mrca_between,
+        hstrat.calc_rank_of_earliest_detectable_mrca_between_batched,
+        True,
+    ),
+    (
+        hstrat.calc_rank_of_mrca_bounds_between,
+        hstrat.calc_rank_of_mrca_bounds_between_batched,
+        True,
+    ),
+    (
+        hstrat.calc_rank_of_mrca_uncertainty_between,
+        hstrat.calc_rank_of_mrca_uncertainty_between_batched,
+        True,
+    ),
+    (
+        hstrat.calc_ranks_since_earliest_detectable_mrca_with,
+        hstrat.calc_ranks_since_earliest_detectable_mrca_with_batched,
+        True,
+    ),
+    (
+        hstrat.calc_ranks_since_mrca_bounds_with,
+        hstrat.calc_ranks_since_mrca_bounds_with_batched,
+        True,
+    ),
+    (
+        hstrat.calc_ranks_since_mrca_uncertainty_with,
+        hstrat.calc_ranks_since_mrca_uncertainty_with_batched,
+        True,
+    ),
+    (
+        hstrat.does_definitively_have_no_common_ancestor,
+        hstrat.does_definitively_have_no_common_ancestor_batched,
+        False,
+    ),
+    (
+        hstrat.does_have_any_common_ancestor,
+        hstrat.does_have_any_common_ancestor_batched,
+        True,
+    ),
+]
+
+
+def _make_population(retention_policy, differentia_width):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+    ]
+    for __ in range(12):
+        population.append(random.choice(population).Clone())
+        for individual in population:
+            if random.choice([True, False]):
+                individual.DepositStratum()
+    # include an unrelated column
+    population.append(
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+    )
+    return population
+
+
+@pytest.mark.parametrize(
+    "pairwise_function, batched_function, takes_confidence_level",
+    _batched_functions,
+)
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "confidence_level",
+    [0.49, 0.95, 0.99],
+)
+def test_pairwise_batched(
+    pairwise_function,
+    batched_function,
+    takes_confidence_level,
+    retention_policy,
+    differentia_width,
+    confidence_level,
+):
+    kwargs = (
+        {"confidence_level": confidence_level}
+        if takes_confidence_level
+        else {}
+    )
+    population = _make_population(retention_policy, differentia_width)
+    pairs = [*it.product(range(len(population)), repeat=2)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        actual = batched_function(population, pairs, **kwargs)
+        expected = np.array(
+            [
+                np.full(actual.shape[1:], np.nan) if result is None else result
+                for result in (
+                    pairwise_function(population[i], population[j], **kwargs)
+                    for i, j in pairs
+                )
+            ],
+            dtype=actual.dtype,
+        )
+    assert len(actual) == len(pairs)
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize(
+    "pairwise_function, batched_function, takes_confidence_level",
+    _batched_functions,
+)
+def test_pairwise_batched_empty(
+    pairwise_function, batched_function, takes_confidence_level
+):
+    population = _make_population(hstrat.perfect_resolution_algo.Policy(), 64)
+    reference = batched_function(population, [(0, 0)])
+    for pairs in [], np.empty((0, 2), dtype=int):
+        actual = batched_function(population, pairs)
+        assert actual.shape == (0, *reference.shape[1:])
+        assert actual.dtype == reference.dtype
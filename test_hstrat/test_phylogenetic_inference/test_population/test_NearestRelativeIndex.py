@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_population(retention_policy, differentia_width):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+    ]
+    for __ in range(40):
+        population.append(random.choice(population).Clone())
+        for individual in population:
+            individual.DepositStratum()
+    return population
+
+
+def _expected_ranks(query, candidates, num_relatives):
+    ranks = (
+        hstrat.calc_rank_of_last_retained_commonality_between(
+            query, candidate, confidence_level=0.49
+        )
+        for candidate in candidates
+    )
+    ranks = sorted((rank for rank in ranks if rank is not None), reverse=True)
+    return ranks[:num_relatives]
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "num_relatives",
+    [1, 3, 100],
+)
+def test_NearestRelativeIndex(retention_policy, num_relatives):
+    population = _make_population(retention_policy, 64)
+    indexed = population[::2]
+    queries = population[1::2]
+
+    index = hstrat.NearestRelativeIndex()
+    column_ids = [index.AddColumn(column) for column in indexed]
+    assert len(index) == len(indexed)
+    assert index.GetColumnIds() == column_ids
+
+    for query in queries:
+        relatives = index.GetNearestRelatives(query, num_relatives)
+        assert [rank for __, rank in relatives] == _expected_ranks(
+            query, indexed, num_relatives
+        )
+        for column_id, rank in relatives:
+            assert (
+                rank
+                == hstrat.calc_rank_of_last_retained_commonality_between(
+                    query,
+                    indexed[column_ids.index(column_id)],
+                    confidence_level=0.49,
+                )
+            )
+
+    # indexed columns are their own nearest relatives
+    for column_id, column in zip(column_ids, indexed):
+        assert index.GetNearestRelatives(column)[0] == (
+            column_id,
+            column.GetRankAtColumnIndex(column.GetNumStrataRetained() - 1),
+        )
+
+
+def test_NearestRelativeIndex_remove():
+    population = _make_population(hstrat.perfect_resolution_algo.Policy(), 64)
+
+    index = hstrat.NearestRelativeIndex()
+    column_ids = [index.AddColumn(column) for column in population]
+    removed = set(random.sample(column_ids, len(column_ids) // 2))
+    for column_id in removed:
+        index.RemoveColumn(column_id)
+    assert len(index) == len(population) - len(removed)
+    assert index.GetColumnIds() == [
+        column_id for column_id in column_ids if column_id not in removed
+    ]
+
+    remaining = [
+        column
+        for column_id, column in zip(column_ids, population)
+        if column_id not in removed
+    ]
+    for query in population:
+        relatives = index.GetNearestRelatives(query, 5)
+        assert all(column_id not in removed for column_id, __ in relatives)
+        assert [rank for __, rank in relatives] == _expected_ranks(
+            query, remaining, 5
+        )
+
+    # re-adding assigns fresh ids
+    new_id = index.AddColumn(population[0])
+    assert new_id == len(population)
+
+    for column_id in index.GetColumnIds():
+        index.RemoveColumn(column_id)
+    assert len(index) == 0
+    assert index.GetNearestRelatives(population[0]) == []
+
+
+def test_NearestRelativeIndex_unrelated():
+    index = hstrat.NearestRelativeIndex()
+    index.AddColumn(hstrat.HereditaryStratigraphicColumn())
+    query = hstrat.HereditaryStratigraphicColumnStripped(
+        hstrat.HereditaryStratigraphicColumn()
+    )
+    assert index.GetNearestRelatives(query) == []
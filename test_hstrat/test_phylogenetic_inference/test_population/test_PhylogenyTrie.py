@@ -0,0 +1,123 @@
+import itertools as it
+import random
+
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_population(retention_policy, differentia_width):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+    ]
+    for __ in range(40):
+        population.append(random.choice(population).Clone())
+        for individual in population:
+            individual.DepositStratum()
+    return population
+
+
+def _get_mrca_origin_times(phylogeny_df, num_columns):
+    ancestors = {
+        id_: (
+            None
+            if ancestor_list == "[none]"
+            else int(ancestor_list.strip("[]"))
+        )
+        for id_, ancestor_list in zip(
+            phylogeny_df["id"], phylogeny_df["ancestor_list"]
+        )
+    }
+    origin_times = dict(zip(phylogeny_df["id"], phylogeny_df["origin_time"]))
+
+    def iter_lineage(id_):
+        while id_ is not None:
+            yield id_
+            id_ = ancestors[id_]
+
+    res = {}
+    for i, j in it.combinations(range(num_columns), 2):
+        lineage = [*iter_lineage(i)]
+        mrca_id = next(
+            (id_ for id_ in iter_lineage(j) if id_ in lineage),
+            None,
+        )
+        res[i, j] = None if mrca_id is None else origin_times[mrca_id]
+    return res
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+def test_PhylogenyTrie(retention_policy, differentia_width):
+    population = _make_population(retention_policy, differentia_width)
+    random.shuffle(population)
+
+    trie = hstrat.PhylogenyTrie()
+    for i, column in enumerate(population):
+        assert trie.InsertColumn(column) == i
+    assert len(trie) == len(population)
+
+    phylogeny_df = trie.ToPhylogenyDataFrame()
+    expected_df = hstrat.build_tree(population)
+    assert len(phylogeny_df) == len(expected_df)
+    assert (
+        phylogeny_df["taxon_label"][: len(population)].tolist()
+        == expected_df["taxon_label"][: len(population)].tolist()
+    )
+    assert (
+        phylogeny_df["origin_time"][: len(population)].tolist()
+        == expected_df["origin_time"][: len(population)].tolist()
+    )
+    assert _get_mrca_origin_times(
+        phylogeny_df, len(population)
+    ) == _get_mrca_origin_times(expected_df, len(population))
+
+
+def test_PhylogenyTrie_incremental():
+    population = _make_population(hstrat.perfect_resolution_algo.Policy(), 64)
+    stripped = [
+        hstrat.HereditaryStratigraphicColumnStripped(column)
+        for column in population
+    ]
+
+    trie = hstrat.PhylogenyTrie()
+    for column in population[:20]:
+        trie.InsertColumn(column, taxon_label=f"early{len(trie)}")
+    assert len(trie.ToPhylogenyDataFrame()) < 2 * 20
+
+    for column in stripped[20:]:
+        trie.InsertColumn(column, taxon_label=f"late{len(trie)}")
+    phylogeny_df = trie.ToPhylogenyDataFrame()
+    assert phylogeny_df["taxon_label"][: len(population)].tolist() == [
+        f"early{i}" if i < 20 else f"late{i}" for i in range(len(population))
+    ]
+
+    fresh = hstrat.PhylogenyTrie()
+    for column in population:
+        fresh.InsertColumn(column)
+    assert _get_mrca_origin_times(
+        phylogeny_df, len(population)
+    ) == _get_mrca_origin_times(fresh.ToPhylogenyDataFrame(), len(population))
+
+
+def test_PhylogenyTrie_unrelated():
+    trie = hstrat.PhylogenyTrie()
+    assert len(trie.ToPhylogenyDataFrame()) == 0
+
+    trie.InsertColumn(hstrat.HereditaryStratigraphicColumn())
+    trie.InsertColumn(hstrat.HereditaryStratigraphicColumn())
+    phylogeny_df = trie.ToPhylogenyDataFrame()
+    assert phylogeny_df["ancestor_list"].tolist() == ["[none]", "[none]"]
@@ -0,0 +1,89 @@
+import functools
+import random
+import warnings
+
+import numpy as np
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_population(differentia_width):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=hstrat.fixed_resolution_algo.Policy(5),
+        )
+    ]
+    for __ in range(20):
+        population.append(random.choice(population).Clone())
+        for individual in population:
+            if random.choice([True, False]):
+                individual.DepositStratum()
+    return population
+
+
+@pytest.mark.parametrize(
+    "pairwise_function, result_shape",
+    [
+        (hstrat.calc_rank_of_mrca_bounds_between, (2,)),
+        (
+            functools.partial(
+                hstrat.calc_ranks_since_mrca_bounds_with,
+                confidence_level=0.99,
+            ),
+            (2,),
+        ),
+        (hstrat.does_have_any_common_ancestor, ()),
+        (hstrat.calc_rank_of_earliest_detectable_mrca_between, ()),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "tile_size, num_workers",
+    [(1, 1), (7, 1), (64, 1), (4, 2)],
+)
+def test_build_pairwise_matrix(
+    pairwise_function,
+    result_shape,
+    differentia_width,
+    tile_size,
+    num_workers,
+):
+    population = _make_population(differentia_width)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = np.array(
+            [
+                [
+                    np.full(result_shape, np.nan)
+                    if result is None
+                    else np.array(result, dtype=float)
+                    for result in (
+                        pairwise_function(first, second)
+                        for second in population
+                    )
+                ]
+                for first in population
+            ]
+        )
+        actual = hstrat.build_pairwise_matrix(
+            population,
+            pairwise_function,
+            result_shape=result_shape,
+            tile_size=tile_size,
+            num_workers=num_workers,
+        )
+    assert actual.shape == (len(population), len(population), *result_shape)
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_build_pairwise_matrix_empty():
+    assert hstrat.build_pairwise_matrix(
+        [],
+        hstrat.calc_rank_of_mrca_bounds_between,
+        result_shape=(2,),
+    ).shape == (0, 0, 2)
@@ -0,0 +1,116 @@
+import random
+import warnings
+
+import numpy as np
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_population(retention_policy, differentia_width, num_generations):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+        for __ in range(8)
+    ]
+    for __ in range(num_generations):
+        # advance generations asynchronously
+        random.shuffle(population)
+        for target in range(2):
+            population[target] = population[-1].Clone()
+        for individual in population:
+            if random.choice([True, False]):
+                individual.DepositStratum()
+    return population
+
+
+def _expected_matrix(population, confidence_level):
+    res = np.full((len(population), len(population), 2), np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i, first in enumerate(population):
+            for j, second in enumerate(population):
+                bounds = hstrat.calc_rank_of_mrca_bounds_between(
+                    first, second, confidence_level=confidence_level
+                )
+                if bounds is not None:
+                    res[i, j] = bounds
+    return res
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.nominal_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=10),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "confidence_level",
+    [0.49, 0.95, 0.99],
+)
+@pytest.mark.parametrize(
+    "num_generations",
+    [0, 10, 60],
+)
+def test_build_rank_of_mrca_bounds_matrix(
+    retention_policy, differentia_width, confidence_level, num_generations
+):
+    population = _make_population(
+        retention_policy, differentia_width, num_generations
+    )
+    expected = _expected_matrix(population, confidence_level)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for chunk_size in None, 1, 3:
+            actual = hstrat.build_rank_of_mrca_bounds_matrix(
+                population,
+                confidence_level=confidence_level,
+                chunk_size=chunk_size,
+            )
+            np.testing.assert_array_equal(actual, expected)
+
+        stripped = [
+            hstrat.HereditaryStratigraphicColumnStripped(column)
+            for column in population
+        ]
+        np.testing.assert_array_equal(
+            hstrat.build_rank_of_mrca_bounds_matrix(
+                stripped, confidence_level=confidence_level
+            ),
+            expected,
+        )
+
+
+def test_build_rank_of_mrca_bounds_matrix_processes():
+    population = _make_population(
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5), 8, 30
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        np.testing.assert_array_equal(
+            hstrat.build_rank_of_mrca_bounds_matrix(
+                population, chunk_size=3, num_processes=2
+            ),
+            _expected_matrix(population, 0.95),
+        )
+
+
+def test_build_rank_of_mrca_bounds_matrix_warns():
+    population = _make_population(
+        hstrat.perfect_resolution_algo.Policy(), 1, 3
+    )
+    with pytest.warns(UserWarning):
+        hstrat.build_rank_of_mrca_bounds_matrix(population)
+
+
+def test_build_rank_of_mrca_bounds_matrix_empty():
+    assert hstrat.build_rank_of_mrca_bounds_matrix([]).shape == (0, 0, 2)
@@ -0,0 +1,135 @@
+import itertools as it
+import random
+
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_population(retention_policy, differentia_width, synchronous):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+    ]
+    for __ in range(40):
+        population.append(random.choice(population).Clone())
+        for individual in population:
+            if synchronous or random.choice([True, False]):
+                individual.DepositStratum()
+    # include an unrelated column
+    unrelated = hstrat.HereditaryStratigraphicColumn(
+        stratum_differentia_bit_width=differentia_width,
+        stratum_retention_policy=retention_policy,
+    )
+    unrelated.DepositStrata(population[0].GetNumStrataDeposited() - 1)
+    return [*population, unrelated]
+
+
+def _get_ancestors(phylogeny_df):
+    return {
+        id_: (
+            None
+            if ancestor_list == "[none]"
+            else int(ancestor_list.strip("[]"))
+        )
+        for id_, ancestor_list in zip(
+            phylogeny_df["id"], phylogeny_df["ancestor_list"]
+        )
+    }
+
+
+def _iter_lineage(ancestors, id_):
+    while id_ is not None:
+        yield id_
+        id_ = ancestors[id_]
+
+
+def _check_well_formed(phylogeny_df, population, taxon_labels):
+    ancestors = _get_ancestors(phylogeny_df)
+    origin_times = dict(zip(phylogeny_df["id"], phylogeny_df["origin_time"]))
+    for i, column in enumerate(population):
+        assert phylogeny_df["taxon_label"][i] == taxon_labels[i]
+        assert origin_times[i] == column.GetNumStrataDeposited() - 1
+    for id_, ancestor_id in ancestors.items():
+        if id_ < len(population):
+            assert id_ not in ancestors.values()
+        else:
+            # inner nodes branch
+            assert [*ancestors.values()].count(id_) >= 2
+        if ancestor_id is not None:
+            assert origin_times[ancestor_id] <= origin_times[id_]
+            assert ancestor_id >= len(population)
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+def test_build_tree_synchronous(retention_policy):
+    population = _make_population(retention_policy, 64, synchronous=True)
+    phylogeny_df = hstrat.build_tree(population)
+    _check_well_formed(phylogeny_df, population, range(len(population)))
+
+    ancestors = _get_ancestors(phylogeny_df)
+    origin_times = dict(zip(phylogeny_df["id"], phylogeny_df["origin_time"]))
+    for i, j in it.combinations(range(len(population)), 2):
+        lineage = [*_iter_lineage(ancestors, i)]
+        mrca_id = next(
+            (id_ for id_ in _iter_lineage(ancestors, j) if id_ in lineage),
+            None,
+        )
+        expected = hstrat.calc_rank_of_last_retained_commonality_between(
+            population[i], population[j], confidence_level=0.49
+        )
+        if mrca_id is None:
+            assert expected is None
+        else:
+            assert origin_times[mrca_id] == expected
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+def test_build_tree_asynchronous(retention_policy, differentia_width):
+    population = _make_population(
+        retention_policy, differentia_width, synchronous=False
+    )
+    taxon_labels = [f"taxon{i}" for i in range(len(population))]
+    phylogeny_df = hstrat.build_tree(population, taxon_labels=taxon_labels)
+    _check_well_formed(phylogeny_df, population, taxon_labels)
+
+    stripped = [
+        hstrat.HereditaryStratigraphicColumnStripped(column)
+        for column in population
+    ]
+    assert phylogeny_df.equals(
+        hstrat.build_tree(stripped, taxon_labels=taxon_labels)
+    )
+
+
+def test_build_tree_trivial():
+    assert len(hstrat.build_tree([])) == 0
+
+    column = hstrat.HereditaryStratigraphicColumn()
+    phylogeny_df = hstrat.build_tree([column], taxon_labels=["a"])
+    assert phylogeny_df["ancestor_list"].tolist() == ["[none]"]
+    assert phylogeny_df["taxon_label"].tolist() == ["a"]
+
+    phylogeny_df = hstrat.build_tree([column, column.Clone()])
+    assert phylogeny_df["ancestor_list"].tolist() == ["[2]", "[2]", "[none]"]
+    assert phylogeny_df["origin_time"].tolist() == [0, 0, 0]
@@ -0,0 +1,111 @@
+import itertools as it
+import random
+import warnings
+
+import pytest
+
+from hstrat import hstrat
+
+
+def _make_population(retention_policy, differentia_width, synchronous):
+    population = [
+        hstrat.HereditaryStratigraphicColumn(
+            stratum_differentia_bit_width=differentia_width,
+            stratum_retention_policy=retention_policy,
+        )
+    ]
+    for __ in range(30):
+        population.append(random.choice(population).Clone())
+        for individual in population:
+            if synchronous or random.choice([True, False]):
+                individual.DepositStratum()
+    return population
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "differentia_width",
+    [1, 8, 64],
+)
+@pytest.mark.parametrize(
+    "confidence_level",
+    [0.49, 0.95, 0.99],
+)
+def test_calc_rank_of_mrca_bounds_among_pair(
+    retention_policy, differentia_width, confidence_level
+):
+    population = _make_population(
+        retention_policy, differentia_width, synchronous=False
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for first, second in it.product(population[:10], repeat=2):
+            assert hstrat.calc_rank_of_mrca_bounds_among(
+                [first, second], confidence_level=confidence_level
+            ) == hstrat.calc_rank_of_mrca_bounds_between(
+                first, second, confidence_level=confidence_level
+            )
+
+
+@pytest.mark.parametrize(
+    "retention_policy",
+    [
+        hstrat.perfect_resolution_algo.Policy(),
+        hstrat.fixed_resolution_algo.Policy(fixed_resolution=5),
+        hstrat.recency_proportional_resolution_algo.Policy(2),
+    ],
+)
+@pytest.mark.parametrize(
+    "subset_size",
+    [1, 3, 10, 31],
+)
+def test_calc_rank_of_mrca_bounds_among_subset(retention_policy, subset_size):
+    population = _make_population(retention_policy, 64, synchronous=True)
+    for __ in range(10):
+        subset = random.sample(population, subset_size)
+        pairwise_bounds = [
+            hstrat.calc_rank_of_mrca_bounds_between(first, second)
+            for first, second in it.product(subset, repeat=2)
+        ]
+        assert hstrat.calc_rank_of_mrca_bounds_among(subset) == (
+            min(lower for lower, __ in pairwise_bounds),
+            min(upper for __, upper in pairwise_bounds),
+        )
+        stripped = [
+            hstrat.HereditaryStratigraphicColumnStripped(column)
+            for column in subset
+        ]
+        assert hstrat.calc_rank_of_mrca_bounds_among(
+            stripped
+        ) == hstrat.calc_rank_of_mrca_bounds_among(subset)
+
+
+def test_calc_rank_of_mrca_bounds_among_unrelated():
+    population = _make_population(
+        hstrat.perfect_resolution_algo.Policy(), 64, synchronous=True
+    )
+    unrelated = hstrat.HereditaryStratigraphicColumn()
+    unrelated.DepositStrata(population[0].GetNumStrataDeposited() - 1)
+    assert (
+        hstrat.calc_rank_of_mrca_bounds_among([*population, unrelated]) is None
+    )
+
+    with pytest.warns(UserWarning):
+        assert (
+            hstrat.calc_rank_of_mrca_bounds_among(
+                [
+                    hstrat.HereditaryStratigraphicColumn(
+                        stratum_differentia_bit_width=1
+                    )
+                    for __ in range(3)
+                ]
+            )
+            is None
+        )